@@ -0,0 +1,109 @@
+"""
+Prediction endpoint latency and throughput under concurrent clients.
+
+Each concurrency level runs that many clients in a loop, each sending its next request as soon as
+the previous one returns, until --requests requests are done. Payloads are synthetic rows, either
+as JSON to /predict/json or as a CSV upload to /predict.
+
+With --url the requests go over HTTP to a running server (e.g. `uvicorn app:app --workers 4`),
+which is what to compare over time. Without it, app.py is loaded in-process and called through
+httpx's ASGI transport: no network, and the clients share the server's event loop and CPU, so it
+measures the app's own overhead (validation, micro-batching, prediction, rendering) only. The
+in-process app serves the model in final_models/.
+
+    python -m benchmarks.bench_endpoint --concurrency 1 8 32 --rows-per-request 1 32
+"""
+import sys
+import time
+import asyncio
+import argparse
+import contextlib
+
+import httpx
+
+from networksecurity.constants.training_pipeline import TARGET_COLUMN
+from benchmarks.common import save_results, print_table, latency_summary
+from benchmarks.synthetic_data import SyntheticPhishingData, parse_rows
+
+
+def build_payloads(endpoint: str, rows_per_request: int, n_payloads: int, seed: int) -> list:
+    features = SyntheticPhishingData(seed=seed).generate(rows_per_request * n_payloads).drop(columns=[TARGET_COLUMN])
+    payloads = []
+    for start in range(0, len(features), rows_per_request):
+        chunk = features.iloc[start:start + rows_per_request]
+        if endpoint == "/predict":
+            payloads.append({"files": {"file": ("features.csv", chunk.to_csv(index=False).encode(), "text/csv")}})
+        else:
+            payloads.append({"json": {"columns": list(chunk.columns), "rows": chunk.to_numpy().tolist()}})
+    return payloads
+
+
+async def run_level(client: httpx.AsyncClient, endpoint: str, payloads: list, concurrency: int, n_requests: int) -> dict:
+    latencies, status_codes = [], {}
+    next_request = 0
+
+    async def worker():
+        nonlocal next_request
+        while next_request < n_requests:
+            payload = payloads[next_request % len(payloads)]
+            next_request += 1
+            started = time.perf_counter()
+            response = await client.post(endpoint, **payload)
+            latencies.append(time.perf_counter() - started)
+            status_codes[response.status_code] = status_codes.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall_seconds = time.perf_counter() - started
+    return {
+        **latency_summary(latencies),
+        "requests_per_second": len(latencies) / wall_seconds,
+        "errors": sum(count for status_code, count in status_codes.items() if status_code >= 400),
+        "status_codes": {str(status_code): count for status_code, count in sorted(status_codes.items())},
+    }
+
+
+async def main(args) -> list:
+    results = []
+    async with contextlib.AsyncExitStack() as stack:
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        else:
+            import app as app_module
+
+            # the ASGI transport sends no lifespan events, so startup and shutdown run here
+            await stack.enter_async_context(app_module.app.router.lifespan_context(app_module.app))
+            client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app_module.app), base_url="http://benchmark", timeout=args.timeout)
+        await stack.enter_async_context(client)
+
+        for rows_per_request in args.rows_per_request:
+            payloads = build_payloads(args.endpoint, rows_per_request, args.distinct_payloads, args.seed)
+            await run_level(client, args.endpoint, payloads, 1, min(10, args.requests))
+            for concurrency in args.concurrency:
+                result = {
+                    "endpoint": args.endpoint, "rows_per_request": rows_per_request, "concurrency": concurrency,
+                    **await run_level(client, args.endpoint, payloads, concurrency, args.requests),
+                }
+                result["rows_per_second"] = result["requests_per_second"] * rows_per_request
+                results.append(result)
+                print(f"{rows_per_request} rows x {concurrency} clients: {result['requests_per_second']:.1f} req/s, p99 {result['p99_ms']:.1f} ms", file=sys.stderr)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the prediction endpoints under concurrency.")
+    parser.add_argument("--url", help="base URL of a running server; the app runs in-process without it")
+    parser.add_argument("--endpoint", choices=["/predict/json", "/predict"], default="/predict/json")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--rows-per-request", type=parse_rows, nargs="+", default=[1, 32])
+    parser.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    parser.add_argument("--distinct-payloads", type=int, default=200, help="payloads cycled through; repeats hit the prediction cache")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args))
+    print_table(results, ["endpoint", "rows_per_request", "concurrency", "requests_per_second", "p50_ms", "p99_ms", "errors"])
+    if not args.no_save:
+        save_results("endpoint", results, vars(args))
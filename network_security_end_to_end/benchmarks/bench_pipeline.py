@@ -0,0 +1,140 @@
+"""
+Times every TrainingPipeline stage on synthetic data at one or more scales.
+
+For each scale, synthetic rows are written to a CSV, loaded into MongoDB through
+push_data.NetworkDataExtract, and the stages run one after another in a fresh working directory,
+so nothing from final_models/ or an earlier run (stage cache, ingestion cache, warm start) is
+reused. Results include the pipeline profiler's per-stage and per-step wall time, CPU time, peak
+RSS and row counts.
+
+MongoDB comes from --mongodb-url (or MONGODB_URL); without one, mongomock stands in, which is fine
+for comparing the other stages but makes ingestion timings meaningless.
+
+    python -m benchmarks.bench_pipeline --rows 10k 100k 1m --set MODEL_TRAINER_SEARCH_STRATEGY=halving_random
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+
+import yaml
+
+from networksecurity.constants import training_pipeline
+from networksecurity.constants.training_pipeline import SCHEMA_FILE_PATH, MONGODB_URL_ENV_KEY
+from benchmarks.common import save_results, print_table
+from benchmarks.synthetic_data import SyntheticPhishingData, parse_rows
+
+STAGES = ("data_ingestion", "data_validation", "data_transformation", "model_trainer")
+
+
+def parse_override(value: str):
+    name, _, raw_value = value.partition("=")
+    if not hasattr(training_pipeline, name):
+        raise argparse.ArgumentTypeError(f"Unknown pipeline constant: {name}")
+    return name, yaml.safe_load(raw_value)
+
+
+@contextlib.contextmanager
+def mongodb(mongodb_url: str):
+    """Points the shared MongoDB client at mongodb_url, or at an in-memory mongomock server."""
+    from networksecurity.data_access.mongo_connection import mongo_connection
+
+    mongo_connection.close()
+    if mongodb_url:
+        mongo_connection.uri = mongodb_url
+        yield "mongodb"
+    else:
+        import mongomock
+
+        mongo_connection.uri = "mongodb://localhost:27017"
+        with mongomock.patch(servers=(("localhost", 27017),)):
+            yield "mongomock"
+    mongo_connection.close()
+
+
+def run_scale(n_rows: int, stages: tuple, seed: int, mongodb_url: str, root_dir: str, project_dir: str) -> dict:
+    from push_data import NetworkDataExtract
+    from networksecurity.data_access.mongo_connection import mongo_connection
+    from networksecurity.pipeline.training_pipeline import TrainingPipeline
+    from networksecurity.utils.main_utils.profiler import pipeline_profiler
+
+    work_dir = os.path.join(root_dir, f"rows_{n_rows}")
+    os.makedirs(work_dir, exist_ok=True)
+    shutil.copytree(os.path.join(project_dir, os.path.dirname(SCHEMA_FILE_PATH)), os.path.join(work_dir, os.path.dirname(SCHEMA_FILE_PATH)), dirs_exist_ok=True)
+    os.chdir(work_dir)
+
+    result = {"rows": n_rows}
+    started = time.perf_counter()
+    data_file_path = SyntheticPhishingData(reference_file_path=os.path.join(project_dir, "network_data", "phisingData.csv"), seed=seed) \
+        .write_csv(os.path.join("network_data", "synthetic.csv"), n_rows)
+    result["generate_seconds"] = time.perf_counter() - started
+
+    with mongodb(mongodb_url) as backend:
+        result["mongodb"] = backend
+        collection = mongo_connection.get_collection(training_pipeline.DATA_INGESTION_DATABASE_NAME, training_pipeline.DATA_INGESTION_COLLECTION_NAME)
+        collection.drop()
+        started = time.perf_counter()
+        NetworkDataExtract().load_csv_to_mongodb(
+            data_file_path, training_pipeline.DATA_INGESTION_DATABASE_NAME, training_pipeline.DATA_INGESTION_COLLECTION_NAME,
+        )
+        result["mongodb_load_seconds"] = time.perf_counter() - started
+
+        pipeline = TrainingPipeline()
+        pipeline.stage_cache.enabled = False
+        pipeline_profiler.reset()
+        artifact = None
+        for stage in stages:
+            started = time.perf_counter()
+            if stage == "data_ingestion":
+                artifact = pipeline.start_data_ingestion()
+            elif stage == "data_validation":
+                artifact = pipeline.start_data_validation(data_ingestion_artifact=artifact)
+            elif stage == "data_transformation":
+                artifact = pipeline.start_data_transformation(data_validation_artifact=artifact)
+            elif stage == "model_trainer":
+                artifact = pipeline.start_model_trainer(data_transformation_artifact=artifact)
+            result[f"{stage}_seconds"] = time.perf_counter() - started
+            result[f"{stage}_rows_per_second"] = n_rows / result[f"{stage}_seconds"]
+        collection.drop()
+
+    result["profile"] = pipeline_profiler.to_report()
+    os.chdir(project_dir)
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the training pipeline stages on synthetic data.")
+    parser.add_argument("--rows", type=parse_rows, nargs="+", default=[10_000, 100_000], help="scales to run, e.g. 10k 100k 1m 10m")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES),
+                        help="stages to run, in pipeline order; each needs the ones before it")
+    parser.add_argument("--set", dest="overrides", type=parse_override, action="append", default=[],
+                        help="override a pipeline constant, e.g. MODEL_TRAINER_SEARCH_STRATEGY=halving_random")
+    parser.add_argument("--mongodb-url", default=os.getenv(MONGODB_URL_ENV_KEY))
+    parser.add_argument("--work-dir", help="where runs write their artifacts (default: a temporary directory)")
+    parser.add_argument("--keep-artifacts", action="store_true")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    stages = tuple(stage for stage in STAGES if stage in args.stages)
+    if stages != STAGES[:len(stages)]:
+        parser.error(f"--stages must be a prefix of {list(STAGES)}")
+    for name, value in args.overrides:
+        setattr(training_pipeline, name, value)
+
+    project_dir = os.getcwd()
+    root_dir = args.work_dir or tempfile.mkdtemp(prefix="pipeline_benchmark_")
+    try:
+        results = [run_scale(n_rows, stages, args.seed, args.mongodb_url, root_dir, project_dir) for n_rows in args.rows]
+    finally:
+        os.chdir(project_dir)
+        if not args.keep_artifacts and not args.work_dir:
+            shutil.rmtree(root_dir, ignore_errors=True)
+
+    print_table(results, ["rows", "mongodb_load_seconds"] + [f"{stage}_seconds" for stage in stages])
+    if not args.no_save:
+        arguments = {**vars(args), "overrides": dict(args.overrides), "mongodb_url": "set" if args.mongodb_url else None}
+        save_results("pipeline", results, arguments)
@@ -0,0 +1,125 @@
+"""
+NetworkModel.predict latency and throughput per batch size, inference backend and prediction cache.
+
+The model is the deployed one (--model-dir, the model bundle or the preprocessor/model pickles),
+or, with --train-rows, a RandomForestClassifier fitted on synthetic data behind the pipeline's
+imputer. Query batches are sampled from a pool of synthetic rows, so with the cache on, the hit
+rate depends on --pool-rows the way it depends on how often real traffic repeats rows.
+
+Each configuration is warmed up with a fifth of its calls before it is timed; with the cache on,
+the warm-up also starts filling the cache, and the reported hit rate is the one of the timed calls.
+
+    python -m benchmarks.bench_predict --batch-sizes 1 32 512 4096 --backends sklearn compiled --cache off on
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from networksecurity.constants.training_pipeline import (
+    TARGET_COLUMN, DATA_TRANSFORMATION_IMPUTER_PARAMS, FINAL_MODEL_DIR, MODEL_BUNDLE_FILE_NAME,
+    PREPROCESSING_OBJECT_FILE_NAME, MODEL_FILE_NAME,
+)
+from benchmarks.common import save_results, print_table, latency_summary
+from benchmarks.synthetic_data import SyntheticPhishingData, parse_rows
+
+
+def load_model(model_dir: str):
+    from networksecurity.utils.main_utils.utils import load_object
+    from networksecurity.utils.main_utils.model_bundle import load_model_bundle
+    from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+
+    bundle_file_path = os.path.join(model_dir, MODEL_BUNDLE_FILE_NAME)
+    if os.path.exists(bundle_file_path):
+        return load_model_bundle(bundle_file_path)
+    return NetworkModel(
+        preprocessor=load_object(os.path.join(model_dir, PREPROCESSING_OBJECT_FILE_NAME)),
+        model=load_object(os.path.join(model_dir, MODEL_FILE_NAME)),
+    )
+
+
+def train_model(data: SyntheticPhishingData, n_rows: int, n_estimators: int):
+    from sklearn.pipeline import Pipeline
+    from sklearn.ensemble import RandomForestClassifier
+    from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+    from networksecurity.utils.ml_utils.preprocessing.imputer import NeighborIndexImputer
+
+    train = data.generate(n_rows)
+    x_train, y_train = train.drop(columns=[TARGET_COLUMN]), train[TARGET_COLUMN].replace(-1, 0)
+    preprocessor = Pipeline(steps=[("imputer", NeighborIndexImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS))]).fit(x_train)
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=0).fit(preprocessor.transform(x_train), y_train)
+    return NetworkModel(preprocessor=preprocessor, model=model)
+
+
+def time_batches(predict, pool, batch_size: int, n_calls: int, rng) -> list:
+    starts = rng.integers(0, max(len(pool) - batch_size, 0) + 1, size=n_calls)
+    seconds = []
+    for start in starts:
+        batch = pool.iloc[start:start + batch_size]
+        started = time.perf_counter()
+        predict(batch)
+        seconds.append(time.perf_counter() - started)
+    return seconds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark NetworkModel.predict at different batch sizes.")
+    parser.add_argument("--batch-sizes", type=parse_rows, nargs="+", default=[1, 8, 32, 128, 512, 4096, 32768])
+    parser.add_argument("--backends", nargs="+", choices=["sklearn", "compiled"], default=["sklearn", "compiled"])
+    parser.add_argument("--cache", nargs="+", choices=["off", "on"], default=["off", "on"])
+    parser.add_argument("--model-dir", default=FINAL_MODEL_DIR, help="deployed model to benchmark, unless --train-rows is given")
+    parser.add_argument("--train-rows", type=parse_rows, help="fit a RandomForestClassifier on this many synthetic rows instead")
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--pool-rows", type=parse_rows, default=100_000, help="distinct synthetic rows the batches are sampled from")
+    parser.add_argument("--null-ratio", type=float, default=0.0, help="share of feature values set to NaN, to exercise the imputer")
+    parser.add_argument("--rows-per-config", type=parse_rows, default=200_000, help="rows predicted per configuration")
+    parser.add_argument("--min-calls", type=int, default=20)
+    parser.add_argument("--max-calls", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args()
+
+    from networksecurity.serving.prediction_cache import PredictionCache
+
+    data = SyntheticPhishingData(seed=args.seed)
+    network_model = train_model(data, args.train_rows, args.n_estimators) if args.train_rows else load_model(args.model_dir)
+    # a different seed than training, so queries are not the training rows
+    pool = SyntheticPhishingData(seed=args.seed + 1).generate(args.pool_rows, null_ratio=args.null_ratio).drop(columns=[TARGET_COLUMN])
+    rng = np.random.default_rng(args.seed)
+
+    results = []
+    for backend in args.backends:
+        try:
+            network_model.set_backend(backend)
+        except Exception as e:
+            print(f"Skipping the {backend} backend: {e}", file=sys.stderr)
+            continue
+        # every batch size in this benchmark is one predict call, whatever the backend's row limit
+        network_model.compiled_max_rows = max(args.batch_sizes)
+        for cache_mode in args.cache:
+            prediction_cache = PredictionCache() if cache_mode == "on" else None
+            if prediction_cache is not None:
+                prediction_cache.invalidate(1)
+                predict = lambda batch: prediction_cache.predict(network_model, batch, 1)
+            else:
+                predict = network_model.predict
+
+            for batch_size in args.batch_sizes:
+                n_calls = min(max(args.min_calls, args.rows_per_config // batch_size), args.max_calls)
+                time_batches(predict, pool, batch_size, max(1, n_calls // 5), rng)
+                if prediction_cache is not None:
+                    hits, misses = prediction_cache.hits, prediction_cache.misses
+                seconds = time_batches(predict, pool, batch_size, n_calls, rng)
+                result = {"backend": backend, "cache": cache_mode, "batch_size": batch_size, **latency_summary(seconds, batch_size)}
+                if prediction_cache is not None:
+                    lookups = prediction_cache.hits - hits + prediction_cache.misses - misses
+                    result["cache_hit_rate"] = (prediction_cache.hits - hits) / lookups if lookups else 0.0
+                results.append(result)
+                print(f"{backend}, cache {cache_mode}, batch {batch_size}: p50 {result['p50_ms']:.3f} ms", file=sys.stderr)
+
+    print()
+    print_table(results, ["backend", "cache", "batch_size", "p50_ms", "p99_ms", "rows_per_second", "cache_hit_rate"])
+    if not args.no_save:
+        save_results("predict", results, vars(args))
@@ -0,0 +1,79 @@
+import os
+import sys
+import json
+import platform
+import subprocess
+from datetime import datetime
+
+import numpy as np
+
+BENCHMARK_RESULTS_DIR: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def environment_info() -> dict:
+    """What a result depends on besides the code: interpreter, libraries, hardware and commit."""
+    import pandas
+    import sklearn
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except Exception:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pandas.__version__,
+        "sklearn": sklearn.__version__,
+    }
+
+
+def latency_summary(seconds: list, rows_per_call: int = None) -> dict:
+    seconds = np.asarray(seconds, dtype=np.float64)
+    summary = {
+        "calls": int(len(seconds)),
+        "mean_ms": float(seconds.mean() * 1000),
+        "p50_ms": float(np.percentile(seconds, 50) * 1000),
+        "p95_ms": float(np.percentile(seconds, 95) * 1000),
+        "p99_ms": float(np.percentile(seconds, 99) * 1000),
+        "max_ms": float(seconds.max() * 1000),
+    }
+    if rows_per_call:
+        summary["rows_per_second"] = float(rows_per_call * len(seconds) / seconds.sum())
+    return summary
+
+
+def save_results(benchmark_name: str, results: dict, arguments: dict, results_dir: str = BENCHMARK_RESULTS_DIR) -> str:
+    """Writes results/<benchmark_name>/<timestamp>.json; compare two of them with benchmarks.compare."""
+    started_at = datetime.now()
+    file_path = os.path.join(results_dir, benchmark_name, f"{started_at.strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open(file_path, "w") as file_obj:
+        json.dump({
+            "benchmark": benchmark_name,
+            "created_at": started_at.isoformat(timespec="seconds"),
+            "arguments": arguments,
+            "environment": environment_info(),
+            "results": results,
+        }, file_obj, indent=2, default=str)
+    print(f"Results written to {file_path}", file=sys.stderr)
+    return file_path
+
+
+def print_table(rows: list, columns: list):
+    widths = [max(len(column), *(len(format_cell(row.get(column))) for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(format_cell(row.get(column)).ljust(width) for column, width in zip(columns, widths)))
+
+
+def format_cell(value) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}" if abs(value) < 1e4 else f"{value:,.0f}"
+    return "" if value is None else str(value)
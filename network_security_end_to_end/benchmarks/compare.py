@@ -0,0 +1,99 @@
+"""
+Compares two saved benchmark runs, row by row.
+
+Rows are matched on their configuration (rows, backend, cache, batch size, concurrency...),
+and every numeric metric is shown with its relative change. Without file arguments, the two most
+recent runs of --benchmark are compared.
+
+    python -m benchmarks.compare --benchmark predict
+    python -m benchmarks.compare benchmarks/results/pipeline/20261018_101500.json benchmarks/results/pipeline/20261019_093000.json
+"""
+import os
+import sys
+import json
+import glob
+import argparse
+
+from benchmarks.common import BENCHMARK_RESULTS_DIR, print_table
+
+KEY_FIELDS = ("rows", "endpoint", "backend", "cache", "batch_size", "rows_per_request", "concurrency")
+# lower is better for these; for rates (rows/requests per second, hit rate) higher is better
+LOWER_IS_BETTER_SUFFIXES = ("_seconds", "_ms", "errors")
+
+
+def load_run(file_path: str) -> dict:
+    with open(file_path) as file_obj:
+        return json.load(file_obj)
+
+
+def flatten(row: dict, prefix: str = "") -> dict:
+    # nested results (e.g. the pipeline profile) become "profile.data_ingestion.wall_seconds"
+    flat = {}
+    for name, value in row.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{name}."))
+        else:
+            flat[f"{prefix}{name}"] = value
+    return flat
+
+
+def row_key(row: dict) -> tuple:
+    return tuple((field, row[field]) for field in KEY_FIELDS if field in row)
+
+
+def compare_runs(base: dict, current: dict, min_change: float = 0.0) -> list:
+    base_rows = {row_key(row): flatten(row) for row in base["results"]}
+    comparison = []
+    for row in current["results"]:
+        key = row_key(row)
+        base_row = base_rows.get(key)
+        if base_row is None:
+            continue
+        row = flatten(row)
+        for metric, value in row.items():
+            base_value = base_row.get(metric)
+            if metric in KEY_FIELDS or isinstance(value, bool) or not isinstance(value, (int, float)) or not isinstance(base_value, (int, float)):
+                continue
+            change = (value - base_value) / base_value if base_value else None
+            if change is not None and abs(change) < min_change:
+                continue
+            improved = None
+            if change:
+                improved = (change < 0) == metric.endswith(LOWER_IS_BETTER_SUFFIXES)
+            comparison.append({
+                "config": ", ".join(f"{field}={field_value}" for field, field_value in key),
+                "metric": metric,
+                "base": base_value,
+                "current": value,
+                "change": f"{change:+.1%}" if change is not None else "",
+                "verdict": {True: "better", False: "worse", None: ""}[improved],
+            })
+    return comparison
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("files", nargs="*", help="base and current result files")
+    parser.add_argument("--benchmark", choices=["pipeline", "predict", "endpoint"], help="compare the two latest runs of this benchmark")
+    parser.add_argument("--min-change", type=float, default=0.05, help="hide metrics that moved less than this fraction")
+    args = parser.parse_args()
+
+    if args.files:
+        if len(args.files) != 2:
+            parser.error("pass exactly two result files: base and current")
+        base_file_path, current_file_path = args.files
+    elif args.benchmark:
+        runs = sorted(glob.glob(os.path.join(BENCHMARK_RESULTS_DIR, args.benchmark, "*.json")))
+        if len(runs) < 2:
+            parser.error(f"need two saved {args.benchmark} runs, found {len(runs)}")
+        base_file_path, current_file_path = runs[-2:]
+    else:
+        parser.error("pass two result files or --benchmark")
+
+    base, current = load_run(base_file_path), load_run(current_file_path)
+    print(f"base:    {base_file_path} (commit {base['environment'].get('commit')}, {base['created_at']})")
+    print(f"current: {current_file_path} (commit {current['environment'].get('commit')}, {current['created_at']})")
+    for field in ("cpu_count", "processor", "numpy", "sklearn"):
+        if base["environment"].get(field) != current["environment"].get(field):
+            print(f"warning: {field} differs ({base['environment'].get(field)} vs {current['environment'].get(field)})", file=sys.stderr)
+    print_table(compare_runs(base, current, args.min_change), ["config", "metric", "base", "current", "change", "verdict"])
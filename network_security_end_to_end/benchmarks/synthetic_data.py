@@ -0,0 +1,117 @@
+"""
+Synthetic phishing data that conforms to data-schema/schema.yaml, at any scale.
+
+Every feature takes one of its schema allowed_values, drawn with the value frequencies of
+network_data/phisingData.csv when that file is available (uniformly otherwise). Result is drawn
+from a logistic model over the features, weighted by each feature's correlation with Result in
+the reference data, so the generated labels are learnable. Rows are generated in chunks with a
+seed per chunk, so a given (seed, n_rows, chunk_rows) always produces the same data.
+
+    python -m benchmarks.synthetic_data --rows 1000000 --output network_data/synthetic_1m.csv
+"""
+import os
+import sys
+import argparse
+import numpy as np
+import pandas as pd
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.constants.training_pipeline import TARGET_COLUMN, SCHEMA_FILE_PATH
+from networksecurity.utils.main_utils.utils import read_yaml_file
+from networksecurity.utils.main_utils.schema_validator import get_column_rules
+from networksecurity.utils.main_utils.artifact_storage import get_schema_dtypes
+
+REFERENCE_DATA_FILE_PATH: str = os.path.join("network_data", "phisingData.csv")
+DEFAULT_CHUNK_ROWS: int = 1_000_000
+
+
+class SyntheticPhishingData:
+    def __init__(self, schema_file_path: str = SCHEMA_FILE_PATH, reference_file_path: str = REFERENCE_DATA_FILE_PATH, seed: int = 42):
+        try:
+            schema_config = read_yaml_file(schema_file_path)
+            column_rules = get_column_rules(schema_config)
+            self.column_dtypes = get_schema_dtypes(schema_file_path)
+            self.feature_columns = [column for column in schema_config["COLUMNS"] if column != TARGET_COLUMN]
+            self.seed = seed
+
+            missing_rules = [column for column in schema_config["COLUMNS"] if not column_rules[column]["allowed_values"]]
+            if missing_rules:
+                raise Exception(f"Synthetic data needs allowed_values in the schema for every column, missing for {missing_rules}")
+            self.values = {column: np.array(sorted(column_rules[column]["allowed_values"])) for column in schema_config["COLUMNS"]}
+
+            reference = pd.read_csv(reference_file_path) if reference_file_path and os.path.exists(reference_file_path) else None
+            self.probabilities = {}
+            for column in self.feature_columns:
+                if reference is not None and column in reference.columns:
+                    counts = reference[column].value_counts().reindex(self.values[column], fill_value=0).to_numpy(dtype=np.float64)
+                    # every allowed value keeps some mass, so the generated data covers the whole domain
+                    counts += 1.0
+                    self.probabilities[column] = counts / counts.sum()
+                else:
+                    self.probabilities[column] = np.full(len(self.values[column]), 1.0 / len(self.values[column]))
+
+            if reference is not None and TARGET_COLUMN in reference.columns:
+                correlations = reference[self.feature_columns].corrwith(reference[TARGET_COLUMN]).fillna(0.0)
+                self.weights = correlations.to_numpy(dtype=np.float64) * 4.0
+            else:
+                self.weights = np.random.default_rng(seed).normal(0.0, 0.5, len(self.feature_columns))
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def generate_chunk(self, n_rows: int, chunk_index: int = 0, null_ratio: float = 0.0) -> pd.DataFrame:
+        """
+        One chunk of rows in the schema column order and dtypes. With null_ratio > 0, that share of
+        feature values is set to NaN (the features become float64), for exercising the imputer.
+        """
+        try:
+            rng = np.random.default_rng([self.seed, chunk_index])
+            features = {
+                column: rng.choice(self.values[column], size=n_rows, p=self.probabilities[column]).astype(self.column_dtypes[column])
+                for column in self.feature_columns
+            }
+            logits = sum(weight * features[column] for weight, column in zip(self.weights, self.feature_columns))
+            target_values = self.values[TARGET_COLUMN]
+            target = np.where(rng.random(n_rows) < 1.0 / (1.0 + np.exp(-logits)), target_values.max(), target_values.min())
+
+            dataframe = pd.DataFrame(features)
+            if null_ratio > 0:
+                dataframe = dataframe.astype(np.float64).mask(rng.random(dataframe.shape) < null_ratio)
+            dataframe[TARGET_COLUMN] = target.astype(self.column_dtypes[TARGET_COLUMN])
+            return dataframe
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def iter_chunks(self, n_rows: int, chunk_rows: int = DEFAULT_CHUNK_ROWS, null_ratio: float = 0.0):
+        for chunk_index, start in enumerate(range(0, n_rows, chunk_rows)):
+            yield self.generate_chunk(min(chunk_rows, n_rows - start), chunk_index, null_ratio)
+
+    def generate(self, n_rows: int, chunk_rows: int = DEFAULT_CHUNK_ROWS, null_ratio: float = 0.0) -> pd.DataFrame:
+        return pd.concat(self.iter_chunks(n_rows, chunk_rows, null_ratio), ignore_index=True)
+
+    def write_csv(self, file_path: str, n_rows: int, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> str:
+        """Writes the rows chunk by chunk, so 10M rows never sit in memory at once."""
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            for chunk_index, chunk in enumerate(self.iter_chunks(n_rows, chunk_rows)):
+                chunk.to_csv(file_path, mode="w" if chunk_index == 0 else "a", header=chunk_index == 0, index=False)
+            return file_path
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+def parse_rows(value: str) -> int:
+    """Accepts 10000, 10_000, 10k or 10M."""
+    value = value.strip().lower().replace("_", "")
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    return int(float(value[:-1] if multiplier > 1 else value) * multiplier)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate synthetic phishing data conforming to schema.yaml.")
+    parser.add_argument("--rows", type=parse_rows, default=10_000)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-rows", type=parse_rows, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+    SyntheticPhishingData(seed=args.seed).write_csv(args.output, args.rows, args.chunk_rows)
+    print(f"Wrote {args.rows} rows to {args.output}")
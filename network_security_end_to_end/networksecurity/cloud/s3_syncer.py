@@ -1,41 +1,275 @@
 import os
 import sys
+import json
+import hashlib
+import threading
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
 from networksecurity.logging.logger import logging
 from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.constants.training_pipeline import (
+    S3_SYNC_MANIFEST_FILE_NAME, S3_SYNC_MAX_WORKERS, S3_SYNC_MULTIPART_THRESHOLD,
+    S3_SYNC_MULTIPART_CHUNKSIZE, S3_SYNC_MULTIPART_MAX_CONCURRENCY
+)
+
+HASH_BLOCK_SIZE: int = 1024 * 1024
+
+
+def parse_bucket_url(aws_bucket_url: str):
+    if not aws_bucket_url.startswith("s3://"):
+        raise Exception(f"Expected an s3:// url, got '{aws_bucket_url}'")
+    bucket, _, prefix = aws_bucket_url[len("s3://"):].partition("/")
+    return bucket, prefix.strip("/")
+
+
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file_obj:
+        for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class S3Backend:
+    """Talks to S3 through boto3; multipart uploads and downloads are split across threads by TransferConfig."""
+
+    def __init__(self, multipart_threshold: int = S3_SYNC_MULTIPART_THRESHOLD,
+                 multipart_chunksize: int = S3_SYNC_MULTIPART_CHUNKSIZE,
+                 max_concurrency: int = S3_SYNC_MULTIPART_MAX_CONCURRENCY):
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+
+        self.client = boto3.client("s3")
+        self.transfer_config = TransferConfig(
+            multipart_threshold=multipart_threshold,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=True,
+        )
+
+    def list_objects(self, bucket: str, prefix: str) -> dict:
+        objects = {}
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=f"{prefix}/" if prefix else ""):
+            for item in page.get("Contents", []):
+                objects[item["Key"]] = item["Size"]
+        return objects
+
+    def read_bytes(self, bucket: str, key: str):
+        try:
+            return self.client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        except self.client.exceptions.NoSuchKey:
+            return None
+
+    def write_bytes(self, bucket: str, key: str, data: bytes):
+        self.client.put_object(Bucket=bucket, Key=key, Body=data)
+
+    def upload_file(self, file_path: str, bucket: str, key: str, callback=None):
+        self.client.upload_file(file_path, bucket, key, Config=self.transfer_config, Callback=callback)
+
+    def download_file(self, bucket: str, key: str, file_path: str, callback=None):
+        self.client.download_file(bucket, key, file_path, Config=self.transfer_config, Callback=callback)
+
+
+class LocalFileSystemBackend:
+    """Stand-in for S3 that keeps buckets as directories under root_dir, for local runs and tests."""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def _path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root_dir, bucket, *key.split("/"))
+
+    def list_objects(self, bucket: str, prefix: str) -> dict:
+        objects = {}
+        base_dir = self._path(bucket, prefix) if prefix else os.path.join(self.root_dir, bucket)
+        for dir_path, _, file_names in os.walk(base_dir):
+            for file_name in file_names:
+                file_path = os.path.join(dir_path, file_name)
+                key = os.path.relpath(file_path, os.path.join(self.root_dir, bucket)).replace(os.sep, "/")
+                objects[key] = os.path.getsize(file_path)
+        return objects
+
+    def read_bytes(self, bucket: str, key: str):
+        path = self._path(bucket, key)
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as file_obj:
+            return file_obj.read()
+
+    def write_bytes(self, bucket: str, key: str, data: bytes):
+        path = self._path(bucket, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file_obj:
+            file_obj.write(data)
+
+    def _copy(self, source_path: str, target_path: str, callback=None):
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with open(source_path, "rb") as source, open(target_path, "wb") as target:
+            for block in iter(lambda: source.read(HASH_BLOCK_SIZE), b""):
+                target.write(block)
+                if callback:
+                    callback(len(block))
+
+    def upload_file(self, file_path: str, bucket: str, key: str, callback=None):
+        self._copy(file_path, self._path(bucket, key), callback)
+
+    def download_file(self, bucket: str, key: str, file_path: str, callback=None):
+        self._copy(self._path(bucket, key), file_path, callback)
+
+
+class TransferProgress:
+    """Thread-safe byte counter passed as the transfer callback; logs every 10% of the total."""
+
+    def __init__(self, description: str, total_bytes: int):
+        self.description = description
+        self.total_bytes = total_bytes
+        self.transferred_bytes = 0
+        self._last_logged_decile = -1
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int):
+        with self._lock:
+            self.transferred_bytes += bytes_amount
+            decile = int(10 * self.transferred_bytes / self.total_bytes) if self.total_bytes else 10
+            if decile > self._last_logged_decile:
+                self._last_logged_decile = decile
+                logging.info(f"{self.description}: {self.transferred_bytes}/{self.total_bytes} bytes ({min(decile, 10) * 10}%)")
+
+
+@dataclass
+class SyncSummary:
+    transferred_files: int
+    skipped_files: int
+    transferred_bytes: int
+
 
 class S3Sync:
-    def sync_folder_to_s3(self, folder, aws_bucket_url):
+    """
+    In-process replacement for `aws s3 sync`.
+
+    A manifest of size and sha256 per file is stored next to the synced objects, so files that did
+    not change since the last sync are skipped; the rest are transferred in parallel, large files in
+    multipart chunks. The backend defaults to boto3 and can be swapped for LocalFileSystemBackend.
+    """
+
+    def __init__(self, backend=None, max_workers: int = S3_SYNC_MAX_WORKERS):
+        self._backend = backend
+        self.max_workers = max_workers
+
+    @property
+    def backend(self):
+        # created on first use so importing the pipeline does not require boto3 or credentials
+        if self._backend is None:
+            self._backend = S3Backend()
+        return self._backend
+
+    def build_local_manifest(self, folder: str) -> dict:
+        file_paths = {}
+        for dir_path, _, file_names in os.walk(folder):
+            for file_name in file_names:
+                if file_name == S3_SYNC_MANIFEST_FILE_NAME or file_name.endswith(".tmp"):
+                    continue
+                file_path = os.path.join(dir_path, file_name)
+                file_paths[os.path.relpath(file_path, folder).replace(os.sep, "/")] = file_path
+
+        # hashlib releases the GIL on large buffers, so hashing also runs in parallel
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            hashes = dict(zip(file_paths, executor.map(file_sha256, file_paths.values())))
+        return {
+            relative_path: {"size": os.path.getsize(file_path), "sha256": hashes[relative_path]}
+            for relative_path, file_path in file_paths.items()
+        }
+
+    def read_remote_manifest(self, bucket: str, prefix: str):
+        data = self.backend.read_bytes(bucket, self._key(prefix, S3_SYNC_MANIFEST_FILE_NAME))
+        return json.loads(data)["files"] if data else None
+
+    @staticmethod
+    def _key(prefix: str, relative_path: str) -> str:
+        return f"{prefix}/{relative_path}" if prefix else relative_path
+
+    def _transfer(self, description: str, jobs: list, total_bytes: int):
+        progress = TransferProgress(description, total_bytes)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(job, progress) for job in jobs]
+            for future in futures:
+                future.result()
+        return progress.transferred_bytes
+
+    def sync_folder_to_s3(self, folder, aws_bucket_url) -> SyncSummary:
         try:
-            command = f"aws s3 sync {folder} {aws_bucket_url}"
-            logging.info(f"Executing S3 sync command: {command}")
-            print(f"Executing S3 sync command: {command}")
-            
-            # Execute the command and capture its exit status
-            exit_code = os.system(command)
-            
-            if exit_code != 0:
-                # AWS CLI returns non-zero exit code on failure
-                logging.error(f"S3 sync command failed with exit code {exit_code} for folder: {folder}")
-                raise Exception(f"AWS S3 sync command failed for folder '{folder}'. Check AWS CLI output for details.")
-            
-            logging.info(f"S3 sync command executed successfully for folder: {folder}")
+            bucket, prefix = parse_bucket_url(aws_bucket_url)
+            logging.info(f"Syncing '{folder}' to {aws_bucket_url}")
+            local_manifest = self.build_local_manifest(folder)
+            remote_manifest = self.read_remote_manifest(bucket, prefix) or {}
+
+            changed = [
+                relative_path for relative_path, entry in local_manifest.items()
+                if remote_manifest.get(relative_path) != entry
+            ]
+            total_bytes = sum(local_manifest[relative_path]["size"] for relative_path in changed)
+            logging.info(f"{len(changed)} of {len(local_manifest)} files changed ({total_bytes} bytes) under '{folder}'")
+
+            def upload(relative_path):
+                local_path = os.path.join(folder, *relative_path.split("/"))
+                return lambda progress: self.backend.upload_file(local_path, bucket, self._key(prefix, relative_path), progress)
+
+            transferred_bytes = self._transfer(f"Upload to {aws_bucket_url}", [upload(p) for p in changed], total_bytes)
+
+            # the manifest goes last so an interrupted sync re-uploads whatever did not make it
+            remote_manifest.update(local_manifest)
+            self.backend.write_bytes(
+                bucket, self._key(prefix, S3_SYNC_MANIFEST_FILE_NAME),
+                json.dumps({"files": remote_manifest}, indent=2, sort_keys=True).encode()
+            )
+            logging.info(f"S3 sync executed successfully for folder: {folder}")
+            return SyncSummary(len(changed), len(local_manifest) - len(changed), transferred_bytes)
         except Exception as e:
             logging.error(f"Error during S3 sync to S3 for folder {folder}: {e}", exc_info=True)
             raise NetworkSecurityException(e, sys)
-    
-    def sync_folder_from_s3(self, folder, aws_bucket_url):
+
+    def sync_folder_from_s3(self, folder, aws_bucket_url) -> SyncSummary:
         try:
-            command = f"aws s3 sync {aws_bucket_url} {folder}"
-            logging.info(f"Executing S3 sync command: {command}")
-            print(f"Executing S3 sync command: {command}")
-            
-            exit_code = os.system(command)
+            bucket, prefix = parse_bucket_url(aws_bucket_url)
+            logging.info(f"Syncing {aws_bucket_url} to '{folder}'")
+            remote_manifest = self.read_remote_manifest(bucket, prefix)
+            if remote_manifest is None:
+                # bucket was not written by this syncer, fall back to comparing sizes
+                key_prefix = f"{prefix}/" if prefix else ""
+                remote_manifest = {
+                    key[len(key_prefix):]: {"size": size}
+                    for key, size in self.backend.list_objects(bucket, prefix).items()
+                    if not key.endswith(S3_SYNC_MANIFEST_FILE_NAME)
+                }
+
+            def is_current(relative_path, entry):
+                local_path = os.path.join(folder, *relative_path.split("/"))
+                if not os.path.isfile(local_path) or os.path.getsize(local_path) != entry["size"]:
+                    return False
+                return "sha256" not in entry or file_sha256(local_path) == entry["sha256"]
 
-            if exit_code != 0:
-                logging.error(f"S3 sync command failed with exit code {exit_code} from S3 bucket: {aws_bucket_url}")
-                raise Exception(f"AWS S3 sync command failed from S3 bucket '{aws_bucket_url}'. Check AWS CLI output for details.")
+            # local files are hashed in parallel, as when building the upload manifest
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                current = list(executor.map(is_current, remote_manifest.keys(), remote_manifest.values()))
+            changed = [relative_path for relative_path, is_file_current in zip(remote_manifest, current) if not is_file_current]
+            total_bytes = sum(remote_manifest[relative_path]["size"] for relative_path in changed)
+            logging.info(f"{len(changed)} of {len(remote_manifest)} files changed ({total_bytes} bytes) under {aws_bucket_url}")
 
-            logging.info(f"S3 sync command executed successfully from S3 bucket: {aws_bucket_url}")
+            def download(relative_path):
+                local_path = os.path.join(folder, *relative_path.split("/"))
+
+                def job(progress):
+                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    # download next to the target and rename so a failed transfer leaves the old file intact
+                    self.backend.download_file(bucket, self._key(prefix, relative_path), f"{local_path}.tmp", progress)
+                    os.replace(f"{local_path}.tmp", local_path)
+                return job
+
+            transferred_bytes = self._transfer(f"Download from {aws_bucket_url}", [download(p) for p in changed], total_bytes)
+            logging.info(f"S3 sync executed successfully from S3 bucket: {aws_bucket_url}")
+            return SyncSummary(len(changed), len(remote_manifest) - len(changed), transferred_bytes)
         except Exception as e:
             logging.error(f"Error during S3 sync from S3 for bucket {aws_bucket_url}: {e}", exc_info=True)
-            raise NetworkSecurityException(e, sys)
\ No newline at end of file
+            raise NetworkSecurityException(e, sys)
@@ -2,7 +2,6 @@ import sys
 import os
 import numpy as np
 import pandas as pd
-from sklearn.impute import KNNImputer
 from sklearn.pipeline import Pipeline
 
 from networksecurity.constants.training_pipeline import TARGET_COLUMN, DATA_TRANSFORMATION_IMPUTER_PARAMS
@@ -12,6 +11,9 @@ from networksecurity.entity.config_entity import DataTransformationConfig
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 from networksecurity.utils.main_utils.utils import save_numpy_array_data, save_object
+from networksecurity.utils.main_utils.artifact_storage import get_artifact_storage_for_path, fits_integer_dtype
+from networksecurity.utils.ml_utils.preprocessing.imputer import NeighborIndexImputer
+from networksecurity.utils.main_utils.profiler import pipeline_profiler
 
 
 class DataTransformation:
@@ -25,7 +27,21 @@ class DataTransformation:
     @staticmethod
     def read_data(file_path: str) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return get_artifact_storage_for_path(file_path).read(file_path)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def cast_features(array: np.ndarray, feature_dtype: str) -> np.ndarray:
+        """Contiguous copy of array in feature_dtype; an integer dtype that cannot hold the values exactly falls back to float32."""
+        try:
+            dtype = np.dtype(feature_dtype)
+            if np.issubdtype(dtype, np.integer) and not np.can_cast(array.dtype, dtype):
+                # imputed neighbor means can be fractional, and those would be truncated
+                if not fits_integer_dtype(array, dtype):
+                    logging.warning(f"Transformed features are not all {dtype} values, storing them as float32 instead.")
+                    dtype = np.dtype(np.float32)
+            return np.ascontiguousarray(array, dtype=dtype)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -33,7 +49,7 @@ class DataTransformation:
     def get_Data_transformer_object() -> Pipeline:
         logging.info("Entered the get_Data_transformer_object method of DataTransformation class")
         try:
-            imputer: KNNImputer = KNNImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
+            imputer: NeighborIndexImputer = NeighborIndexImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)
             processor = Pipeline(steps=[("imputer", imputer)])
             logging.info("Exited the get_Data_transformer_object method of DataTransformation class")
             return processor
@@ -61,27 +77,31 @@ class DataTransformation:
             preprocessor = DataTransformation.get_Data_transformer_object() # Call static method correctly
             
             # Fit the preprocessor on the training features
-            preprocessor_object = preprocessor.fit(input_feature_train_df)
+            with pipeline_profiler.profile("imputer_fit", rows=len(input_feature_train_df)):
+                preprocessor_object = preprocessor.fit(input_feature_train_df)
             
             # Transform both train and test features
-            transformed_input_train_feature = preprocessor_object.transform(input_feature_train_df)
-            transformed_input_test_feature = preprocessor_object.transform(input_feature_test_df)
+            with pipeline_profiler.profile("imputer_transform", rows=len(input_feature_train_df) + len(input_feature_test_df)):
+                transformed_input_train_feature = preprocessor_object.transform(input_feature_train_df)
+                transformed_input_test_feature = preprocessor_object.transform(input_feature_test_df)
 
-            # Concatenate transformed features with target
-            train_arr =  np.c_[transformed_input_train_feature, np.array(target_feature_train_df)]
-            test_arr = np.c_[transformed_input_test_feature, np.array(target_feature_test_df)]
-
-            # Save transformed train and test numpy arrays
-            logging.info(f"Saving transformed train numpy array to {self.data_transformation_config.transformed_train_file_path}")
-            save_numpy_array_data(
-                file_path=self.data_transformation_config.transformed_train_file_path,
-                array=train_arr # Corrected 'arrary' to 'array' if your utils.py expects 'array'
-            )
-            logging.info(f"Saving transformed test numpy array to {self.data_transformation_config.transformed_test_file_path}")
-            save_numpy_array_data(
-                file_path=self.data_transformation_config.transformed_test_file_path,
-                array=test_arr # Corrected 'arrary' to 'array' if your utils.py expects 'array'
-            )
+            # Save features and target as separate contiguous arrays, no concatenated copy is built.
+            # The target stays float64, as it was in the old combined array, so the model classes don't change.
+            # both splits are stored in one dtype, so a float32 fallback for either one applies to both
+            feature_dtype = self.data_transformation_config.feature_dtype
+            train_features = DataTransformation.cast_features(transformed_input_train_feature, feature_dtype)
+            test_features = DataTransformation.cast_features(transformed_input_test_feature, feature_dtype)
+            if train_features.dtype != test_features.dtype:
+                train_features, test_features = train_features.astype(np.float32), test_features.astype(np.float32)
+            arrays = {
+                self.data_transformation_config.transformed_train_features_file_path: train_features,
+                self.data_transformation_config.transformed_train_target_file_path: target_feature_train_df.to_numpy(dtype=np.float64),
+                self.data_transformation_config.transformed_test_features_file_path: test_features,
+                self.data_transformation_config.transformed_test_target_file_path: target_feature_test_df.to_numpy(dtype=np.float64),
+            }
+            for file_path, array in arrays.items():
+                logging.info(f"Saving transformed numpy array {array.shape} ({array.dtype}) to {file_path}")
+                save_numpy_array_data(file_path=file_path, array=array)
 
             # Save the fitted preprocessor object
             logging.info(f"Saving preprocessor object to {self.data_transformation_config.transform_object_file_path}")
@@ -90,13 +110,13 @@ class DataTransformation:
                 obj=preprocessor_object
             )
 
-            save_object("final_models/preprocessor.pkl", preprocessor_object)
-            
             # Create and return DataTransformationArtifact
             data_transformation_artifact = DataTransformationArtifact(
                 transformed_object_file_path=self.data_transformation_config.transform_object_file_path,
-                transformed_train_file_path=self.data_transformation_config.transformed_train_file_path,
-                transformed_test_file_path=self.data_transformation_config.transformed_test_file_path
+                transformed_train_features_file_path=self.data_transformation_config.transformed_train_features_file_path,
+                transformed_train_target_file_path=self.data_transformation_config.transformed_train_target_file_path,
+                transformed_test_features_file_path=self.data_transformation_config.transformed_test_features_file_path,
+                transformed_test_target_file_path=self.data_transformation_config.transformed_test_target_file_path,
             )
             logging.info(f"Data Transformation completed. Artifact: {data_transformation_artifact}")
             return data_transformation_artifact
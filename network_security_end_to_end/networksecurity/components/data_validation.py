@@ -4,8 +4,10 @@ from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 from networksecurity.constants.training_pipeline import SCHEMA_FILE_PATH
 from networksecurity.utils.main_utils.utils import read_yaml_file, write_yaml_file
-
-from scipy.stats import ks_2samp
+from networksecurity.utils.main_utils.artifact_storage import get_artifact_storage, get_artifact_storage_for_path
+from networksecurity.utils.ml_utils.metric.drift_metric import detect_drift
+from networksecurity.utils.main_utils.profiler import pipeline_profiler
+from networksecurity.utils.main_utils.schema_validator import SchemaValidator
 import os
 import sys
 import pandas as pd
@@ -16,13 +18,15 @@ class DataValidation:
             self.data_validation_config = data_validation_config
             self.data_ingestion_artifact = data_ingestion_artifact
             self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self.schema_validator = SchemaValidator(self._schema_config)
+            self.artifact_storage = get_artifact_storage(data_validation_config.artifact_format)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
     
     @staticmethod
-    def read_data(fule_path) -> pd.DataFrame:
+    def read_data(fule_path, apply_dtypes: bool = True) -> pd.DataFrame:
         try:
-            return pd.read_csv(fule_path)
+            return get_artifact_storage_for_path(fule_path).read(fule_path, apply_dtypes=apply_dtypes)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
@@ -41,25 +45,38 @@ class DataValidation:
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
-    def detect_dataset_drift(self, base_df, current_df, threshold=0.05) -> bool:
+    def validate_schema(self, train_dataframe: pd.DataFrame, test_dataframe: pd.DataFrame) -> bool:
+        """Checks dtypes, allowed values and null ratios of both splits and writes a per-column report for each."""
+        try:
+            chunk_rows = self.data_validation_config.schema_chunk_rows
+            report = {
+                "train": self.schema_validator.validate_dataframe(train_dataframe, chunk_rows),
+                "test": self.schema_validator.validate_dataframe(test_dataframe, chunk_rows),
+            }
+            write_yaml_file(self.data_validation_config.schema_report_file_path, report)
+
+            for split, split_report in report.items():
+                if not split_report["status"]:
+                    logging.error(f"Schema validation failed for {split} data: {SchemaValidator.failure_summary(split_report)}")
+            return all(split_report["status"] for split_report in report.values())
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def detect_dataset_drift(self, base_df, current_df, threshold=None) -> bool:
         try:
-            status = True
-            report = {}
-            for column in base_df.columns:
-                d1 = base_df[column]
-                d2 = current_df[column]
-                is_same_dist = ks_2samp(d1, d2)
-                if is_same_dist.pvalue > threshold:
-                    is_found = False
-                else:
-                    is_found = True
-                    status = False
-                report.update({column: 
-                               {
-                                   "p_value": float(is_same_dist.pvalue),
-                                   "drift_status": is_found
-                               }    
-                               })
+            threshold = self.data_validation_config.drift_threshold if threshold is None else threshold
+            report = detect_drift(
+                base_df,
+                current_df,
+                threshold=threshold,
+                methods=self.data_validation_config.drift_methods,
+                n_jobs=self.data_validation_config.drift_n_jobs,
+                parallel_min_cells=self.data_validation_config.drift_parallel_min_cells,
+                discrete_max_cardinality=self.data_validation_config.drift_discrete_max_cardinality,
+            )
+            status = not any(column_report["drift_status"] for column_report in report.values())
+            logging.info(f"Drift detection took {sum(column_report['elapsed_seconds'] for column_report in report.values()):.3f} seconds across {len(report)} columns")
+
             drift_report_file_path = self.data_validation_config.drift_report_file_path
 
             # create directory
@@ -78,8 +95,9 @@ class DataValidation:
             train_file_path = self.data_ingestion_artifact.train_file_path
             test_file_path = self.data_ingestion_artifact.test_file_path
 
-            train_dataframe = DataValidation.read_data(train_file_path)
-            test_dataframe = DataValidation.read_data(test_file_path)
+            # read without casting to the schema dtypes so non-integer or non-numeric values are still visible
+            train_dataframe = DataValidation.read_data(train_file_path, apply_dtypes=False)
+            test_dataframe = DataValidation.read_data(test_file_path, apply_dtypes=False)
 
             logging.info("Validating number of columns in train data.")
             is_train_cols_valid = self.validate_number_of_columns(train_dataframe)
@@ -92,22 +110,18 @@ class DataValidation:
                 raise Exception("Test data column validation failed.")
 
 
-            numerical_columns_from_schema = self._schema_config.get("numerical_columns", [])
-            if not all(col in train_dataframe.columns for col in numerical_columns_from_schema):
-                error_message = f"Data validation failed. Numerical columns: {numerical_columns_from_schema} are not present in the train dataset."
-                logging.error(error_message)
-                raise Exception(error_message)
-
-            if not all(col in test_dataframe.columns for col in numerical_columns_from_schema):
-                error_message = f"Data validation failed. Numerical columns: {numerical_columns_from_schema} are not present in the test dataset."
-                logging.error(error_message)
-                raise Exception(error_message)
-            
-            logging.info("Numerical columns validated successfully.")
+            logging.info("Validating dtypes, allowed values and null ratios against the schema.")
+            with pipeline_profiler.profile("schema_validation", rows=len(train_dataframe) + len(test_dataframe)):
+                if not self.validate_schema(train_dataframe, test_dataframe):
+                    raise Exception(f"Schema validation failed. See {self.data_validation_config.schema_report_file_path}")
+            train_dataframe = self.artifact_storage.apply_dtypes(train_dataframe)
+            test_dataframe = self.artifact_storage.apply_dtypes(test_dataframe)
+            logging.info("Schema validated successfully.")
 
             # check data drift
             logging.info("Detecting data drift between train and test datasets.")
-            drift_status = self.detect_dataset_drift(train_dataframe, test_dataframe)
+            with pipeline_profiler.profile("drift_detection", rows=len(train_dataframe) + len(test_dataframe)):
+                drift_status = self.detect_dataset_drift(train_dataframe, test_dataframe)
 
             # Ensure valid/invalid directories are created for output
             valid_dir_path = self.data_validation_config.valid_data_dir
@@ -123,8 +137,8 @@ class DataValidation:
                 invalid_train_path = None
                 invalid_test_path = None
                 
-                train_dataframe.to_csv(valid_train_path, index=False, header=True)
-                test_dataframe.to_csv(valid_test_path, index=False, header=True)
+                self.artifact_storage.write(train_dataframe, valid_train_path)
+                self.artifact_storage.write(test_dataframe, valid_test_path)
 
             else:
                 logging.warning("Data drift detected. Saving invalid data.")
@@ -133,8 +147,8 @@ class DataValidation:
                 invalid_train_path = self.data_validation_config.invalid_train_file_path
                 invalid_test_path = self.data_validation_config.invalid_test_file_path
 
-                train_dataframe.to_csv(invalid_train_path, index=False, header=True)
-                test_dataframe.to_csv(invalid_test_path, index=False, header=True)
+                self.artifact_storage.write(train_dataframe, invalid_train_path)
+                self.artifact_storage.write(test_dataframe, invalid_test_path)
 
             data_validation_artifact = DataValidationArtifact(
                 validation_status=drift_status,
@@ -142,7 +156,9 @@ class DataValidation:
                 validation_test_file_path=valid_test_path,
                 invalid_train_file_path=invalid_train_path,
                 invalid_test_file_path=invalid_test_path,
-                drift_report_file_path=self.data_validation_config.drift_report_file_path
+                drift_report_file_path=self.data_validation_config.drift_report_file_path,
+                artifact_format=self.data_validation_config.artifact_format,
+                schema_report_file_path=self.data_validation_config.schema_report_file_path,
             )
             logging.info(f"Data Validation Artifact: {data_validation_artifact}")
             return data_validation_artifact
@@ -8,11 +8,15 @@ import mlflow
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 
-from networksecurity.entity.artifact_entity import ModelTrainerArtifact, DataTransformationArtifact, ModelEvaluationArtifact
+from networksecurity.entity.artifact_entity import ModelTrainerArtifact, DataTransformationArtifact, ModelEvaluationArtifact, DataIngestionArtifact
 from networksecurity.entity.config_entity import ModelTrainerConfig
+from networksecurity.constants.training_pipeline import FINAL_PREPROCESSOR_FILE_PATH, FINAL_MODEL_FILE_PATH, FINAL_MODEL_BUNDLE_FILE_PATH
 
 from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+from networksecurity.utils.ml_utils.model.tree_ensemble import supports_compiled_backend
 from networksecurity.utils.main_utils.utils import save_object, load_object, load_numpy_array_data, evaluate_models
+from networksecurity.utils.main_utils.model_bundle import save_model_bundle, load_model_bundle, read_model_bundle_header
+from networksecurity.utils.main_utils.profiler import pipeline_profiler
 from networksecurity.utils.ml_utils.metric.classification_metric import get_classification_score
 
 from sklearn.linear_model import LogisticRegression
@@ -25,72 +29,148 @@ from sklearn.ensemble import (
     GradientBoostingClassifier
 )
 
+# families whose fitted ensembles can be extended with warm_start instead of being refit from scratch
+WARM_START_MODEL_NAMES = {
+    RandomForestClassifier: "Random Forest",
+    GradientBoostingClassifier: "Gradient Boosting",
+}
+
 
 class ModelTrainer:
-    def __init__(self, model_trainer_config: ModelTrainerConfig, data_transformation_artifact: DataTransformationArtifact):
+    def __init__(self, model_trainer_config: ModelTrainerConfig, data_transformation_artifact: DataTransformationArtifact,
+                 data_ingestion_artifact: DataIngestionArtifact = None):
         try:
             self.model_trainer_config = model_trainer_config
             self.data_transformation_artifact = data_transformation_artifact
+            # identifies the training data; without it the published model is never warm-started
+            self.data_ingestion_artifact = data_ingestion_artifact
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def get_warm_start_base(self) -> str:
+        """
+        Path of the published model bundle to warm-start from, or None. Only a model trained on exactly the
+        data this run's ingestion appended new rows to qualifies: the split is by row hash, so those rows
+        are still in train, and the test rows were never seen by the previous trees.
+        """
+        try:
+            config = self.model_trainer_config
+            appended_to_version = getattr(self.data_ingestion_artifact, "appended_to_version", None)
+            if not config.warm_start or appended_to_version is None or not os.path.exists(config.previous_model_bundle_file_path):
+                return None
+            metadata = read_model_bundle_header(config.previous_model_bundle_file_path).get("metadata", {})
+            if metadata.get("training_data_version") != appended_to_version:
+                logging.info("The published model was not trained on the data this run appended to; running the full search.")
+                return None
+            return config.previous_model_bundle_file_path
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def warm_start_previous_model(self, x_train, y_train):
+        """
+        Extends the published ensemble with warm_start_extra_estimators new estimators fit on the current
+        training data, skipping the hyperparameter search. Returns (model_name, model), or None when there
+        is no compatible previous model (see get_warm_start_base) or it already reached
+        warm_start_max_estimators, in which case the caller runs the full search.
+        """
+        try:
+            config = self.model_trainer_config
+            bundle_file_path = self.get_warm_start_base()
+            if bundle_file_path is None:
+                return None
+            # the model from the bundle, not model.pkl, so it is the one the lineage metadata describes
+            model = load_model_bundle(bundle_file_path, mmap_mode=False).model
+            model_name = WARM_START_MODEL_NAMES.get(type(model))
+            if model_name is None or getattr(model, "n_features_in_", None) != x_train.shape[1]:
+                logging.info(f"Previous model {type(model).__name__} cannot be warm-started on this data; running the full search.")
+                return None
+            n_estimators = model.n_estimators + config.warm_start_extra_estimators
+            if n_estimators > config.warm_start_max_estimators:
+                logging.info(f"Previous {model_name} would grow past {config.warm_start_max_estimators} estimators; running the full search.")
+                return None
+
+            logging.info(f"Warm-starting previous {model_name} from {model.n_estimators} to {n_estimators} estimators.")
+            model.set_params(warm_start=True, n_estimators=n_estimators)
+            with pipeline_profiler.profile(f"warm_start_{model_name.lower().replace(' ', '_')}", rows=len(y_train)):
+                model.fit(x_train, y_train)
+            # later full refits of a loaded copy must start from scratch
+            model.set_params(warm_start=False)
+            return model_name, model
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
+    def search_best_model(self, x_train, y_train, x_test, y_test):
+        models = {
+            "Random Forest": RandomForestClassifier(verbose=0),
+            "Decision Tree": DecisionTreeClassifier(),
+            "Gradient Boosting": GradientBoostingClassifier(verbose=0),
+            "Logistic Regression": LogisticRegression(verbose=0, solver='liblinear'), 
+            "AdaBoost": AdaBoostClassifier()
+        }
+        
+        params = {
+            "Decision Tree": {"criterion": ["gini", "entropy"]},
+            "Random Forest": {
+                "criterion": ["gini", "entropy"],
+                "max_features": ["log2", "sqrt"],
+                "n_estimators": [50, 100, 150],
+            },
+            "AdaBoost": {
+                'learning_rate': [0.01, 0.1, 0.5, 1.],
+                'n_estimators': [50, 100, 150]
+            },
+            "Gradient Boosting": {
+                "learning_rate": [0.1, 0.01, 0.05],
+                "subsample": [0.6, 0.7, 0.9],
+                "max_depth": [4, 5, 6],
+            },
+            "Logistic Regression": {
+                'penalty': ['l1', 'l2'],
+                'C': [0.001, 0.01, 0.1, 1, 10, 100]
+            },
+        }
+
+        model_report: dict = evaluate_models(
+            x_train=x_train, y_train=y_train, x_test=x_test, y_test=y_test, models=models, params=params,
+            cv=self.model_trainer_config.search_cv,
+            strategy=self.model_trainer_config.search_strategy,
+            n_iter=self.model_trainer_config.search_n_iter,
+            halving_factor=self.model_trainer_config.search_halving_factor,
+            n_jobs=self.model_trainer_config.search_n_jobs,
+        )
+        
+        filtered_model_report_values = [score for score in model_report.values() if not pd.isna(score)]
+        
+        if not filtered_model_report_values:
+            raise Exception("All models failed to train or produce valid scores. Cannot determine best model.")
+
+        best_model_score = max(filtered_model_report_values)
+
+        best_model_name = None
+        for name, score in model_report.items():
+            if not pd.isna(score) and score == best_model_score:
+                best_model_name = name
+                break
+        
+        if best_model_name is None:
+            raise Exception("Could not determine best model name even after filtering NaN scores.")
+
+        return best_model_name, models[best_model_name]
+
     def train_model(self, x_train, y_train, x_test, y_test):
         logging.info("Starting model training within train_model method.")
-        
+
         with mlflow.start_run() as run:
             run_id = run.info.run_id
             logging.info(f"MLflow Run ID: {run_id}")
             print(f"MLflow Run ID: {run_id}")
 
-            models = {
-                "Random Forest": RandomForestClassifier(verbose=0),
-                "Decision Tree": DecisionTreeClassifier(),
-                "Gradient Boosting": GradientBoostingClassifier(verbose=0),
-                "Logistic Regression": LogisticRegression(verbose=0, solver='liblinear'), 
-                "AdaBoost": AdaBoostClassifier()
-            }
-            
-            params = {
-                "Decision Tree": {"criterion": ["gini", "entropy"]},
-                "Random Forest": {
-                    "criterion": ["gini", "entropy"],
-                    "max_features": ["log2", "sqrt"],
-                    "n_estimators": [50, 100, 150],
-                },
-                "AdaBoost": {
-                    'learning_rate': [0.01, 0.1, 0.5, 1.],
-                    'n_estimators': [50, 100, 150]
-                },
-                "Gradient Boosting": {
-                    "learning_rate": [0.1, 0.01, 0.05],
-                    "subsample": [0.6, 0.7, 0.9],
-                    "max_depth": [4, 5, 6],
-                },
-                "Logistic Regression": {
-                    'penalty': ['l1', 'l2'],
-                    'C': [0.001, 0.01, 0.1, 1, 10, 100]
-                },
-            }
-
-            model_report: dict = evaluate_models(x_train=x_train, y_train=y_train, x_test=x_test, y_test=y_test, models=models, params=params)
-            
-            filtered_model_report_values = [score for score in model_report.values() if not pd.isna(score)]
-            
-            if not filtered_model_report_values:
-                raise Exception("All models failed to train or produce valid scores. Cannot determine best model.")
-
-            best_model_score = max(filtered_model_report_values)
-
-            best_model_name = None
-            for name, score in model_report.items():
-                if not pd.isna(score) and score == best_model_score:
-                    best_model_name = name
-                    break
-            
-            if best_model_name is None:
-                raise Exception("Could not determine best model name even after filtering NaN scores.")
-
-            best_model = models[best_model_name]
+            warm_started = self.warm_start_previous_model(x_train, y_train)
+            if warm_started is not None:
+                best_model_name, best_model = warm_started
+            else:
+                best_model_name, best_model = self.search_best_model(x_train, y_train, x_test, y_test)
+            mlflow.log_param("warm_started", warm_started is not None)
             
             logging.info(f"Retraining best model '{best_model_name}' on full training data.")
             mlflow.log_param("best_model_name", best_model_name)
@@ -132,6 +212,18 @@ class ModelTrainer:
 
             logging.info("Creating NetworkModel object (preprocessor + best model).")
             network_model = NetworkModel(preprocessor=preprocessor, model=best_model)
+            if self.model_trainer_config.inference_backend == "compiled" and supports_compiled_backend(best_model):
+                parity_report = None
+                try:
+                    parity_report = network_model.set_backend("compiled", validation_x=x_test)
+                except Exception as e:
+                    logging.warning(f"Serving {best_model_name} with the sklearn backend: {e}")
+                # outside the try, so a failure to log cannot be mistaken for a failed backend switch
+                if parity_report is not None:
+                    mlflow.log_metric("compiled_backend_max_rows", parity_report["compiled_max_rows"])
+                    if parity_report["batch_speedup"] is not None:
+                        mlflow.log_metric("compiled_backend_batch_speedup", parity_report["batch_speedup"])
+            mlflow.log_param("inference_backend", network_model.backend)
             
             logging.info(f"Saving NetworkModel locally to {self.model_trainer_config.trained_model_file_path}")
             save_object(file_path=self.model_trainer_config.trained_model_file_path, obj=network_model)
@@ -139,7 +231,16 @@ class ModelTrainer:
             logging.info(f"Logging NetworkModel as MLflow artifact from {self.model_trainer_config.trained_model_file_path}")
             mlflow.log_artifact(local_path=self.model_trainer_config.trained_model_file_path, artifact_path="trained_model")
 
-            save_object("final_models/model.pkl", best_model)
+            # publish the preprocessor and model together so the serving registry swaps in a matching pair
+            save_object(FINAL_PREPROCESSOR_FILE_PATH, preprocessor)
+            save_object(FINAL_MODEL_FILE_PATH, best_model)
+            # written last: the registry prefers the bundle, so it only swaps once the whole pair is published
+            save_model_bundle(FINAL_MODEL_BUNDLE_FILE_PATH, network_model, metadata={
+                "model_name": best_model_name,
+                "test_f1_score": classification_test_metric.f1_score,
+                "inference_backend": network_model.backend,
+                "training_data_version": getattr(self.data_ingestion_artifact, "data_version", None),
+            })
 
             model_trainer_artifact = ModelTrainerArtifact(
                 trained_model_file_path=self.model_trainer_config.trained_model_file_path,
@@ -154,16 +255,14 @@ class ModelTrainer:
     def initiate_model_trainer(self) -> ModelTrainerArtifact:
         logging.info("Initiating model training process.")
         try:
-            train_file_path = self.data_transformation_artifact.transformed_train_file_path
-            test_file_path = self.data_transformation_artifact.transformed_test_file_path
-
-            logging.info(f"Loading transformed train array from {train_file_path}")
-            train_array = load_numpy_array_data(train_file_path)
-            logging.info(f"Loading transformed test array from {test_file_path}")
-            test_array = load_numpy_array_data(test_file_path)
-
-            x_train, y_train = train_array[:, :-1], train_array[:, -1]
-            x_test, y_test = test_array[:, :-1], test_array[:, -1]
+            artifact = self.data_transformation_artifact
+            # memory-mapped read-only: only the pages the models touch are read from disk
+            logging.info(f"Memory-mapping transformed train arrays {artifact.transformed_train_features_file_path} and {artifact.transformed_train_target_file_path}")
+            x_train = load_numpy_array_data(artifact.transformed_train_features_file_path, mmap_mode="r")
+            y_train = load_numpy_array_data(artifact.transformed_train_target_file_path, mmap_mode="r")
+            logging.info(f"Memory-mapping transformed test arrays {artifact.transformed_test_features_file_path} and {artifact.transformed_test_target_file_path}")
+            x_test = load_numpy_array_data(artifact.transformed_test_features_file_path, mmap_mode="r")
+            y_test = load_numpy_array_data(artifact.transformed_test_target_file_path, mmap_mode="r")
 
             model_trainer_artifact = self.train_model(x_train, y_train, x_test, y_test)
             
@@ -13,6 +13,11 @@ FILE_NAME: str = "phishingData.csv"
 TRAIN_FILE_NAME: str = "train.csv"
 TEST_FILE_NAME: str = "test.csv"
 
+# format used for the feature store and train/test artifacts: "parquet", "feather" or "csv"
+ARTIFACT_STORAGE_FORMAT: str = "parquet"
+# integer columns are stored in the smallest dtype holding their allowed values (int8 for {-1, 0, 1})
+COMPACT_FEATURE_DTYPES: bool = True
+
 SCHEMA_FILE_PATH = os.path.join("data-schema", "schema.yaml")
 
 SAVED_MODEL_DIR = os.path.join("saved_models")
@@ -20,6 +25,31 @@ MODEL_FILE_NAME = "model.pkl"
 
 TRAINING_BUCKET_NAME = "networksecuritytrainingbucket"
 
+# stage artifacts are reused across runs when their inputs did not change
+STAGE_CACHE_ENABLED: bool = True
+STAGE_CACHE_DIR_NAME: str = "stage_cache"
+
+PROFILE_REPORT_FILE_NAME: str = "profile_report.yaml"
+
+# mongodb connection related constants
+
+MONGODB_URL_ENV_KEY: str = "MONGODB_URL" # full connection string; otherwise built from MONGODB_USERNAME/MONGODB_PASSWORD
+MONGODB_CLUSTER_HOST: str = "cluster0.ywc3jur.mongodb.net"
+MONGODB_APP_NAME: str = "Cluster0"
+MONGODB_MAX_POOL_SIZE: int = 50
+MONGODB_MIN_POOL_SIZE: int = 0
+MONGODB_MAX_IDLE_TIME_MS: int = 60_000
+MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 5_000
+MONGODB_CONNECT_TIMEOUT_MS: int = 10_000
+
+# s3 sync related constants
+
+S3_SYNC_MANIFEST_FILE_NAME: str = ".sync_manifest.json"
+S3_SYNC_MAX_WORKERS: int = 8 # files transferred in parallel
+S3_SYNC_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024
+S3_SYNC_MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024
+S3_SYNC_MULTIPART_MAX_CONCURRENCY: int = 4 # parts uploaded in parallel per file
+
 # data ingestion related constants
 
 DATA_INGESTION_COLLECTION_NAME: str = "phising_data"
@@ -28,6 +58,14 @@ DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
 DATA_INGESTION_INGESTED_DIR: str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATION: float = 0.2
+# rows are split by a seeded hash of their values, so a row stays on the same side across runs
+DATA_INGESTION_SPLIT_SEED: int = 42
+DATA_INGESTION_BATCH_SIZE: int = 10000
+# incremental mode keeps a feature store across runs and only pulls documents newer than its high-water mark
+DATA_INGESTION_INCREMENTAL: bool = True
+DATA_INGESTION_CACHE_DIR: str = os.path.join(ARTIFACT_DIR, "ingestion_cache")
+DATA_INGESTION_STATE_FILE_NAME: str = "ingestion_state.json"
+DATA_INGESTION_SCHEMA_REPORT_FILE_NAME: str = "schema_report.yaml"
 
 # data validation related constants
 
@@ -36,6 +74,14 @@ DATA_VALIDATION_VALID_DIR: str = "validated"
 DATA_VALIDATION_INVALID_DIR: str = "invalid"
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_SCHEMA_REPORT_DIR: str = "schema_report"
+DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_SCHEMA_CHUNK_ROWS: int = 100_000
+DATA_VALIDATION_DRIFT_THRESHOLD: float = 0.05
+DATA_VALIDATION_DRIFT_METHODS: list = ["ks", "psi", "chi2"]
+DATA_VALIDATION_DRIFT_N_JOBS: int = -1 # -1 uses every cpu core
+DATA_VALIDATION_DRIFT_PARALLEL_MIN_CELLS: int = 100_000_000
+DATA_VALIDATION_DRIFT_DISCRETE_MAX_CARDINALITY: int = 10
 
 # data transformation related constants
 
@@ -49,11 +95,24 @@ PREPROCESSING_OBJECT_FILE_NAME: str = "preprocessor.pkl"
 DATA_TRANSFORMATION_IMPUTER_PARAMS: dict = {
     "missing_values": np.nan,
     "n_neighbors": 3,
-    "weights": "uniform"
+    "weights": "uniform",
+    "algorithm": "ball_tree",
+    "leaf_size": 40,
+    "max_indexes": 32,
+    # "single_missing" prebuilds an index per feature for serving rows missing one value, but every index
+    # pickles its own float64 copy of the training rows, so it is left off
+    "prebuilt_patterns": None,
+    "compact": COMPACT_FEATURE_DTYPES
 }
 
-DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npy"
-DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npy"
+# features and target are stored as separate contiguous arrays so the trainer can memory-map them
+DATA_TRANSFORMATION_TRAIN_FEATURES_FILE_NAME: str = "train_features.npy"
+DATA_TRANSFORMATION_TRAIN_TARGET_FILE_NAME: str = "train_target.npy"
+DATA_TRANSFORMATION_TEST_FEATURES_FILE_NAME: str = "test_features.npy"
+DATA_TRANSFORMATION_TEST_TARGET_FILE_NAME: str = "test_target.npy"
+# "int8" keeps the {-1, 0, 1} features at one byte (float32 if imputation left fractional values),
+# "float32" halves the size of the "float64" arrays
+DATA_TRANSFORMATION_FEATURE_DTYPE: str = "int8"
 
 # model trainer related constants
 
@@ -61,4 +120,50 @@ MODEL_TRAINER_DIR_NAME: str = "model_trainer"
 MODEL_TRAINER_TRAINED_MODEL_DIR: str = "trained_model"
 MODEL_TRAINER_TRAINED_MODEL_NAME: str = "model.pkl"
 MODEL_TRAINER_EXPECTED_SCORE: float = 0.6
-MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD: float = 0.05
\ No newline at end of file
+MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD: float = 0.05
+MODEL_TRAINER_SEARCH_STRATEGY: str = "grid" # "grid", "random", "halving_grid" or "halving_random"
+MODEL_TRAINER_SEARCH_CV: int = 3
+MODEL_TRAINER_SEARCH_N_ITER: int = 10
+MODEL_TRAINER_SEARCH_HALVING_FACTOR: int = 3
+MODEL_TRAINER_SEARCH_N_JOBS: int = -1
+# grow the previously published ensemble instead of searching again, until it reaches the max size; only
+# applies when this run's data is an incremental append to the data that ensemble was trained on
+MODEL_TRAINER_WARM_START: bool = False
+MODEL_TRAINER_WARM_START_EXTRA_ESTIMATORS: int = 25
+MODEL_TRAINER_WARM_START_MAX_ESTIMATORS: int = 300
+# "compiled" serves tree ensembles from flattened node arrays when they match sklearn exactly; otherwise "sklearn"
+MODEL_TRAINER_INFERENCE_BACKEND: str = "compiled"
+
+# model serving related constants
+
+FINAL_MODEL_DIR: str = "final_models"
+FINAL_PREPROCESSOR_FILE_PATH: str = os.path.join(FINAL_MODEL_DIR, PREPROCESSING_OBJECT_FILE_NAME)
+FINAL_MODEL_FILE_PATH: str = os.path.join(FINAL_MODEL_DIR, MODEL_FILE_NAME)
+MODEL_BUNDLE_FILE_NAME: str = "model.bundle"
+FINAL_MODEL_BUNDLE_FILE_PATH: str = os.path.join(FINAL_MODEL_DIR, MODEL_BUNDLE_FILE_NAME)
+# the compiled backend only serves batches up to the size where it stops beating sklearn's predict; the parity
+# check times both backends on batches of 1, 2, 4, ... up to the calibration limit to find it for each model
+COMPILED_BACKEND_CALIBRATION_MAX_ROWS: int = 512
+COMPILED_BACKEND_MIN_SPEEDUP: float = 1.05 # closer timings are within noise and count as sklearn being as fast
+COMPILED_BACKEND_MAX_ROWS: int = 32 # for models set up without validation data to time
+MODEL_REGISTRY_POLL_INTERVAL_SECONDS: float = 5.0
+PREDICTION_STREAM_CHUNK_SIZE: int = 50_000
+PREDICTION_STREAM_PREFETCH_CHUNKS: int = 2
+PREDICTION_BATCH_MAX_ROWS: int = 4096 # concurrent /predict requests are coalesced up to this many rows
+PREDICTION_BATCH_MAX_WAIT_MS: float = 5.0
+PREDICTION_CACHE_ENABLED: bool = True
+PREDICTION_CACHE_MAX_ENTRIES: int = 100_000 # least recently used rows are evicted past this
+PREDICTION_CACHE_TTL_SECONDS: float = 3600.0
+# /metrics histogram buckets, in seconds and in rows
+METRICS_LATENCY_BUCKETS: tuple = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+METRICS_ROWS_BUCKETS: tuple = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096, 16384, 65536, 262144)
+TRAINING_JOB_DIR: str = os.path.join(ARTIFACT_DIR, "training_jobs")
+
+# batch prediction related constants
+
+BATCH_PREDICTION_DIR_NAME: str = "batch_prediction"
+BATCH_PREDICTION_OUTPUT_DIR: str = "predictions"
+BATCH_PREDICTION_REPORT_FILE_NAME: str = "report.yaml"
+BATCH_PREDICTION_N_WORKERS: int = -1 # -1 uses every cpu core
+BATCH_PREDICTION_CHUNK_SIZE: int = 100_000
+BATCH_PREDICTION_MONGO_SHARDS_PER_WORKER: int = 4
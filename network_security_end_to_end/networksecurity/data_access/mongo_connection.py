@@ -0,0 +1,152 @@
+import os
+import sys
+import time
+import threading
+import certifi
+from urllib.parse import urlsplit, parse_qs
+import pymongo
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import (
+    MONGODB_URL_ENV_KEY, MONGODB_CLUSTER_HOST, MONGODB_APP_NAME, MONGODB_MAX_POOL_SIZE, MONGODB_MIN_POOL_SIZE,
+    MONGODB_MAX_IDLE_TIME_MS, MONGODB_SERVER_SELECTION_TIMEOUT_MS, MONGODB_CONNECT_TIMEOUT_MS,
+)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+try:
+    from pymongo import AsyncMongoClient  # pymongo >= 4.9
+except ImportError:
+    try:
+        from motor.motor_asyncio import AsyncIOMotorClient as AsyncMongoClient
+    except ImportError:
+        AsyncMongoClient = None
+
+
+def get_mongodb_uri() -> str:
+    url = os.getenv(MONGODB_URL_ENV_KEY)
+    if url:
+        return url
+    username = os.getenv("MONGODB_USERNAME")
+    password = os.getenv("MONGODB_PASSWORD")
+    return f"mongodb+srv://{username}:{password}@{MONGODB_CLUSTER_HOST}/?retryWrites=true&w=majority&appName={MONGODB_APP_NAME}"
+
+
+def uses_tls(uri: str) -> bool:
+    """True for mongodb+srv:// URIs, which default to TLS, and for URIs that turn it on with tls=true or ssl=true."""
+    if uri.startswith("mongodb+srv://"):
+        return True
+    options = {name.lower(): values[-1].lower() for name, values in parse_qs(urlsplit(uri).query).items()}
+    return options.get("tls", options.get("ssl")) == "true"
+
+
+class MongoConnectionManager:
+    """
+    One lazily created, pooled MongoDB client per process, shared by the app, the pipeline and the loaders.
+
+    Nothing connects (or resolves the mongodb+srv DNS records) until a client is first requested, so
+    importing the app never blocks on Atlas. The sync client is recreated after a fork, since pymongo
+    clients are not fork-safe. The async client (pymongo's AsyncMongoClient, or Motor on older
+    pymongo) is bound to the event loop it is first used on.
+    """
+
+    def __init__(self, uri: str = None, max_pool_size: int = MONGODB_MAX_POOL_SIZE, min_pool_size: int = MONGODB_MIN_POOL_SIZE,
+                 max_idle_time_ms: int = MONGODB_MAX_IDLE_TIME_MS, server_selection_timeout_ms: int = MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                 connect_timeout_ms: int = MONGODB_CONNECT_TIMEOUT_MS):
+        self.uri = uri
+        self.client_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "maxIdleTimeMS": max_idle_time_ms,
+            "serverSelectionTimeoutMS": server_selection_timeout_ms,
+            "connectTimeoutMS": connect_timeout_ms,
+        }
+        self._client: pymongo.MongoClient = None
+        self._client_pid: int = None
+        self._async_client = None
+        self._lock = threading.Lock()
+
+    def _get_uri(self) -> str:
+        return self.uri or get_mongodb_uri()
+
+    def _get_client_options(self, uri: str) -> dict:
+        # passing tlsCAFile turns TLS on, which a plain mongodb://localhost server would refuse
+        if uses_tls(uri) and "tlscafile=" not in uri.lower():
+            return {**self.client_options, "tlsCAFile": certifi.where()}
+        return self.client_options
+
+    def get_client(self) -> pymongo.MongoClient:
+        try:
+            if self._client is None or self._client_pid != os.getpid():
+                with self._lock:
+                    if self._client is None or self._client_pid != os.getpid():
+                        # connect=False: the pool opens connections on the first operation, not here
+                        uri = self._get_uri()
+                        self._client = pymongo.MongoClient(uri, connect=False, **self._get_client_options(uri))
+                        self._client_pid = os.getpid()
+                        logging.info(f"Created MongoDB client with pool size {self.client_options['maxPoolSize']}")
+            return self._client
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def get_async_client(self):
+        try:
+            if AsyncMongoClient is None:
+                raise Exception("No async MongoDB driver available; install pymongo>=4.9 or motor.")
+            if self._async_client is None:
+                with self._lock:
+                    if self._async_client is None:
+                        uri = self._get_uri()
+                        self._async_client = AsyncMongoClient(uri, **self._get_client_options(uri))
+                        logging.info(f"Created async MongoDB client with pool size {self.client_options['maxPoolSize']}")
+            return self._async_client
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def get_collection(self, database_name: str, collection_name: str):
+        return self.get_client()[database_name][collection_name]
+
+    @staticmethod
+    def _health(started: float, error: Exception = None) -> dict:
+        latency_ms = round((time.perf_counter() - started) * 1000, 3)
+        if error is not None:
+            return {"status": "error", "latency_ms": latency_ms, "error": str(error)}
+        return {"status": "ok", "latency_ms": latency_ms}
+
+    def ping(self) -> dict:
+        """Round trip to the server; never raises, so it can back a health check."""
+        started = time.perf_counter()
+        try:
+            self.get_client().admin.command("ping")
+            return self._health(started)
+        except Exception as e:
+            return self._health(started, e)
+
+    async def ping_async(self) -> dict:
+        started = time.perf_counter()
+        try:
+            await self.get_async_client().admin.command("ping")
+            return self._health(started)
+        except Exception as e:
+            return self._health(started, e)
+
+    def close(self):
+        with self._lock:
+            if self._client is not None:
+                if self._client_pid == os.getpid():
+                    self._client.close()
+                self._client = None
+
+    async def close_async(self):
+        async_client, self._async_client = self._async_client, None
+        if async_client is not None:
+            result = async_client.close()
+            # AsyncMongoClient.close is a coroutine, Motor's is not
+            if hasattr(result, "__await__"):
+                await result
+
+
+# shared by every MongoDB user in the process
+mongo_connection = MongoConnectionManager()
@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from networksecurity.constants.training_pipeline import ARTIFACT_STORAGE_FORMAT
 
 @dataclass
 class DataIngestionArtifact:
     train_file_path: str
     test_file_path: str
+    artifact_format: str = ARTIFACT_STORAGE_FORMAT
+    data_version: str = None
+    appended_to_version: str = None
 
 @dataclass
 class DataValidationArtifact:
@@ -13,12 +17,16 @@ class DataValidationArtifact:
     invalid_train_file_path: str
     invalid_test_file_path: str
     drift_report_file_path: str
+    artifact_format: str = ARTIFACT_STORAGE_FORMAT
+    schema_report_file_path: str = None
 
 @dataclass
 class DataTransformationArtifact:
     transformed_object_file_path: str
-    transformed_train_file_path: str
-    transformed_test_file_path: str
+    transformed_train_features_file_path: str
+    transformed_train_target_file_path: str
+    transformed_test_features_file_path: str
+    transformed_test_target_file_path: str
 
 @dataclass
 class ClassificationMetricArtifact:
@@ -34,4 +42,12 @@ class ModelTrainerArtifact:
 
 @dataclass
 class ModelEvaluationArtifact:
-    is_model_accepted: bool
\ No newline at end of file
+    is_model_accepted: bool
+
+@dataclass
+class BatchPredictionArtifact:
+    output_dir: str
+    output_file_paths: list
+    report_file_path: str
+    total_rows: int
+    rows_per_second: float
@@ -1,6 +1,7 @@
 import os
 from datetime import datetime
 from networksecurity.constants import training_pipeline
+from networksecurity.utils.main_utils.artifact_storage import with_artifact_extension
 
 print(training_pipeline.PIPELINE_NAME)
 print(training_pipeline.ARTIFACT_DIR)
@@ -13,35 +14,58 @@ class TrainingPipelineConfig:
         self.artifact_name: str = training_pipeline.ARTIFACT_DIR
         self.artifact_dir: str = os.path.join(self.artifact_name, timestamp.strftime("%m_%d_%Y_%H_%M_%S"))
         self.model_dir: str = os.path.join("final_models")
+        self.artifact_format: str = training_pipeline.ARTIFACT_STORAGE_FORMAT
+        self.profile_report_file_path: str = os.path.join(self.artifact_dir, training_pipeline.PROFILE_REPORT_FILE_NAME)
         self.timestamp: datetime = timestamp
 
 class DataIngestionConfig:
     def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+        self.artifact_format: str = training_pipeline_config.artifact_format
         self.data_ingestion_dir: str = os.path.join(training_pipeline_config.artifact_dir, training_pipeline.DATA_INGESTION_DIR_NAME)
-        self.feature_store_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR, training_pipeline.FILE_NAME)
-        self.train_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_INGESTED_DIR, training_pipeline.TRAIN_FILE_NAME)
-        self.test_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_INGESTED_DIR, training_pipeline.TEST_FILE_NAME)
+        self.feature_store_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_FEATURE_STORE_DIR, with_artifact_extension(training_pipeline.FILE_NAME, self.artifact_format))
+        self.train_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_INGESTED_DIR, with_artifact_extension(training_pipeline.TRAIN_FILE_NAME, self.artifact_format))
+        self.test_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_INGESTED_DIR, with_artifact_extension(training_pipeline.TEST_FILE_NAME, self.artifact_format))
         self.train_test_split_ratio: float = training_pipeline.DATA_INGESTION_TRAIN_TEST_SPLIT_RATION
+        self.split_seed: int = training_pipeline.DATA_INGESTION_SPLIT_SEED
         self.collection_name: str = training_pipeline.DATA_INGESTION_COLLECTION_NAME
         self.database_name: str = training_pipeline.DATA_INGESTION_DATABASE_NAME
+        self.batch_size: int = training_pipeline.DATA_INGESTION_BATCH_SIZE
+        self.incremental: bool = training_pipeline.DATA_INGESTION_INCREMENTAL
+        self.cached_feature_store_file_path: str = os.path.join(training_pipeline.DATA_INGESTION_CACHE_DIR, with_artifact_extension(training_pipeline.FILE_NAME, self.artifact_format))
+        self.state_file_path: str = os.path.join(training_pipeline.DATA_INGESTION_CACHE_DIR, training_pipeline.DATA_INGESTION_STATE_FILE_NAME)
+        self.schema_report_file_path: str = os.path.join(self.data_ingestion_dir, training_pipeline.DATA_INGESTION_SCHEMA_REPORT_FILE_NAME)
 
 class DataValidationConfig:
     def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+        self.artifact_format: str = training_pipeline_config.artifact_format
+        train_file_name: str = with_artifact_extension(training_pipeline.TRAIN_FILE_NAME, self.artifact_format)
+        test_file_name: str = with_artifact_extension(training_pipeline.TEST_FILE_NAME, self.artifact_format)
         self.data_validation_dir: str = os.path.join(training_pipeline_config.artifact_dir, training_pipeline.DATA_VALIDATION_DIR_NAME)
         self.valid_data_dir: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR)
         self.invalid_data_dir: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_INVALID_DIR)
-        self.valid_train_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR, training_pipeline.TRAIN_FILE_NAME)
-        self.valid_test_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR, training_pipeline.TEST_FILE_NAME)
-        self.invalid_train_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_INVALID_DIR, training_pipeline.TRAIN_FILE_NAME)
-        self.invalid_test_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_INVALID_DIR, training_pipeline.TEST_FILE_NAME)
+        self.valid_train_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR, train_file_name)
+        self.valid_test_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_VALID_DIR, test_file_name)
+        self.invalid_train_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_INVALID_DIR, train_file_name)
+        self.invalid_test_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_INVALID_DIR, test_file_name)
         self.drift_report_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR, training_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME)
+        self.schema_report_file_path: str = os.path.join(self.data_validation_dir, training_pipeline.DATA_VALIDATION_SCHEMA_REPORT_DIR, training_pipeline.DATA_VALIDATION_SCHEMA_REPORT_FILE_NAME)
+        self.schema_chunk_rows: int = training_pipeline.DATA_VALIDATION_SCHEMA_CHUNK_ROWS
+        self.drift_threshold: float = training_pipeline.DATA_VALIDATION_DRIFT_THRESHOLD
+        self.drift_methods: list = training_pipeline.DATA_VALIDATION_DRIFT_METHODS
+        self.drift_n_jobs: int = training_pipeline.DATA_VALIDATION_DRIFT_N_JOBS
+        self.drift_parallel_min_cells: int = training_pipeline.DATA_VALIDATION_DRIFT_PARALLEL_MIN_CELLS
+        self.drift_discrete_max_cardinality: int = training_pipeline.DATA_VALIDATION_DRIFT_DISCRETE_MAX_CARDINALITY
 
 
 class DataTransformationConfig:
     def __init__(self, training_pipeline_config: TrainingPipelineConfig):
         self.data_transformation_dir: str = os.path.join(training_pipeline_config.artifact_dir, training_pipeline.DATA_TRANSFORMATION_DIR_NAME)
-        self.transformed_train_file_path: str = os.path.join(self.data_transformation_dir, training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR, training_pipeline.TRAIN_FILE_NAME.replace("csv", "npy"))
-        self.transformed_test_file_path: str = os.path.join(self.data_transformation_dir, training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR, training_pipeline.TEST_FILE_NAME.replace("csv", "npy"))
+        transformed_data_dir: str = os.path.join(self.data_transformation_dir, training_pipeline.DATA_TRANSFORMATION_TRANSFORMED_DATA_DIR)
+        self.transformed_train_features_file_path: str = os.path.join(transformed_data_dir, training_pipeline.DATA_TRANSFORMATION_TRAIN_FEATURES_FILE_NAME)
+        self.transformed_train_target_file_path: str = os.path.join(transformed_data_dir, training_pipeline.DATA_TRANSFORMATION_TRAIN_TARGET_FILE_NAME)
+        self.transformed_test_features_file_path: str = os.path.join(transformed_data_dir, training_pipeline.DATA_TRANSFORMATION_TEST_FEATURES_FILE_NAME)
+        self.transformed_test_target_file_path: str = os.path.join(transformed_data_dir, training_pipeline.DATA_TRANSFORMATION_TEST_TARGET_FILE_NAME)
+        self.feature_dtype: str = training_pipeline.DATA_TRANSFORMATION_FEATURE_DTYPE
         self.transform_object_file_path: str = os.path.join(self.data_transformation_dir, training_pipeline.DATA_TRANSFORMATION_TRANSFORM_OBJECT_DIR, training_pipeline.PREPROCESSING_OBJECT_FILE_NAME)
 
 
@@ -50,4 +74,32 @@ class ModelTrainerConfig:
         self.model_trainer_dir: str = os.path.join(training_pipeline_config.artifact_dir, training_pipeline.MODEL_TRAINER_DIR_NAME)
         self.trained_model_file_path: str = os.path.join(self.model_trainer_dir, training_pipeline.MODEL_TRAINER_TRAINED_MODEL_DIR, training_pipeline.MODEL_FILE_NAME)
         self.expected_accuracy: float = training_pipeline.MODEL_TRAINER_EXPECTED_SCORE
-        self.overfitting_underfitting_threshold: float = training_pipeline.MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD
\ No newline at end of file
+        self.overfitting_underfitting_threshold: float = training_pipeline.MODEL_TRAINER_OVER_FITTING_UNDER_FITTING_THRESHOLD
+        self.search_strategy: str = training_pipeline.MODEL_TRAINER_SEARCH_STRATEGY
+        self.search_cv: int = training_pipeline.MODEL_TRAINER_SEARCH_CV
+        self.search_n_iter: int = training_pipeline.MODEL_TRAINER_SEARCH_N_ITER
+        self.search_halving_factor: int = training_pipeline.MODEL_TRAINER_SEARCH_HALVING_FACTOR
+        self.search_n_jobs: int = training_pipeline.MODEL_TRAINER_SEARCH_N_JOBS
+        self.warm_start: bool = training_pipeline.MODEL_TRAINER_WARM_START
+        self.warm_start_extra_estimators: int = training_pipeline.MODEL_TRAINER_WARM_START_EXTRA_ESTIMATORS
+        self.warm_start_max_estimators: int = training_pipeline.MODEL_TRAINER_WARM_START_MAX_ESTIMATORS
+        self.previous_model_bundle_file_path: str = training_pipeline.FINAL_MODEL_BUNDLE_FILE_PATH
+        self.inference_backend: str = training_pipeline.MODEL_TRAINER_INFERENCE_BACKEND
+
+
+class BatchPredictionConfig:
+    def __init__(self, input_path: str = None, database_name: str = None, collection_name: str = None, timestamp=None):
+        timestamp = timestamp or datetime.now()
+        self.batch_prediction_dir: str = os.path.join(training_pipeline.ARTIFACT_DIR, training_pipeline.BATCH_PREDICTION_DIR_NAME, timestamp.strftime("%m_%d_%Y_%H_%M_%S"))
+        self.output_dir: str = os.path.join(self.batch_prediction_dir, training_pipeline.BATCH_PREDICTION_OUTPUT_DIR)
+        self.report_file_path: str = os.path.join(self.batch_prediction_dir, training_pipeline.BATCH_PREDICTION_REPORT_FILE_NAME)
+        self.output_format: str = training_pipeline.ARTIFACT_STORAGE_FORMAT
+        self.preprocessor_file_path: str = training_pipeline.FINAL_PREPROCESSOR_FILE_PATH
+        self.model_file_path: str = training_pipeline.FINAL_MODEL_FILE_PATH
+        self.bundle_file_path: str = training_pipeline.FINAL_MODEL_BUNDLE_FILE_PATH
+        self.n_workers: int = training_pipeline.BATCH_PREDICTION_N_WORKERS
+        self.chunk_size: int = training_pipeline.BATCH_PREDICTION_CHUNK_SIZE
+        self.mongo_shards_per_worker: int = training_pipeline.BATCH_PREDICTION_MONGO_SHARDS_PER_WORKER
+        self.input_path: str = input_path
+        self.database_name: str = database_name
+        self.collection_name: str = collection_name
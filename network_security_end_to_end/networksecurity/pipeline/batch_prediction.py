@@ -0,0 +1,228 @@
+import os
+import sys
+import glob
+import time
+import argparse
+import multiprocessing
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import TARGET_COLUMN
+from networksecurity.entity.config_entity import BatchPredictionConfig
+from networksecurity.entity.artifact_entity import BatchPredictionArtifact
+from networksecurity.utils.main_utils.utils import load_object, write_yaml_file
+from networksecurity.utils.main_utils.model_bundle import load_model_bundle
+from networksecurity.utils.main_utils.artifact_storage import ARTIFACT_STORAGES
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+
+# loaded once per worker process by _init_worker
+_worker_model: NetworkModel = None
+
+
+def _init_worker(preprocessor_file_path: str, model_file_path: str, bundle_file_path: str = None):
+    global _worker_model
+    if bundle_file_path and os.path.exists(bundle_file_path):
+        # memory-mapped, so all workers share one copy of the model arrays
+        _worker_model = load_model_bundle(bundle_file_path)
+    else:
+        _worker_model = NetworkModel(preprocessor=load_object(preprocessor_file_path), model=load_object(model_file_path))
+
+
+def _iter_file_chunks(file_path: str, chunk_size: int):
+    file_format = os.path.splitext(file_path)[1].lstrip(".").lower()
+    if file_format == "csv":
+        yield from pd.read_csv(file_path, chunksize=chunk_size)
+    elif file_format == "parquet":
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif file_format == "feather":
+        dataframe = pd.read_feather(file_path)
+        for start in range(0, len(dataframe), chunk_size):
+            yield dataframe.iloc[start:start + chunk_size]
+    else:
+        raise Exception(f"Unsupported input file: {file_path}. Supported formats: {list(ARTIFACT_STORAGES)}")
+
+
+def _iter_mongo_chunks(database_name: str, collection_name: str, id_range: tuple, chunk_size: int):
+    from networksecurity.components.data_ingestion import get_mongo_client
+
+    lower_id, upper_id = id_range
+    query = {"_id": {"$gte": lower_id}}
+    if upper_id is not None:
+        query["_id"]["$lt"] = upper_id
+    collection = get_mongo_client()[database_name][collection_name]
+    cursor = collection.find(query, batch_size=chunk_size).sort("_id", 1)
+
+    documents = []
+    for document in cursor:
+        document["_id"] = str(document["_id"])
+        documents.append(document)
+        if len(documents) == chunk_size:
+            yield pd.DataFrame(documents)
+            documents = []
+    if documents:
+        yield pd.DataFrame(documents)
+
+
+def _score_shard(shard_number: int, shard: dict, output_dir: str, output_format: str, chunk_size: int) -> dict:
+    start_time = time.perf_counter()
+    if output_format not in ARTIFACT_STORAGES:
+        raise Exception(f"Unsupported output format: {output_format}. Supported formats: {list(ARTIFACT_STORAGES)}")
+    # no schema dtypes: inputs are not validated, so rows with missing or out-of-range values are written as read
+    storage = ARTIFACT_STORAGES[output_format]()
+    if shard["source"] == "file":
+        chunks = _iter_file_chunks(shard["file_path"], chunk_size)
+    else:
+        chunks = _iter_mongo_chunks(shard["database_name"], shard["collection_name"], shard["id_range"], chunk_size)
+
+    rows, output_file_paths = 0, []
+    for chunk_number, chunk in enumerate(chunks):
+        features = chunk.drop(columns=[column for column in (TARGET_COLUMN, "_id") if column in chunk.columns])
+        chunk["predicted_column"] = _worker_model.predict(features)
+        output_file_path = os.path.join(output_dir, f"part-{shard_number:05d}-{chunk_number:05d}.{output_format}")
+        storage.write(chunk, output_file_path)
+        output_file_paths.append(output_file_path)
+        rows += len(chunk)
+
+    return {
+        "worker_pid": os.getpid(),
+        "rows": rows,
+        "seconds": time.perf_counter() - start_time,
+        "output_file_paths": output_file_paths,
+    }
+
+
+class BatchPrediction:
+    def __init__(self, batch_prediction_config: BatchPredictionConfig):
+        try:
+            self.batch_prediction_config = batch_prediction_config
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def get_file_shards(self) -> list:
+        try:
+            input_path = self.batch_prediction_config.input_path
+            if os.path.isdir(input_path):
+                file_paths = [
+                    file_path for file_path in sorted(glob.glob(os.path.join(input_path, "*")))
+                    if os.path.splitext(file_path)[1].lstrip(".").lower() in ARTIFACT_STORAGES
+                ]
+            else:
+                file_paths = sorted(glob.glob(input_path))
+            if not file_paths:
+                raise Exception(f"No input files found at {input_path}")
+            return [{"source": "file", "file_path": file_path} for file_path in file_paths]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def get_mongo_shards(self, n_shards: int) -> list:
+        try:
+            from networksecurity.components.data_ingestion import get_mongo_client
+
+            database_name = self.batch_prediction_config.database_name
+            collection_name = self.batch_prediction_config.collection_name
+            collection = get_mongo_client()[database_name][collection_name]
+
+            # split the _id index into roughly equal ranges, one per shard: the server walks the index
+            # to each boundary, so only n_shards ids come back instead of every _id in the collection
+            total_documents = collection.estimated_document_count()
+            shard_size = max(1, -(-total_documents // n_shards))
+            boundaries = []
+            for shard in range(n_shards):
+                documents = list(collection.find({}, {"_id": 1}).sort("_id", 1).skip(shard * shard_size).limit(1))
+                if not documents:
+                    break
+                boundaries.append(documents[0]["_id"])
+            if not boundaries:
+                raise Exception(f"Collection {database_name}.{collection_name} is empty")
+
+            upper_bounds = boundaries[1:] + [None]
+            return [
+                {"source": "mongo", "database_name": database_name, "collection_name": collection_name, "id_range": (lower_id, upper_id)}
+                for lower_id, upper_id in zip(boundaries, upper_bounds)
+            ]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def initiate_batch_prediction(self) -> BatchPredictionArtifact:
+        try:
+            config = self.batch_prediction_config
+            n_workers = config.n_workers if config.n_workers and config.n_workers > 0 else (os.cpu_count() or 1)
+
+            if config.input_path:
+                shards = self.get_file_shards()
+            elif config.database_name and config.collection_name:
+                shards = self.get_mongo_shards(n_shards=n_workers * config.mongo_shards_per_worker)
+            else:
+                raise Exception("Batch prediction needs either an input path or a Mongo database and collection.")
+
+            n_workers = min(n_workers, len(shards))
+            os.makedirs(config.output_dir, exist_ok=True)
+            logging.info(f"Starting batch prediction over {len(shards)} shards with {n_workers} workers")
+
+            start_time = time.perf_counter()
+            # spawn so workers never inherit a forked MongoClient or the parent's threads
+            with ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(config.preprocessor_file_path, config.model_file_path, config.bundle_file_path),
+            ) as executor:
+                futures = [
+                    executor.submit(_score_shard, shard_number, shard, config.output_dir, config.output_format, config.chunk_size)
+                    for shard_number, shard in enumerate(shards)
+                ]
+                shard_results = [future.result() for future in futures]
+            wall_seconds = time.perf_counter() - start_time
+
+            workers = {}
+            for shard_result in shard_results:
+                worker = workers.setdefault(shard_result["worker_pid"], {"shards": 0, "rows": 0, "seconds": 0.0})
+                worker["shards"] += 1
+                worker["rows"] += shard_result["rows"]
+                worker["seconds"] += shard_result["seconds"]
+            for worker in workers.values():
+                worker["rows_per_second"] = worker["rows"] / worker["seconds"] if worker["seconds"] else 0.0
+
+            total_rows = sum(shard_result["rows"] for shard_result in shard_results)
+            rows_per_second = total_rows / wall_seconds if wall_seconds else 0.0
+            output_file_paths = [file_path for shard_result in shard_results for file_path in shard_result["output_file_paths"]]
+
+            write_yaml_file(config.report_file_path, {
+                "total_rows": total_rows,
+                "wall_seconds": wall_seconds,
+                "rows_per_second": rows_per_second,
+                "n_shards": len(shards),
+                "n_workers": n_workers,
+                "workers": {str(pid): worker for pid, worker in workers.items()},
+            })
+            logging.info(f"Batch prediction scored {total_rows} rows in {wall_seconds:.2f}s ({rows_per_second:.0f} rows/s)")
+
+            return BatchPredictionArtifact(
+                output_dir=config.output_dir,
+                output_file_paths=output_file_paths,
+                report_file_path=config.report_file_path,
+                total_rows=total_rows,
+                rows_per_second=rows_per_second,
+            )
+        except Exception as e:
+            logging.error(f"Error in initiate_batch_prediction: {e}", exc_info=True)
+            raise NetworkSecurityException(e, sys)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score a batch of network data with the deployed model.")
+    parser.add_argument("--input", help="CSV/Parquet/Feather file, directory or glob of input shards")
+    parser.add_argument("--database", help="Mongo database to score instead of files")
+    parser.add_argument("--collection", help="Mongo collection to score instead of files")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes")
+    args = parser.parse_args()
+
+    batch_prediction_config = BatchPredictionConfig(input_path=args.input, database_name=args.database, collection_name=args.collection)
+    if args.workers:
+        batch_prediction_config.n_workers = args.workers
+    batch_prediction_artifact = BatchPrediction(batch_prediction_config).initiate_batch_prediction()
+    print(f"Scored {batch_prediction_artifact.total_rows} rows at {batch_prediction_artifact.rows_per_second:.0f} rows/s, report: {batch_prediction_artifact.report_file_path}")
@@ -1,5 +1,6 @@
 import os
 import sys
+import mlflow
 
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
@@ -13,13 +14,28 @@ from networksecurity.components.model_trainer import ModelTrainer
 from networksecurity.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact, DataTransformationArtifact, ModelTrainerArtifact
 from networksecurity.entity.config_entity import DataIngestionConfig, TrainingPipelineConfig, DataValidationConfig, DataTransformationConfig, ModelTrainerConfig
 
-from networksecurity.constants.training_pipeline import TRAINING_BUCKET_NAME
+from networksecurity.constants.training_pipeline import TRAINING_BUCKET_NAME, SCHEMA_FILE_PATH, FINAL_PREPROCESSOR_FILE_PATH, FINAL_MODEL_FILE_PATH, FINAL_MODEL_BUNDLE_FILE_PATH
+from networksecurity.utils.main_utils.utils import save_object, load_object, evaluate_models
+from networksecurity.utils.main_utils.artifact_storage import ArtifactStorage
+from networksecurity.utils.main_utils.model_bundle import save_model_bundle
+from networksecurity.utils.main_utils.profiler import pipeline_profiler
+from networksecurity.utils.main_utils.schema_validator import SchemaValidator
+from networksecurity.utils.main_utils.stage_cache import StageCache, hash_files, hash_source, get_stage_constants
+from networksecurity.utils.ml_utils.metric.drift_metric import detect_drift
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+from networksecurity.utils.ml_utils.model.tree_ensemble import CompiledTreeEnsemble
+from networksecurity.utils.ml_utils.model.search import ModelSearch
+from networksecurity.utils.ml_utils.preprocessing.imputer import NeighborIndexImputer
+
+# constants every stage depends on
+COMMON_STAGE_CONSTANTS = ("TARGET_COLUMN", "ARTIFACT_STORAGE_FORMAT", "COMPACT_FEATURE_DTYPES", "SCHEMA_FILE_PATH")
 
 
 class TrainingPipeline:
     def __init__(self):
         self.training_pipeline_config: TrainingPipelineConfig = TrainingPipelineConfig()
         self.s3_sync = S3Sync()
+        self.stage_cache = StageCache()
         if not os.getenv("AWS_ACCESS_KEY_ID") or \
            not os.getenv("AWS_SECRET_ACCESS_KEY") or \
            not os.getenv("AWS_DEFAULT_REGION"):
@@ -28,42 +44,106 @@ class TrainingPipeline:
 
     def start_data_ingestion(self) -> DataIngestionArtifact:
         try:
-            self.data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
-            logging.info("Starting data ingestion process.")
-            data_ingestion = DataIngestion(data_ingestion_config=self.data_ingestion_config)
-            data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
-            logging.info("Data Ingestion completed successfully.")
-            return data_ingestion_artifact
+            with pipeline_profiler.profile("data_ingestion"):
+                self.data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+                logging.info("Starting data ingestion process.")
+                data_ingestion = DataIngestion(data_ingestion_config=self.data_ingestion_config)
+                # fingerprinting the collection only costs a count and one indexed lookup, not the full pull
+                fingerprint = self.stage_cache.fingerprint({
+                    "collection": data_ingestion.get_collection_fingerprint(),
+                    "schema": hash_files([SCHEMA_FILE_PATH]),
+                    "constants": get_stage_constants(COMMON_STAGE_CONSTANTS + ("DATA_INGESTION_", "FILE_NAME", "TRAIN_FILE_NAME", "TEST_FILE_NAME")),
+                    "source": hash_source([DataIngestion, ArtifactStorage, SchemaValidator]),
+                })
+                data_ingestion_artifact = self.stage_cache.get("data_ingestion", fingerprint)
+                if data_ingestion_artifact is None:
+                    data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
+                    self.stage_cache.put("data_ingestion", fingerprint, data_ingestion_artifact)
+                logging.info("Data Ingestion completed successfully.")
+                return data_ingestion_artifact
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
     def start_data_validation(self, data_ingestion_artifact: DataIngestionArtifact) -> DataValidationArtifact:
         try:
-            data_validation_config = DataValidationConfig(training_pipeline_config=self.training_pipeline_config)
-            data_validation = DataValidation(data_ingestion_artifact=data_ingestion_artifact, data_validation_config=data_validation_config)
-            logging.info("Starting data validation process.")
-            data_validation_artifact = data_validation.initiate_data_validation()
-            return data_validation_artifact
+            with pipeline_profiler.profile("data_validation"):
+                data_validation_config = DataValidationConfig(training_pipeline_config=self.training_pipeline_config)
+                fingerprint = self.stage_cache.fingerprint({
+                    "data": hash_files([data_ingestion_artifact.train_file_path, data_ingestion_artifact.test_file_path]),
+                    "schema": hash_files([SCHEMA_FILE_PATH]),
+                    "constants": get_stage_constants(COMMON_STAGE_CONSTANTS + ("DATA_VALIDATION_",)),
+                    "source": hash_source([DataValidation, ArtifactStorage, SchemaValidator, detect_drift]),
+                })
+                data_validation_artifact = self.stage_cache.get("data_validation", fingerprint)
+                if data_validation_artifact is None:
+                    data_validation = DataValidation(data_ingestion_artifact=data_ingestion_artifact, data_validation_config=data_validation_config)
+                    logging.info("Starting data validation process.")
+                    data_validation_artifact = data_validation.initiate_data_validation()
+                    self.stage_cache.put("data_validation", fingerprint, data_validation_artifact)
+                return data_validation_artifact
         except Exception as e:
             raise NetworkSecurityException(e, sys) 
         
     def start_data_transformation(self, data_validation_artifact: DataValidationArtifact) -> DataTransformationArtifact:
         try:
-            data_transformation_config = DataTransformationConfig(training_pipeline_config=self.training_pipeline_config)
-            data_transformation = DataTransformation(data_validation_artifact=data_validation_artifact, data_transformation_config=data_transformation_config)
-            logging.info("Starting data transformation process.")
-            data_transformation_artifact = data_transformation.initiate_data_transformation()
-            return data_transformation_artifact
+            with pipeline_profiler.profile("data_transformation"):
+                data_transformation_config = DataTransformationConfig(training_pipeline_config=self.training_pipeline_config)
+                fingerprint = self.stage_cache.fingerprint({
+                    "data": hash_files([data_validation_artifact.validation_train_file_path, data_validation_artifact.validation_test_file_path]),
+                    "constants": get_stage_constants(COMMON_STAGE_CONSTANTS + ("DATA_TRANSFORMATION_", "PREPROCESSING_")),
+                    "source": hash_source([DataTransformation, ArtifactStorage, NeighborIndexImputer]),
+                })
+                data_transformation_artifact = self.stage_cache.get("data_transformation", fingerprint)
+                if data_transformation_artifact is None:
+                    data_transformation = DataTransformation(data_validation_artifact=data_validation_artifact, data_transformation_config=data_transformation_config)
+                    logging.info("Starting data transformation process.")
+                    data_transformation_artifact = data_transformation.initiate_data_transformation()
+                    self.stage_cache.put("data_transformation", fingerprint, data_transformation_artifact)
+                return data_transformation_artifact
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
-    def start_model_trainer(self, data_transformation_artifact: DataTransformationArtifact) -> ModelTrainerArtifact:
+    def start_model_trainer(self, data_transformation_artifact: DataTransformationArtifact,
+                            data_ingestion_artifact: DataIngestionArtifact = None) -> ModelTrainerArtifact:
         try:
-            model_trainer_config = ModelTrainerConfig(training_pipeline_config=self.training_pipeline_config)
-            model_trainer = ModelTrainer(model_trainer_config=model_trainer_config, data_transformation_artifact=data_transformation_artifact)
-            logging.info("Starting model trainer process.")
-            model_trainer_artifact = model_trainer.initiate_model_trainer()
-            return model_trainer_artifact
+            with pipeline_profiler.profile("model_trainer"):
+                model_trainer_config = ModelTrainerConfig(training_pipeline_config=self.training_pipeline_config)
+                model_trainer = ModelTrainer(
+                    model_trainer_config=model_trainer_config,
+                    data_transformation_artifact=data_transformation_artifact,
+                    data_ingestion_artifact=data_ingestion_artifact,
+                )
+                training_data_version = getattr(data_ingestion_artifact, "data_version", None)
+                # a warm-started model depends on the published model it grows, not only on this run's data
+                warm_start_base = model_trainer.get_warm_start_base()
+                fingerprint = self.stage_cache.fingerprint({
+                    "data": hash_files([
+                        data_transformation_artifact.transformed_train_features_file_path,
+                        data_transformation_artifact.transformed_train_target_file_path,
+                        data_transformation_artifact.transformed_test_features_file_path,
+                        data_transformation_artifact.transformed_test_target_file_path,
+                        data_transformation_artifact.transformed_object_file_path,
+                    ]),
+                    "constants": get_stage_constants(COMMON_STAGE_CONSTANTS + ("MODEL_TRAINER_",)),
+                    "source": hash_source([ModelTrainer, ModelSearch, evaluate_models, NetworkModel, CompiledTreeEnsemble]),
+                    "training_data_version": training_data_version,
+                    "warm_start_base": hash_files([warm_start_base]) if warm_start_base else None,
+                })
+                model_trainer_artifact = self.stage_cache.get("model_trainer", fingerprint)
+                if model_trainer_artifact is None:
+                    logging.info("Starting model trainer process.")
+                    model_trainer_artifact = model_trainer.initiate_model_trainer()
+                    self.stage_cache.put("model_trainer", fingerprint, model_trainer_artifact)
+                else:
+                    # final_models may hold a different model since, so publish the cached one again
+                    network_model = load_object(model_trainer_artifact.trained_model_file_path)
+                    save_object(FINAL_PREPROCESSOR_FILE_PATH, network_model.preprocessor)
+                    save_object(FINAL_MODEL_FILE_PATH, network_model.model)
+                    save_model_bundle(FINAL_MODEL_BUNDLE_FILE_PATH, network_model, metadata={
+                        "model_name": type(network_model.model).__name__,
+                        "training_data_version": training_data_version,
+                    })
+                return model_trainer_artifact
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
@@ -100,15 +180,31 @@ class TrainingPipeline:
             raise NetworkSecurityException(e, sys)
             
         
-    def run_pipeline(self):
+    def run_pipeline(self, progress_callback=None):
+        """Runs every stage in order; progress_callback, if given, is called with each stage name as it starts."""
+        profile_published = False
         try:
+            def report(stage_name):
+                if progress_callback is not None:
+                    progress_callback(stage_name)
+
             logging.info("Starting training pipeline.")
+            pipeline_profiler.reset()
+            report("data_ingestion")
             data_ingestion_artifact = self.start_data_ingestion()
+            report("data_validation")
             data_validation_artifact = self.start_data_validation(data_ingestion_artifact=data_ingestion_artifact)
+            report("data_transformation")
             data_transformation_artifact = self.start_data_transformation(data_validation_artifact=data_validation_artifact)
-            model_trainer_artifact = self.start_model_trainer(data_transformation_artifact=data_transformation_artifact)
+            report("model_trainer")
+            model_trainer_artifact = self.start_model_trainer(data_transformation_artifact=data_transformation_artifact, data_ingestion_artifact=data_ingestion_artifact)
+
+            # written before the sync so the report is uploaded with the artifacts it describes
+            self.publish_profile()
+            profile_published = True
 
             logging.info("Syncing artifacts to S3...")
+            report("s3_sync")
             self.sysc_artifact_dir_to_s3()
             self.sync_saved_model_dir_to_s3()
             logging.info("S3 sync operations completed.")
@@ -117,4 +213,18 @@ class TrainingPipeline:
             return model_trainer_artifact
         except Exception as e:
             logging.error(f"Training pipeline failed: {e}", exc_info=True)
-            raise NetworkSecurityException(e, sys)
\ No newline at end of file
+            raise NetworkSecurityException(e, sys)
+        finally:
+            # a failed run is profiled too, up to the stage that failed
+            if not profile_published:
+                self.publish_profile()
+
+    def publish_profile(self):
+        try:
+            pipeline_profiler.write_report(self.training_pipeline_config.profile_report_file_path)
+            with mlflow.start_run(run_name="training_pipeline_profile"):
+                mlflow.log_param("artifact_dir", self.training_pipeline_config.artifact_dir)
+                pipeline_profiler.log_to_mlflow()
+        except Exception as e:
+            # profiling must never fail a training run
+            logging.error(f"Could not publish pipeline profile: {e}", exc_info=True)
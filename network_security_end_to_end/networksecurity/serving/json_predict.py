@@ -0,0 +1,122 @@
+import sys
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Union
+from pydantic import BaseModel
+from fastapi.responses import Response, JSONResponse
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.constants.training_pipeline import TARGET_COLUMN
+from networksecurity.utils.main_utils.artifact_storage import get_schema_dtypes, fits_integer_dtype
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_AVAILABLE = msgpack is not None
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+Value = Optional[Union[int, float]]
+
+
+class PredictionRequest(BaseModel):
+    """Feature rows as a compact matrix (rows + optional column order) or as a list of records."""
+    columns: Optional[List[str]] = None
+    rows: Optional[List[List[Value]]] = None
+    records: Optional[List[dict]] = None
+
+
+class RequestValidationError(Exception):
+    pass
+
+
+_feature_columns: list = None
+
+def get_feature_columns() -> list:
+    # schema order is the column order the model was trained on
+    global _feature_columns
+    if _feature_columns is None:
+        _feature_columns = [column for column in get_schema_dtypes() if column != TARGET_COLUMN]
+    return _feature_columns
+
+
+_compact_feature_dtype: list = None
+
+def get_compact_feature_dtype():
+    # the one narrow integer dtype shared by all feature columns, or None
+    global _compact_feature_dtype
+    if _compact_feature_dtype is None:
+        feature_dtypes = {dtype for column, dtype in get_schema_dtypes().items() if column != TARGET_COLUMN}
+        dtype = feature_dtypes.pop() if len(feature_dtypes) == 1 else None
+        _compact_feature_dtype = [dtype if dtype is not None and np.issubdtype(dtype, np.integer) and dtype.itemsize < 8 else None]
+    return _compact_feature_dtype[0]
+
+
+def to_compact_features(features: pd.DataFrame) -> pd.DataFrame:
+    """
+    Casts complete rows to the compact schema dtype (int8 for the {-1, 0, 1} features), so the imputer
+    passes them through without a float64 copy; batches with nulls or out-of-range values stay float64.
+    """
+    dtype = get_compact_feature_dtype()
+    if dtype is None:
+        return features
+    values = features.to_numpy(dtype=np.float64)
+    if not fits_integer_dtype(values, dtype):
+        return features
+    return pd.DataFrame(values.astype(dtype), columns=features.columns, index=features.index)
+
+
+def request_to_features(request: PredictionRequest) -> pd.DataFrame:
+    """Validates the request against the schema columns and returns the features in schema order."""
+    try:
+        feature_columns = get_feature_columns()
+        if (request.rows is None) == (request.records is None):
+            raise RequestValidationError("Provide exactly one of 'rows' or 'records'.")
+
+        if request.rows is not None:
+            columns = request.columns or feature_columns
+            if any(len(row) != len(columns) for row in request.rows):
+                raise RequestValidationError(f"Every row must have {len(columns)} values, one per column.")
+            values = np.array(request.rows, dtype=np.float64).reshape(len(request.rows), len(columns))
+            features = pd.DataFrame(values, columns=columns)
+        else:
+            columns = list(dict.fromkeys(column for record in request.records for column in record))
+            features = pd.DataFrame.from_records(request.records, columns=columns)
+
+        missing = [column for column in feature_columns if column not in features.columns]
+        unexpected = [column for column in features.columns if column not in feature_columns and column != TARGET_COLUMN]
+        if missing or unexpected:
+            raise RequestValidationError(f"Columns must match the schema. Missing: {missing}, unexpected: {unexpected}.")
+
+        features = features[feature_columns]
+        if request.records is not None:
+            features = features.apply(pd.to_numeric, errors="raise").astype(np.float64)
+        return to_compact_features(features)
+    except RequestValidationError:
+        raise
+    except (TypeError, ValueError) as e:
+        raise RequestValidationError(f"Feature values must be numbers or null: {e}")
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def negotiate_media_type(accept: str, response_format: str = None) -> str:
+    if response_format == "msgpack" or (response_format is None and MSGPACK_MEDIA_TYPE in (accept or "")):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def predictions_response(predictions: np.ndarray, model_version: int, media_type: str) -> Response:
+    content = {"predictions": np.asarray(predictions).astype(np.int64).tolist(), "model_version": model_version}
+    if media_type == MSGPACK_MEDIA_TYPE:
+        return Response(content=msgpack.packb(content), media_type=MSGPACK_MEDIA_TYPE)
+    if orjson is not None:
+        return Response(content=orjson.dumps(content), media_type=JSON_MEDIA_TYPE)
+    return JSONResponse(content=content)
@@ -0,0 +1,239 @@
+import sys
+import math
+import time
+import bisect
+import threading
+
+from starlette.routing import Match
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.constants.training_pipeline import METRICS_LATENCY_BUCKETS, METRICS_ROWS_BUCKETS
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape_label_value(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels.items()) + "}"
+
+
+class Metric:
+    """One metric family: a value (or histogram) per combination of label values."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names=()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} takes labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in values.items():
+            yield self.name, dict(zip(self.label_names, key)), value
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(Metric):
+    metric_type = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names=(), buckets=METRICS_LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # per-bucket counts (last one is +Inf), sum
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][bisect.bisect_left(self.buckets, value)] += 1
+            state[1] += value
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        for key, (counts, total) in values.items():
+            labels = dict(zip(self.label_names, key))
+            cumulative = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(upper_bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    In-process metrics rendered in the Prometheus text exposition format.
+
+    Metrics are updated as requests run; collectors are callbacks that read values owned by other
+    objects (model registry, prediction cache) at scrape time and return them as
+    (name, type, documentation, [(labels, value), ...]). Every server worker process has its own
+    registry, so with several workers each one is scraped (or aggregated) separately.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names=()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names=()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names=(), buckets=METRICS_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def register_collector(self, collector):
+        with self._lock:
+            self._collectors.append(collector)
+
+    def render(self) -> str:
+        try:
+            with self._lock:
+                metrics, collectors = list(self._metrics), list(self._collectors)
+            lines = []
+            for metric in metrics:
+                lines.append(f"# HELP {metric.name} {metric.documentation}")
+                lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+                lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for name, labels, value in metric.samples())
+            for collector in collectors:
+                for name, metric_type, documentation, samples in collector():
+                    lines.append(f"# HELP {name} {documentation}")
+                    lines.append(f"# TYPE {name} {metric_type}")
+                    lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples if value is not None)
+            return "\n".join(lines) + "\n"
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+# shared by the app, the micro batcher and the model registry
+metrics_registry = MetricsRegistry()
+
+http_requests_in_flight = metrics_registry.gauge("http_requests_in_flight", "Requests currently being handled.", ["route"])
+http_requests_total = metrics_registry.counter("http_requests_total", "Handled requests.", ["route", "method", "status"])
+http_request_duration_seconds = metrics_registry.histogram("http_request_duration_seconds", "Time from receiving a request to sending the last byte of its response.", ["route"])
+prediction_phase_duration_seconds = metrics_registry.histogram(
+    "prediction_phase_duration_seconds",
+    "Time a prediction request spent in each phase: parse, batch_wait, preprocess, predict, render.",
+    ["route", "phase"],
+)
+prediction_request_rows = metrics_registry.histogram("prediction_request_rows", "Feature rows per prediction request.", ["route"], buckets=METRICS_ROWS_BUCKETS)
+prediction_batch_rows = metrics_registry.histogram("prediction_batch_rows", "Feature rows per model call of the micro batcher.", buckets=METRICS_ROWS_BUCKETS)
+prediction_batch_requests = metrics_registry.histogram("prediction_batch_requests", "Requests coalesced into one model call.", buckets=METRICS_ROWS_BUCKETS)
+
+
+def observe_phases(route: str, timings: dict):
+    for phase, seconds in timings.items():
+        prediction_phase_duration_seconds.observe(seconds, route=route, phase=phase)
+
+
+class RequestMetricsMiddleware:
+    """
+    Pure ASGI middleware recording in-flight requests, request counts and request durations per route.
+
+    The duration runs until the last http.response.body message (more_body false) is sent, so streamed
+    responses are timed to their end rather than to their headers. Requests are labelled by route
+    template ("/train/jobs/{job_id}"), not the raw path, to keep the label set small. The start time is
+    kept in the request state as started_at, for handlers that time their own phases from it.
+    """
+
+    def __init__(self, app, routes: list):
+        self.app = app
+        # the app's route list itself, so routes added after the middleware are matched too
+        self.routes = routes
+
+    def _route(self, scope) -> str:
+        for candidate in self.routes:
+            if candidate.matches(scope)[0] == Match.FULL:
+                return getattr(candidate, "path", "unmatched")
+        return "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        route = self._route(scope)
+        started_at = time.perf_counter()
+        scope.setdefault("state", {})["started_at"] = started_at
+        status_code = 500
+        finished = False
+        http_requests_in_flight.inc(route=route)
+
+        def finish():
+            nonlocal finished
+            if not finished:
+                finished = True
+                http_requests_in_flight.dec(route=route)
+                http_requests_total.inc(route=route, method=scope["method"], status=status_code)
+                http_request_duration_seconds.observe(time.perf_counter() - started_at, route=route)
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                finish()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # the app failed or the client went away before the response was complete
+            finish()
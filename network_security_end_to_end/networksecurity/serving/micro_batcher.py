@@ -0,0 +1,142 @@
+import sys
+import time
+import asyncio
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import PREDICTION_BATCH_MAX_ROWS, PREDICTION_BATCH_MAX_WAIT_MS
+from networksecurity.serving.metrics import prediction_batch_rows, prediction_batch_requests
+
+
+class PredictionBatcher:
+    """
+    Coalesces concurrent prediction requests into one vectorized NetworkModel.predict call.
+
+    Requests wait on an asyncio queue; the batching task takes the first one, keeps collecting for up
+    to max_wait_ms or until max_batch_rows rows are queued, then predicts each group of requests with
+    the same columns in one call on a worker thread and hands every request its slice of the result.
+    If a batch fails, its requests are retried one by one so a single bad request fails alone.
+
+    A request can pass a timings dict: it gets the seconds the request waited in the queue
+    ("batch_wait") and the preprocess/predict seconds of the model call that served it.
+    """
+
+    def __init__(self, get_model, max_batch_rows: int = PREDICTION_BATCH_MAX_ROWS,
+                 max_wait_ms: float = PREDICTION_BATCH_MAX_WAIT_MS):
+        try:
+            self.get_model = get_model
+            self.max_batch_rows = max_batch_rows
+            self.max_wait_seconds = max_wait_ms / 1000
+            self._queue: asyncio.Queue = None
+            self._task: asyncio.Task = None
+            self._executor: ThreadPoolExecutor = None
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            if self._executor is None:
+                # one thread: the next batch gathers on the event loop while the current one predicts
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prediction-batcher")
+            self._queue = asyncio.Queue()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def predict(self, features: pd.DataFrame, timings: dict = None) -> np.ndarray:
+        if self._task is None or self._task.done():
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future, timings, time.perf_counter()))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        batch = [await self._queue.get()]
+        batch_rows = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait_seconds
+        while batch_rows < self.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                request = await asyncio.wait_for(self._queue.get(), timeout=remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(request)
+            batch_rows += len(request[0])
+        return batch
+
+    @staticmethod
+    def _predict_group(network_model, frames: list, timings: dict = None) -> list:
+        features = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        predictions = np.asarray(network_model.predict(features, timings=timings))
+        prediction_batch_rows.observe(len(features))
+        prediction_batch_requests.observe(len(frames))
+        return np.split(predictions, np.cumsum([len(frame) for frame in frames])[:-1])
+
+    async def _predict_alone(self, loop, network_model, features: pd.DataFrame, timings: dict = None):
+        try:
+            model_timings = {}
+            result = (await loop.run_in_executor(self._executor, self._predict_group, network_model, [features], model_timings))[0]
+            if timings is not None:
+                timings.update(model_timings)
+            return result
+        except Exception as e:
+            return e
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            # take the model once per batch so every request in it sees the same version
+            try:
+                network_model = self.get_model()
+            except Exception as e:
+                for _, future, _, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            groups = {}
+            for request in batch:
+                groups.setdefault(tuple(request[0].columns), []).append(request)
+
+            for requests in groups.values():
+                frames = [features for features, _, _, _ in requests]
+                started = time.perf_counter()
+                for _, _, timings, enqueued_at in requests:
+                    if timings is not None:
+                        timings["batch_wait"] = started - enqueued_at
+                model_timings = {}
+                try:
+                    results = await loop.run_in_executor(self._executor, self._predict_group, network_model, frames, model_timings)
+                    for _, _, timings, _ in requests:
+                        if timings is not None:
+                            timings.update(model_timings)
+                except Exception as e:
+                    results = [e]
+                    if len(requests) > 1:
+                        logging.warning(f"Batched prediction of {len(requests)} requests failed, retrying them one by one: {e}")
+                        results = [await self._predict_alone(loop, network_model, features, timings) for features, _, timings, _ in requests]
+
+                for (_, future, _, _), result in zip(requests, results):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+            logging.debug(f"Predicted a batch of {len(batch)} requests in {len(groups)} groups")
@@ -0,0 +1,171 @@
+import os
+import sys
+import time
+import hashlib
+import threading
+from datetime import datetime
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import (
+    FINAL_PREPROCESSOR_FILE_PATH,
+    FINAL_MODEL_FILE_PATH,
+    FINAL_MODEL_BUNDLE_FILE_PATH,
+    MODEL_REGISTRY_POLL_INTERVAL_SECONDS,
+)
+from networksecurity.utils.main_utils.utils import load_object
+from networksecurity.utils.main_utils.model_bundle import load_model_bundle
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+from networksecurity.serving.prediction_cache import PredictionCache, CachedNetworkModel
+
+
+class ModelRegistry:
+    """
+    Keeps the deployed NetworkModel in memory so requests don't unpickle it every time.
+
+    A background watcher polls the final model files; when their mtime/size changes and the
+    content hash differs from the loaded version, the new model is loaded off to the side and
+    swapped in under a lock. A failed load keeps serving the previous model.
+
+    When a model bundle is deployed it is preferred over the pickled preprocessor/model pair, and
+    its arrays are memory-mapped so every server worker shares the same pages.
+
+    With a prediction_cache, get_model() returns the model wrapped so predictions go through the
+    cache under the model's version, and every swap invalidates the cached predictions.
+    """
+
+    def __init__(self, preprocessor_file_path: str = FINAL_PREPROCESSOR_FILE_PATH,
+                 model_file_path: str = FINAL_MODEL_FILE_PATH,
+                 bundle_file_path: str = FINAL_MODEL_BUNDLE_FILE_PATH,
+                 poll_interval: float = MODEL_REGISTRY_POLL_INTERVAL_SECONDS,
+                 prediction_cache: PredictionCache = None):
+        try:
+            self.preprocessor_file_path = preprocessor_file_path
+            self.model_file_path = model_file_path
+            self.bundle_file_path = bundle_file_path
+            self.poll_interval = poll_interval
+            self.prediction_cache = prediction_cache
+
+            self.version: int = 0
+            self.content_hash: str = None
+            self.loaded_at: datetime = None
+            self.load_seconds: float = None
+            self.load_failures: int = 0
+
+            self._network_model: NetworkModel = None
+            self._file_signature = None
+            self._pending_signature = None
+            self._lock = threading.Lock()
+            self._load_lock = threading.Lock()
+            self._stop_event = threading.Event()
+            self._watcher: threading.Thread = None
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @property
+    def is_ready(self) -> bool:
+        return self._network_model is not None
+
+    def _get_model_files(self) -> tuple:
+        if self.bundle_file_path and os.path.exists(self.bundle_file_path):
+            return (self.bundle_file_path,)
+        return (self.preprocessor_file_path, self.model_file_path)
+
+    def _get_file_signature(self):
+        signature = []
+        for file_path in self._get_model_files():
+            if not os.path.exists(file_path):
+                return None
+            stat = os.stat(file_path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _get_content_hash(self) -> str:
+        sha256 = hashlib.sha256()
+        for file_path in self._get_model_files():
+            with open(file_path, "rb") as file_obj:
+                for block in iter(lambda: file_obj.read(1024 * 1024), b""):
+                    sha256.update(block)
+        return sha256.hexdigest()
+
+    def load(self, force: bool = False) -> bool:
+        """Loads the model files if they changed since the last load. Returns True when a new model was swapped in."""
+        try:
+            with self._load_lock:
+                signature = self._get_file_signature()
+                if signature is None:
+                    raise Exception(f"Model files not found at {self.preprocessor_file_path} and {self.model_file_path}. Ensure they're trained and deployed.")
+                if not force and signature == self._file_signature:
+                    return False
+
+                content_hash = self._get_content_hash()
+                if not force and content_hash == self.content_hash:
+                    self._file_signature = signature
+                    return False
+
+                started = time.perf_counter()
+                model_files = self._get_model_files()
+                logging.info(f"Loading model files {model_files} (hash: {content_hash[:12]})")
+                if model_files == (self.bundle_file_path,):
+                    network_model = load_model_bundle(self.bundle_file_path)
+                else:
+                    network_model = NetworkModel(preprocessor=load_object(self.preprocessor_file_path), model=load_object(self.model_file_path))
+
+                with self._lock:
+                    if self.prediction_cache is not None:
+                        self.prediction_cache.invalidate(self.version + 1)
+                        network_model = CachedNetworkModel(network_model, self.prediction_cache, self.version + 1)
+                    self._network_model = network_model
+                    self._file_signature = signature
+                    self.content_hash = content_hash
+                    self.version += 1
+                    self.loaded_at = datetime.now()
+                    self.load_seconds = time.perf_counter() - started
+
+                logging.info(f"Model registry swapped in model version {self.version} (loaded in {self.load_seconds:.3f}s)")
+                return True
+        except Exception as e:
+            self.load_failures += 1
+            raise NetworkSecurityException(e, sys)
+
+    def get_model(self) -> NetworkModel:
+        with self._lock:
+            network_model = self._network_model
+        if network_model is None:
+            raise Exception("No model is loaded in the model registry. Ensure it's trained and deployed.")
+        return network_model
+
+    def _watch(self):
+        while not self._stop_event.wait(self.poll_interval):
+            try:
+                signature = self._get_file_signature()
+                if signature is None or signature == self._file_signature:
+                    self._pending_signature = None
+                    continue
+
+                # wait for the files to settle for one poll so a half written model pair isn't picked up
+                if signature != self._pending_signature:
+                    self._pending_signature = signature
+                    continue
+
+                self._pending_signature = None
+                self.load()
+            except Exception as e:
+                logging.error(f"Model registry failed to reload model, keeping version {self.version}: {e}", exc_info=True)
+
+    def start_watching(self):
+        try:
+            if self._watcher is not None and self._watcher.is_alive():
+                return
+            self._stop_event.clear()
+            self._watcher = threading.Thread(target=self._watch, name="model-registry-watcher", daemon=True)
+            self._watcher.start()
+            logging.info(f"Model registry watching model files every {self.poll_interval} seconds")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def stop_watching(self):
+        self._stop_event.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=self.poll_interval)
+            self._watcher = None
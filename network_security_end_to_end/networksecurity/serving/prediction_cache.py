@@ -0,0 +1,189 @@
+import sys
+import time
+import threading
+import numpy as np
+import pandas as pd
+from collections import OrderedDict
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import (
+    TARGET_COLUMN, SCHEMA_FILE_PATH, PREDICTION_CACHE_MAX_ENTRIES, PREDICTION_CACHE_TTL_SECONDS,
+)
+from networksecurity.utils.main_utils.utils import read_yaml_file
+from networksecurity.utils.main_utils.schema_validator import get_column_rules
+
+
+class PredictionCache:
+    """
+    LRU cache of per-row predictions with a TTL, in front of NetworkModel.predict.
+
+    Every phishing feature takes one of a few allowed values (-1, 0, 1), so a complete row packs
+    into a single int64 as a base-3 number; wider rows fall back to the row's bytes. Entries are
+    keyed on the packed row and belong to one model version: a newer version drops them all, and
+    predictions made by an older model are never stored. Within a batch, rows that miss are
+    predicted once per distinct row. Rows with nulls or values outside the allowed range, and
+    frames whose columns are not in schema order, bypass the cache.
+    """
+
+    def __init__(self, schema_file_path: str = SCHEMA_FILE_PATH, max_entries: int = PREDICTION_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = PREDICTION_CACHE_TTL_SECONDS):
+        try:
+            schema_config = read_yaml_file(schema_file_path)
+            column_rules = get_column_rules(schema_config)
+            self.feature_columns = [column for column in schema_config["COLUMNS"] if column != TARGET_COLUMN]
+            self.max_entries = max_entries
+            self.ttl_seconds = ttl_seconds
+
+            allowed_values = [column_rules[column]["allowed_values"] for column in self.feature_columns]
+            self.enabled = bool(self.feature_columns) and all(allowed_values)
+            self.min_value, self.max_value, self._powers = 0, 0, None
+            if self.enabled:
+                self.min_value = min(min(values) for values in allowed_values)
+                self.max_value = max(max(values) for values in allowed_values)
+                base = self.max_value - self.min_value + 1
+                if base ** len(self.feature_columns) < 2 ** 63:
+                    self._powers = base ** np.arange(len(self.feature_columns), dtype=np.int64)
+            else:
+                logging.warning("Prediction cache disabled: every feature column needs allowed_values in the schema.")
+
+            self.model_version: int = None
+            self._entries = OrderedDict()
+            self._dtype = None
+            self._lock = threading.Lock()
+            self.hits = self.misses = self.uncacheable = 0
+            self.evictions = self.expirations = self.invalidations = 0
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def invalidate(self, model_version: int):
+        """Drops every entry and only accepts predictions of model_version (or newer) from now on."""
+        with self._lock:
+            self._invalidate(model_version)
+
+    def _invalidate(self, model_version: int):
+        if self._entries:
+            self.invalidations += 1
+            logging.info(f"Prediction cache dropped {len(self._entries)} entries of model version {self.model_version}")
+        self._entries.clear()
+        self._dtype = None
+        self.model_version = model_version
+
+    def _row_keys(self, features: pd.DataFrame):
+        values = features.to_numpy()
+        if values.dtype.kind not in "biuf":
+            values = values.astype(np.float64)
+        with np.errstate(invalid="ignore"):
+            cacheable = ((values == np.round(values)) & (values >= self.min_value) & (values <= self.max_value)).all(axis=1)
+        digits = values[cacheable].astype(np.int64) - self.min_value
+        if self._powers is not None:
+            return cacheable, (digits @ self._powers).tolist()
+        return cacheable, [row.tobytes() for row in digits]
+
+    def _lookup(self, keys: list, now: float) -> list:
+        cached = []
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                cached.append(None)
+            else:
+                self._entries.move_to_end(key)
+                cached.append(entry[0])
+        return cached
+
+    def _store(self, items, now: float):
+        expires_at = now + self.ttl_seconds
+        for key, prediction in items:
+            self._entries[key] = (prediction, expires_at)
+            self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def predict(self, network_model, features, model_version: int, timings: dict = None) -> np.ndarray:
+        """timings, if given, is passed on to NetworkModel.predict for the rows that are not cached."""
+        try:
+            n_rows = len(features)
+            if not self.enabled or not isinstance(features, pd.DataFrame) or list(features.columns) != self.feature_columns:
+                with self._lock:
+                    self.uncacheable += n_rows
+                return np.asarray(network_model.predict(features, timings=timings))
+
+            cacheable, keys = self._row_keys(features)
+            cacheable_rows = np.flatnonzero(cacheable)
+            now = time.monotonic()
+            with self._lock:
+                if self.model_version is None or model_version > self.model_version:
+                    self._invalidate(model_version)
+                # a batch still running on a swapped-out model neither reads nor fills the cache
+                current = model_version == self.model_version
+                cached = self._lookup(keys, now) if current else [None] * len(keys)
+                dtype = self._dtype
+
+            # rows to run through the model: uncacheable ones, plus the first occurrence of each missed key
+            first_rows = {}
+            for row, key, prediction in zip(cacheable_rows.tolist(), keys, cached):
+                if prediction is None and key not in first_rows:
+                    first_rows[key] = row
+            predict_rows = np.sort(np.concatenate([np.flatnonzero(~cacheable), np.fromiter(first_rows.values(), dtype=np.intp, count=len(first_rows))]))
+            n_hits = sum(prediction is not None for prediction in cached)
+
+            output = None
+            if len(predict_rows):
+                # all rows distinct misses: predict the frame as is, without copying it
+                predictions = np.asarray(network_model.predict(features if len(predict_rows) == n_rows else features.iloc[predict_rows], timings=timings))
+                dtype = predictions.dtype
+                output = predictions if len(predict_rows) == n_rows else np.empty(n_rows, dtype=dtype)
+                output[predict_rows] = predictions
+            if output is None:
+                output = np.empty(n_rows, dtype=dtype)
+
+            missed = dict(zip(first_rows, output[list(first_rows.values())].tolist()))
+            output[cacheable_rows] = [missed[key] if prediction is None else prediction for key, prediction in zip(keys, cached)]
+
+            with self._lock:
+                if current and model_version == self.model_version:
+                    self._store(missed.items(), now)
+                    self._dtype = dtype
+                self.hits += n_hits
+                self.misses += len(keys) - n_hits
+                self.uncacheable += n_rows - len(keys)
+            return output
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "model_version": self.model_version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "uncacheable": self.uncacheable,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class CachedNetworkModel:
+    """Stands in for one loaded NetworkModel version; predict() goes through the shared PredictionCache."""
+
+    def __init__(self, network_model, prediction_cache: PredictionCache, model_version: int):
+        self.network_model = network_model
+        self.prediction_cache = prediction_cache
+        self.model_version = model_version
+
+    def predict(self, x, timings: dict = None):
+        return self.prediction_cache.predict(self.network_model, x, self.model_version, timings=timings)
+
+    def __getattr__(self, name):
+        return getattr(self.network_model, name)
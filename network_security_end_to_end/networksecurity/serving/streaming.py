@@ -0,0 +1,95 @@
+import sys
+import queue
+import threading
+import pandas as pd
+from typing import Iterator
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import TARGET_COLUMN, PREDICTION_STREAM_CHUNK_SIZE, PREDICTION_STREAM_PREFETCH_CHUNKS
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+
+STREAM_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+_END_OF_STREAM = object()
+
+
+def prefetch_chunks(chunks: Iterator[pd.DataFrame], max_prefetch: int = PREDICTION_STREAM_PREFETCH_CHUNKS) -> Iterator[pd.DataFrame]:
+    """Parses the next CSV chunks on a background thread while the current one is being predicted."""
+    buffer = queue.Queue(maxsize=max_prefetch)
+    stop_event = threading.Event()
+
+    def put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def reader():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as e:
+            put(e)
+        put(_END_OF_STREAM)
+
+    threading.Thread(target=reader, name="prediction-stream-reader", daemon=True).start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _END_OF_STREAM:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # lets the reader exit if the client went away mid-stream
+        stop_event.set()
+
+
+def predict_chunk(network_model: NetworkModel, chunk: pd.DataFrame) -> pd.DataFrame:
+    features = chunk.drop(columns=[TARGET_COLUMN]) if TARGET_COLUMN in chunk.columns else chunk
+    chunk["predicted_column"] = network_model.predict(features)
+    return chunk
+
+
+def format_chunk(chunk: pd.DataFrame, output_format: str, include_header: bool) -> str:
+    if output_format == "csv":
+        return chunk.to_csv(index=False, header=include_header)
+    records = chunk.to_json(orient="records", lines=True)
+    return records if records.endswith("\n") else records + "\n"
+
+
+def stream_predictions(file_obj, network_model: NetworkModel, output_format: str = "csv",
+                       chunk_size: int = PREDICTION_STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads a CSV upload in chunks and yields the predicted rows chunk by chunk as CSV or NDJSON.
+
+    The first chunk is parsed before returning so an unreadable file fails the request up front
+    instead of breaking the stream after the response has started.
+    """
+    try:
+        if output_format not in STREAM_MEDIA_TYPES:
+            raise ValueError(f"Unsupported output format: {output_format}. Supported formats: {list(STREAM_MEDIA_TYPES)}")
+
+        chunks = pd.read_csv(file_obj, chunksize=chunk_size)
+        first_chunk = next(chunks)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+    def stream():
+        total_rows = len(first_chunk)
+        yield format_chunk(predict_chunk(network_model, first_chunk), output_format, include_header=True)
+        for chunk in prefetch_chunks(chunks):
+            yield format_chunk(predict_chunk(network_model, chunk), output_format, include_header=False)
+            total_rows += len(chunk)
+        logging.info(f"Streamed predictions for {total_rows} rows as {output_format}")
+
+    return stream()
@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import uuid
+import threading
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import TRAINING_JOB_DIR
+
+PIPELINE_STAGES = ("data_ingestion", "data_validation", "data_transformation", "model_trainer", "s3_sync")
+
+
+class JobAlreadyRunning(Exception):
+    def __init__(self, job_id: str):
+        super().__init__(f"Training job {job_id} is already running.")
+        self.job_id = job_id
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def _write_status(status_file_path: str, status: dict):
+    tmp_status_file_path = f"{status_file_path}.tmp"
+    with open(tmp_status_file_path, "w") as file_obj:
+        json.dump(status, file_obj)
+    os.replace(tmp_status_file_path, status_file_path)
+
+
+def _run_training_job(status: dict, status_file_path: str) -> dict:
+    # runs in the worker process; progress goes through the status file so the server can read it at any time
+    from networksecurity.pipeline.training_pipeline import TrainingPipeline
+
+    def on_stage(stage_name):
+        if status["stage"] in PIPELINE_STAGES:
+            status["stages_completed"] = PIPELINE_STAGES.index(status["stage"]) + 1
+        status["stage"] = stage_name
+        _write_status(status_file_path, status)
+
+    status.update(status="running", started_at=_now(), worker_pid=os.getpid())
+    _write_status(status_file_path, status)
+    try:
+        TrainingPipeline().run_pipeline(progress_callback=on_stage)
+        status.update(status="succeeded", stages_completed=len(PIPELINE_STAGES))
+    except Exception as e:
+        # only plain data crosses back to the server, the exception itself may not pickle
+        status.update(status="failed", error=str(e))
+    status.update(stage=None, finished_at=_now())
+    _write_status(status_file_path, status)
+    return status
+
+
+class TrainingJobManager:
+    """
+    Runs the training pipeline in a separate process so the API keeps serving while a model trains.
+
+    Only one job runs at a time. Each job's state lives in a JSON status file that the worker process
+    updates at every stage, and on_success is called in the server once a job finishes successfully
+    (the app uses it to swap the new model into the registry).
+    """
+
+    def __init__(self, job_dir: str = TRAINING_JOB_DIR, on_success=None):
+        try:
+            self.job_dir = job_dir
+            self.on_success = on_success
+            self._executor: ProcessPoolExecutor = None
+            self._active_job_id: str = None
+            self._lock = threading.Lock()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _status_file_path(self, job_id: str) -> str:
+        return os.path.join(self.job_dir, f"{job_id}.json")
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn keeps the server's threads, sockets and Mongo client out of the training process
+            self._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+
+    @property
+    def active_job_id(self):
+        return self._active_job_id
+
+    def submit(self) -> dict:
+        """Starts a training job and returns its status, or raises if one is already running."""
+        try:
+            with self._lock:
+                if self._active_job_id is not None:
+                    raise JobAlreadyRunning(self._active_job_id)
+                os.makedirs(self.job_dir, exist_ok=True)
+                job_id = uuid.uuid4().hex[:12]
+                status = {
+                    "job_id": job_id,
+                    "status": "queued",
+                    "stage": None,
+                    "stages_completed": 0,
+                    "total_stages": len(PIPELINE_STAGES),
+                    "submitted_at": _now(),
+                    "started_at": None,
+                    "finished_at": None,
+                    "error": None,
+                }
+                status_file_path = self._status_file_path(job_id)
+                _write_status(status_file_path, status)
+                future = self._get_executor().submit(_run_training_job, status, status_file_path)
+                self._active_job_id = job_id
+
+            future.add_done_callback(lambda done: self._on_job_done(job_id, done))
+            logging.info(f"Submitted training job {job_id}")
+            return status
+        except JobAlreadyRunning:
+            raise
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _on_job_done(self, job_id: str, future):
+        with self._lock:
+            self._active_job_id = None
+        try:
+            status = future.result()
+        except Exception as e:
+            # the worker process died (e.g. killed for memory) before it could record the failure
+            status = self.get_status(job_id) or {"job_id": job_id}
+            status.update(status="failed", error=f"Training process exited unexpectedly: {e}", finished_at=_now())
+            _write_status(self._status_file_path(job_id), status)
+
+        logging.info(f"Training job {job_id} finished with status {status['status']}")
+        if status["status"] == "succeeded" and self.on_success is not None:
+            try:
+                self.on_success(status)
+            except Exception as e:
+                logging.error(f"Post-training hook failed for job {job_id}: {e}", exc_info=True)
+
+    def get_status(self, job_id: str):
+        status_file_path = self._status_file_path(job_id)
+        if not os.path.exists(status_file_path):
+            return None
+        with open(status_file_path) as file_obj:
+            return json.load(file_obj)
+
+    def list_jobs(self) -> list:
+        if not os.path.isdir(self.job_dir):
+            return []
+        jobs = [
+            self.get_status(file_name[:-len(".json")])
+            for file_name in os.listdir(self.job_dir) if file_name.endswith(".json")
+        ]
+        return sorted(jobs, key=lambda job: job["submitted_at"], reverse=True)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,138 @@
+import os
+import sys
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import SCHEMA_FILE_PATH, ARTIFACT_STORAGE_FORMAT, COMPACT_FEATURE_DTYPES
+from networksecurity.utils.main_utils.utils import read_yaml_file
+from networksecurity.utils.main_utils.schema_validator import get_column_rules
+
+
+class ArtifactStorage(ABC):
+    """Reads and writes the tabular pipeline artifacts (feature store, train/test splits) with schema dtypes."""
+
+    file_format: str = None
+
+    def __init__(self, column_dtypes: dict = None):
+        self.column_dtypes = column_dtypes or {}
+
+    def apply_dtypes(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        dtypes = {column: dtype for column, dtype in self.column_dtypes.items() if column in dataframe.columns and dataframe[column].dtype != dtype}
+        if not dtypes:
+            return dataframe
+        return dataframe.astype(dtypes)
+
+    @abstractmethod
+    def _write(self, dataframe: pd.DataFrame, file_path: str):
+        ...
+
+    @abstractmethod
+    def _read(self, file_path: str, apply_dtypes: bool = True) -> pd.DataFrame:
+        ...
+
+    def write(self, dataframe: pd.DataFrame, file_path: str) -> str:
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._write(self.apply_dtypes(dataframe), file_path)
+            logging.info(f"Wrote {len(dataframe)} rows as {self.file_format} to {file_path}")
+            return file_path
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def read(self, file_path: str, apply_dtypes: bool = True) -> pd.DataFrame:
+        try:
+            dataframe = self._read(file_path, apply_dtypes)
+            return self.apply_dtypes(dataframe) if apply_dtypes else dataframe
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+class CsvArtifactStorage(ArtifactStorage):
+    file_format = "csv"
+
+    def _write(self, dataframe: pd.DataFrame, file_path: str):
+        dataframe.to_csv(file_path, index=False, header=True)
+
+    def _read(self, file_path: str, apply_dtypes: bool = True) -> pd.DataFrame:
+        # parsing straight into the schema dtypes raises on values that do not fit, so only when casting is wanted
+        return pd.read_csv(file_path, dtype=(self.column_dtypes or None) if apply_dtypes else None)
+
+
+class ParquetArtifactStorage(ArtifactStorage):
+    file_format = "parquet"
+
+    def _write(self, dataframe: pd.DataFrame, file_path: str):
+        dataframe.to_parquet(file_path, index=False)
+
+    def _read(self, file_path: str, apply_dtypes: bool = True) -> pd.DataFrame:
+        return pd.read_parquet(file_path)
+
+
+class FeatherArtifactStorage(ArtifactStorage):
+    file_format = "feather"
+
+    def _write(self, dataframe: pd.DataFrame, file_path: str):
+        # feather only stores a default index
+        dataframe.reset_index(drop=True).to_feather(file_path)
+
+    def _read(self, file_path: str, apply_dtypes: bool = True) -> pd.DataFrame:
+        return pd.read_feather(file_path)
+
+
+ARTIFACT_STORAGES = {
+    storage.file_format: storage
+    for storage in (CsvArtifactStorage, ParquetArtifactStorage, FeatherArtifactStorage)
+}
+
+
+def compact_dtype(dtype: np.dtype, allowed_values) -> np.dtype:
+    """Smallest integer dtype holding every allowed value of an integer column, e.g. int8 for {-1, 0, 1}."""
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "iu" or not allowed_values:
+        return dtype
+    low, high = min(allowed_values), max(allowed_values)
+    for candidate in (np.int8, np.int16, np.int32):
+        if np.iinfo(candidate).min <= low and high <= np.iinfo(candidate).max and np.dtype(candidate).itemsize < dtype.itemsize:
+            return np.dtype(candidate)
+    return dtype
+
+
+def fits_integer_dtype(values: np.ndarray, dtype: np.dtype) -> bool:
+    """True if every value is an integer within the range of dtype, so casting loses nothing (NaN never fits)."""
+    limits = np.iinfo(dtype)
+    with np.errstate(invalid="ignore"):
+        return bool(np.all(values == np.round(values)) and np.all((values >= limits.min) & (values <= limits.max)))
+
+
+def get_schema_dtypes(schema_file_path: str = SCHEMA_FILE_PATH, compact: bool = COMPACT_FEATURE_DTYPES) -> dict:
+    try:
+        schema_config = read_yaml_file(schema_file_path)
+        column_dtypes = {column: np.dtype(dtype) for column, dtype in schema_config["COLUMNS"].items()}
+        if compact:
+            # safe because validation rejects values outside allowed_values before anything is cast
+            column_rules = get_column_rules(schema_config)
+            column_dtypes = {column: compact_dtype(dtype, column_rules[column]["allowed_values"]) for column, dtype in column_dtypes.items()}
+        return column_dtypes
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def get_artifact_storage(file_format: str = ARTIFACT_STORAGE_FORMAT, schema_file_path: str = SCHEMA_FILE_PATH) -> ArtifactStorage:
+    try:
+        if file_format not in ARTIFACT_STORAGES:
+            raise Exception(f"Unsupported artifact format: {file_format}. Supported formats: {list(ARTIFACT_STORAGES)}")
+        return ARTIFACT_STORAGES[file_format](column_dtypes=get_schema_dtypes(schema_file_path))
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def get_artifact_storage_for_path(file_path: str, schema_file_path: str = SCHEMA_FILE_PATH) -> ArtifactStorage:
+    file_format = os.path.splitext(file_path)[1].lstrip(".").lower()
+    return get_artifact_storage(file_format=file_format, schema_file_path=schema_file_path)
+
+
+def with_artifact_extension(file_name: str, file_format: str) -> str:
+    return f"{os.path.splitext(file_name)[0]}.{file_format}"
@@ -0,0 +1,102 @@
+import os
+import sys
+import json
+import mmap
+import pickle
+import struct
+from datetime import datetime
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+
+BUNDLE_MAGIC: bytes = b"NSMBNDL\x00"
+BUNDLE_FORMAT_VERSION: int = 1
+BUNDLE_ALIGNMENT: int = 64
+# magic, format version, header length
+_PREAMBLE = struct.Struct("<8sIQ")
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // BUNDLE_ALIGNMENT) * BUNDLE_ALIGNMENT
+
+
+def save_model_bundle(file_path: str, obj: object, metadata: dict = None) -> None:
+    """
+    Writes obj as a model bundle: a JSON header, the pickle stream, then every NumPy buffer out-of-band.
+
+    Pickle protocol 5 hands contiguous arrays (tree node arrays, imputer training matrix, ...) to
+    buffer_callback instead of copying them into the stream, so they are laid out raw and 64-byte
+    aligned after it and can be memory-mapped back by load_model_bundle.
+    """
+    try:
+        buffers = []
+        payload = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        raw_buffers = [buffer.raw() for buffer in buffers]
+
+        # section offsets are relative to the data section, which starts aligned right after the header
+        offset, sections = 0, []
+        for data in [memoryview(payload)] + raw_buffers:
+            sections.append([offset, data.nbytes])
+            offset = _aligned(offset + data.nbytes)
+        header = json.dumps({
+            "format_version": BUNDLE_FORMAT_VERSION,
+            "pickle_protocol": 5,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "metadata": metadata or {},
+            "pickle": sections[0],
+            "buffers": sections[1:],
+        }).encode()
+        data_start = _aligned(_PREAMBLE.size + len(header))
+
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_file_path = f"{file_path}.tmp"
+        with open(tmp_file_path, "wb") as file_obj:
+            file_obj.write(_PREAMBLE.pack(BUNDLE_MAGIC, BUNDLE_FORMAT_VERSION, len(header)))
+            file_obj.write(header)
+            for (offset, _), data in zip(sections, [memoryview(payload)] + raw_buffers):
+                file_obj.write(b"\x00" * (data_start + offset - file_obj.tell()))
+                file_obj.write(data)
+        # rename instead of overwriting in place, so processes still mapping the old bundle keep valid pages
+        os.replace(tmp_file_path, file_path)
+        logging.info(f"Saved model bundle {file_path} with {len(raw_buffers)} out-of-band buffers")
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def _read_header(file_obj, file_path: str):
+    magic, format_version, header_length = _PREAMBLE.unpack(file_obj.read(_PREAMBLE.size))
+    if magic != BUNDLE_MAGIC:
+        raise Exception(f"{file_path} is not a model bundle")
+    if format_version > BUNDLE_FORMAT_VERSION:
+        raise Exception(f"Model bundle {file_path} has format version {format_version}, this build reads up to {BUNDLE_FORMAT_VERSION}")
+    return json.loads(file_obj.read(header_length)), _aligned(_PREAMBLE.size + header_length)
+
+
+def read_model_bundle_header(file_path: str) -> dict:
+    try:
+        with open(file_path, "rb") as file_obj:
+            return _read_header(file_obj, file_path)[0]
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def load_model_bundle(file_path: str, mmap_mode: bool = True) -> object:
+    """
+    Loads a model bundle. With mmap_mode the NumPy buffers are read-only views of a shared file
+    mapping, so every process serving the same bundle shares its pages instead of holding a copy.
+    """
+    try:
+        with open(file_path, "rb") as file_obj:
+            header, data_start = _read_header(file_obj, file_path)
+            if mmap_mode:
+                # the mapping stays alive as long as an array still references it
+                data = memoryview(mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ))
+            else:
+                file_obj.seek(0)
+                data = memoryview(bytearray(file_obj.read()))
+
+        pickle_offset, pickle_length = header["pickle"]
+        buffers = [data[data_start + offset:data_start + offset + length] for offset, length in header["buffers"]]
+        return pickle.loads(data[data_start + pickle_offset:data_start + pickle_offset + pickle_length], buffers=buffers)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -0,0 +1,123 @@
+import os
+import sys
+import time
+import yaml
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+def _cpu_seconds() -> float:
+    # includes worker processes that already exited (e.g. a closed ProcessPoolExecutor), not long-lived pools
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes everywhere else
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+@dataclass
+class ProfileRecord:
+    name: str
+    wall_seconds: float = None
+    cpu_seconds: float = None
+    peak_rss_mb: float = None
+    rows: int = None
+
+
+class PipelineProfiler:
+    """
+    Collects wall time, CPU time, peak RSS and row counts for pipeline stages and their sub-steps.
+
+    Blocks opened with profile() nest, so a sub-step opened inside a stage is recorded as
+    "stage/sub_step". Peak RSS is the process high-water mark at the end of the block. A block that
+    does not set its own row count reports the largest row count of its direct children.
+    """
+
+    def __init__(self):
+        self.records = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def reset(self):
+        with self._lock:
+            self.records = []
+
+    @contextmanager
+    def profile(self, name: str, rows: int = None):
+        stack = self._stack()
+        record = ProfileRecord(name=f"{stack[-1].name}/{name}" if stack else name, rows=rows)
+        with self._lock:
+            # appended up front so the report lists blocks in the order they started
+            self.records.append(record)
+        stack.append(record)
+        start_wall, start_cpu = time.perf_counter(), _cpu_seconds()
+        try:
+            yield record
+        finally:
+            stack.pop()
+            record.wall_seconds = time.perf_counter() - start_wall
+            record.cpu_seconds = _cpu_seconds() - start_cpu
+            record.peak_rss_mb = _peak_rss_mb()
+            if record.rows is None:
+                child_rows = [
+                    child.rows for child in self.records
+                    if child.rows is not None and child.name.rsplit("/", 1)[0] == record.name and child is not record
+                ]
+                record.rows = max(child_rows) if child_rows else None
+            logging.info(f"Profiled {record.name}: {record.wall_seconds:.3f}s wall, {record.cpu_seconds:.3f}s cpu, rows={record.rows}")
+
+    def record(self, name: str, wall_seconds: float, cpu_seconds: float = None, rows: int = None):
+        """Adds a timing measured elsewhere (e.g. summed fit times of one model family in a shared pool)."""
+        stack = self._stack()
+        record = ProfileRecord(
+            name=f"{stack[-1].name}/{name}" if stack else name,
+            wall_seconds=wall_seconds, cpu_seconds=cpu_seconds, rows=rows,
+        )
+        with self._lock:
+            self.records.append(record)
+
+    def to_report(self) -> dict:
+        with self._lock:
+            return {record.name: {key: value for key, value in asdict(record).items() if key != "name"} for record in self.records}
+
+    def write_report(self, file_path: str):
+        try:
+            # written directly rather than through main_utils.utils, which imports this module
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "w") as file_obj:
+                yaml.dump(self.to_report(), file_obj, sort_keys=False)
+            logging.info(f"Pipeline profile report written to {file_path}")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def log_to_mlflow(self):
+        import mlflow
+
+        for name, values in self.to_report().items():
+            metric_prefix = "profile/" + name.lower().replace(" ", "_")
+            for key, value in values.items():
+                if value is not None:
+                    mlflow.log_metric(f"{metric_prefix}/{key}", value)
+
+
+# shared by the pipeline and its components
+pipeline_profiler = PipelineProfiler()
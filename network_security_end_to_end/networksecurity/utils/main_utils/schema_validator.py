@@ -0,0 +1,172 @@
+import sys
+import numpy as np
+import pandas as pd
+from typing import Mapping
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utils.main_utils.utils import read_yaml_file
+
+DEFAULT_COLUMN_RULES: dict = {"allowed_values": None, "max_null_ratio": 0.0, "max_invalid_ratio": 0.0}
+
+
+def get_column_rules(schema_config: dict) -> dict:
+    """Validation rules per schema column: the 'default' entry of the 'validation' section merged with the column's overrides."""
+    validation_config = schema_config.get("validation") or {}
+    default_rules = {**DEFAULT_COLUMN_RULES, **(validation_config.get("default") or {})}
+    column_overrides = validation_config.get("columns") or {}
+    return {column: {**default_rules, **(column_overrides.get(column) or {})} for column in schema_config["COLUMNS"]}
+
+
+class SchemaValidator:
+    """
+    Checks every schema column for dtype, allowed values and null ratio in a single pass over chunks.
+
+    Each chunk is copied once into a (rows, columns) float64 block; nulls, non-integer values in
+    integer columns and values outside the allowed set are then counted for all columns at once,
+    with one np.isin call per distinct allowed-value set. Counts accumulate across update() calls,
+    so a dataset can be validated batch by batch as it is read. Rules come from the 'validation'
+    section of schema.yaml: a 'default' entry plus optional per-column overrides.
+    """
+
+    def __init__(self, schema_config: dict):
+        try:
+            self.column_dtypes = {column: np.dtype(dtype) for column, dtype in schema_config["COLUMNS"].items()}
+            self.columns = list(self.column_dtypes)
+            self.rules = get_column_rules(schema_config)
+
+            # columns sharing an allowed-value set are checked with one np.isin call
+            self._domain_groups = {}
+            for index, column in enumerate(self.columns):
+                allowed_values = self.rules[column]["allowed_values"]
+                if allowed_values is not None:
+                    self._domain_groups.setdefault(tuple(sorted(allowed_values)), []).append(index)
+            self._integer_columns = np.array([self.column_dtypes[column].kind in "iu" for column in self.columns])
+            self.reset()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @classmethod
+    def from_schema_file(cls, schema_file_path: str = SCHEMA_FILE_PATH) -> "SchemaValidator":
+        return cls(read_yaml_file(schema_file_path))
+
+    def reset(self):
+        n_columns = len(self.columns)
+        self.rows = 0
+        self.missing_columns = set()
+        self.unexpected_columns = set()
+        self.observed_dtypes = {}
+        self.null_counts = np.zeros(n_columns, dtype=np.int64)
+        self.non_numeric_counts = np.zeros(n_columns, dtype=np.int64)
+        self.non_integer_counts = np.zeros(n_columns, dtype=np.int64)
+        self.out_of_domain_counts = np.zeros(n_columns, dtype=np.int64)
+
+    def _column_block(self, columns: Mapping[str, np.ndarray], n_rows: int):
+        block = np.full((n_rows, len(self.columns)), np.nan)
+        non_numeric = np.zeros(len(self.columns), dtype=np.int64)
+        for index, column in enumerate(self.columns):
+            if column not in columns:
+                continue
+            values = np.asarray(columns[column])
+            self.observed_dtypes.setdefault(column, str(values.dtype))
+            if values.dtype.kind in "biuf":
+                block[:, index] = values
+            else:
+                # strings and mixed objects: anything that does not parse as a number is counted as non-numeric
+                parsed = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+                non_numeric[index] = np.count_nonzero(np.isnan(parsed) & ~pd.isna(values))
+                block[:, index] = parsed
+        return block, non_numeric
+
+    def update(self, columns: Mapping[str, np.ndarray], non_numeric_counts: Mapping[str, int] = None):
+        """
+        Adds one chunk, given as column name -> 1-D array, to the running counts.
+
+        non_numeric_counts is for callers that already converted the chunk to floats: per column, how
+        many of its NaNs were values that did not parse as numbers rather than missing values.
+        """
+        try:
+            self.unexpected_columns.update(column for column in columns if column not in self.column_dtypes)
+            self.missing_columns.update(column for column in self.columns if column not in columns)
+            n_rows = len(next(iter(columns.values()))) if columns else 0
+            if n_rows == 0:
+                return
+            block, non_numeric = self._column_block(columns, n_rows)
+            for column, count in (non_numeric_counts or {}).items():
+                if column in self.column_dtypes:
+                    non_numeric[self.columns.index(column)] += count
+
+            # unparseable values are NaN in the block too, but are reported as non-numeric rather than null
+            nulls = np.isnan(block)
+            self.null_counts += nulls.sum(axis=0) - non_numeric
+            self.non_numeric_counts += non_numeric
+            present = ~nulls
+            non_integer = present & (block != np.round(block)) & self._integer_columns
+            self.non_integer_counts += non_integer.sum(axis=0)
+
+            checkable = present & ~non_integer
+            for allowed_values, indices in self._domain_groups.items():
+                sub_block = block[:, indices]
+                outside = ~np.isin(sub_block, allowed_values) & checkable[:, indices]
+                self.out_of_domain_counts[indices] += outside.sum(axis=0)
+            self.rows += n_rows
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def update_dataframe(self, dataframe: pd.DataFrame, chunk_rows: int = None):
+        try:
+            chunk_rows = chunk_rows or max(len(dataframe), 1)
+            for start in range(0, max(len(dataframe), 1), chunk_rows):
+                chunk = dataframe.iloc[start:start + chunk_rows]
+                self.update({column: chunk[column].to_numpy() for column in chunk.columns})
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def report(self) -> dict:
+        """Per-column counts, ratios and status, plus an overall status; only plain Python types so it can be written as YAML."""
+        try:
+            rows = max(self.rows, 1)
+            column_reports = {}
+            for index, column in enumerate(self.columns):
+                rules = self.rules[column]
+                invalid_count = int(self.non_numeric_counts[index] + self.non_integer_counts[index] + self.out_of_domain_counts[index])
+                null_ratio = float(self.null_counts[index]) / rows
+                invalid_ratio = invalid_count / rows
+                missing = column in self.missing_columns
+                column_reports[column] = {
+                    "expected_dtype": str(self.column_dtypes[column]),
+                    "observed_dtype": self.observed_dtypes.get(column),
+                    "null_count": int(self.null_counts[index]),
+                    "null_ratio": null_ratio,
+                    "non_numeric_count": int(self.non_numeric_counts[index]),
+                    "non_integer_count": int(self.non_integer_counts[index]),
+                    "out_of_domain_count": int(self.out_of_domain_counts[index]),
+                    "invalid_ratio": invalid_ratio,
+                    "allowed_values": list(rules["allowed_values"]) if rules["allowed_values"] is not None else None,
+                    "status": not missing and null_ratio <= rules["max_null_ratio"] and invalid_ratio <= rules["max_invalid_ratio"],
+                }
+            return {
+                "status": all(column_report["status"] for column_report in column_reports.values()) and not self.unexpected_columns,
+                "rows": self.rows,
+                "missing_columns": sorted(self.missing_columns),
+                "unexpected_columns": sorted(self.unexpected_columns),
+                "columns": column_reports,
+            }
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def failure_summary(report: dict) -> str:
+        failed_columns = [column for column, column_report in report["columns"].items() if not column_report["status"]]
+        return (
+            f"missing columns: {report['missing_columns']}, unexpected columns: {report['unexpected_columns']}, "
+            f"columns failing dtype/domain/null checks: {failed_columns}"
+        )
+
+    def validate_dataframe(self, dataframe: pd.DataFrame, chunk_rows: int = None) -> dict:
+        self.reset()
+        self.update_dataframe(dataframe, chunk_rows)
+        report = self.report()
+        logging.info(f"Schema validation of {report['rows']} rows: status={report['status']}")
+        return report
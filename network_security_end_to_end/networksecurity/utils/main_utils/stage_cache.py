@@ -0,0 +1,94 @@
+import os
+import sys
+import json
+import hashlib
+import inspect
+from dataclasses import fields, is_dataclass
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants import training_pipeline
+from networksecurity.utils.main_utils.utils import save_object, load_object
+
+HASH_BLOCK_SIZE: int = 1024 * 1024
+
+
+def hash_files(file_paths: list) -> str:
+    digest = hashlib.sha256()
+    # artifacts leave paths of outputs that were not produced as None
+    for file_path in filter(None, file_paths):
+        with open(file_path, "rb") as file_obj:
+            for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_source(objects: list) -> str:
+    # hashes the source files defining the given modules, classes or functions
+    return hash_files(sorted({inspect.getsourcefile(obj) for obj in objects}))
+
+
+def get_stage_constants(prefixes: tuple) -> dict:
+    return {
+        name: repr(value) for name, value in sorted(vars(training_pipeline).items())
+        if name.startswith(prefixes)
+    }
+
+
+def _artifact_file_paths(artifact) -> list:
+    file_paths = []
+    for artifact_field in fields(artifact):
+        value = getattr(artifact, artifact_field.name)
+        if is_dataclass(value):
+            file_paths.extend(_artifact_file_paths(value))
+        elif artifact_field.name.endswith("_file_path") and isinstance(value, str) and os.path.exists(value):
+            file_paths.append(value)
+    return file_paths
+
+
+class StageCache:
+    """
+    Content-addressed cache of pipeline stage artifacts.
+
+    A stage's fingerprint is the hash of everything it depends on (upstream data, schema, constants,
+    source code); its artifact is stored under that fingerprint, so a rerun with the same inputs gets
+    the previous artifact back as long as the files it points to are still on disk.
+    """
+
+    def __init__(self, cache_dir: str = os.path.join(training_pipeline.ARTIFACT_DIR, training_pipeline.STAGE_CACHE_DIR_NAME),
+                 enabled: bool = training_pipeline.STAGE_CACHE_ENABLED):
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+
+    @staticmethod
+    def fingerprint(inputs: dict) -> str:
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry_path(self, stage_name: str, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, stage_name, f"{fingerprint}.pkl")
+
+    def get(self, stage_name: str, fingerprint: str):
+        try:
+            entry_path = self._entry_path(stage_name, fingerprint)
+            if not self.enabled or not os.path.exists(entry_path):
+                return None
+            entry = load_object(entry_path)
+            missing = [file_path for file_path in entry["file_paths"] if not os.path.exists(file_path)]
+            if missing:
+                logging.info(f"Stage cache entry for {stage_name} is stale, missing files: {missing}")
+                return None
+            logging.info(f"Stage cache hit for {stage_name} ({fingerprint[:12]})")
+            return entry["artifact"]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def put(self, stage_name: str, fingerprint: str, artifact):
+        try:
+            if not self.enabled:
+                return
+            save_object(self._entry_path(stage_name, fingerprint), {
+                "artifact": artifact,
+                "file_paths": _artifact_file_paths(artifact),
+            })
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
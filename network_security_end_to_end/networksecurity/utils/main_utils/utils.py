@@ -5,10 +5,11 @@ import yaml
 import pickle
 import numpy as np
 from sklearn.metrics import r2_score
-from sklearn.model_selection import GridSearchCV
 
 from networksecurity.exception.exception import NetworkSecurityException 
 from networksecurity.logging.logger import logging
+from networksecurity.utils.ml_utils.model.search import ModelSearch, log_search_result_to_mlflow
+from networksecurity.utils.main_utils.profiler import pipeline_profiler
 
 def read_yaml_file(file_path: str) -> dict:
     try:
@@ -41,8 +42,11 @@ def save_object(file_path: str, obj: object) -> None:
     try:
         logging.info("Entered the save_object method of MainUtils class")
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "wb") as file_obj:
+        # write to a temp file and rename so readers (e.g. the model registry) never see a partial pickle
+        tmp_file_path = f"{file_path}.tmp"
+        with open(tmp_file_path, "wb") as file_obj:
             pickle.dump(obj, file_obj)
+        os.replace(tmp_file_path, file_path)
         logging.info("Exited the save_object method of MainUtils class")
     except Exception as e:
         raise NetworkSecurityException(e, sys)
@@ -58,34 +62,49 @@ def load_object(file_path: str) -> object:
     except Exception as e:
         raise NetworkSecurityException(e, sys)
 
-def load_numpy_array_data(file_path: str) -> np.array:
+def load_numpy_array_data(file_path: str, mmap_mode: str = None) -> np.array:
     try:
+        if mmap_mode is not None:
+            # maps the file instead of reading it, pages are loaded only when touched
+            return np.load(file_path, mmap_mode=mmap_mode)
         with open(file_path, "rb") as file_obj:
             return np.load(file_obj)
     except Exception as e:
         raise NetworkSecurityException(e, sys)
     
 
-def evaluate_models(x_train, y_train, x_test, y_test, models, params):
+def evaluate_models(x_train, y_train, x_test, y_test, models, params, cv: int = 3, strategy: str = "grid",
+                    n_iter: int = 10, halving_factor: int = 3, n_jobs: int = -1):
     try:
-        report = {}
-        for i in range(len(list(models))):
-            model = list(models.values())[i]
-            para = params[list(models.keys())[i]]
+        model_search = ModelSearch(
+            models=models, params=params, cv=cv, strategy=strategy,
+            n_iter=n_iter, halving_factor=halving_factor, n_jobs=n_jobs
+        )
+        with pipeline_profiler.profile("model_search", rows=len(y_train)):
+            search_report = model_search.search(x_train, y_train)
+            # families share one worker pool, so each one is reported by the summed time of its fits
+            for model_name, search_result in search_report.items():
+                pipeline_profiler.record(
+                    model_name.lower().replace(" ", "_"),
+                    wall_seconds=sum(candidate.fit_seconds for candidate in search_result.candidates),
+                    rows=len(y_train),
+                )
 
-            gs = GridSearchCV(model, para, cv=3)
-            gs.fit(x_train, y_train)
+        report = {}
+        for model_name, model in models.items():
+            search_result = search_report[model_name]
+            logging.info(f"Best params for {model_name}: {search_result.best_params} (cv score: {search_result.best_score})")
+            log_search_result_to_mlflow(model_name, search_result)
 
-            model.set_params(**gs.best_params_)
-            model.fit(x_train, y_train)
+            # single refit of the best candidate on the full training data
+            model.set_params(**search_result.best_params)
+            with pipeline_profiler.profile(f"refit_{model_name.lower().replace(' ', '_')}", rows=len(y_train)):
+                model.fit(x_train, y_train)
 
-            y_train_pred = model.predict(x_train)
             y_test_pred = model.predict(x_test)
-
-            train_model_score = r2_score(y_train, y_train_pred)
             test_model_score = r2_score(y_test, y_test_pred)
-            
-            report[list(models.keys())[i]] = test_model_score
+
+            report[model_name] = test_model_score
         return report
     except Exception as e:
-        raise NetworkSecurityException(e, sys)
\ No newline at end of file
+        raise NetworkSecurityException(e, sys)
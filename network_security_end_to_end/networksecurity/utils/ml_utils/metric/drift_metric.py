@@ -0,0 +1,155 @@
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.stats import kstwo, chi2
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+
+PSI_EPSILON: float = 1e-6
+
+
+def _ks_p_values(statistics: np.ndarray, n1: int, n2: int) -> np.ndarray:
+    return np.clip(kstwo.sf(statistics, np.round(n1 * n2 / (n1 + n2))), 0.0, 1.0)
+
+
+def ks_2samp_batched(base: np.ndarray, current: np.ndarray):
+    """
+    Two-sided KS statistic and asymptotic p-value for every row of two (columns, samples) arrays at once.
+
+    Both samples are stacked and argsorted once per column; the running count of base values gives
+    both empirical CDFs, which are compared only at the last position of each run of tied values.
+    """
+    n1, n2 = base.shape[1], current.shape[1]
+    combined = np.concatenate([base, current], axis=1)
+    order = np.argsort(combined, axis=1, kind="stable")
+    sorted_values = np.take_along_axis(combined, order, axis=1)
+
+    from_base = order < n1
+    cdf_base = np.cumsum(from_base, axis=1) / n1
+    cdf_current = np.cumsum(~from_base, axis=1) / n2
+
+    is_last_of_run = np.ones_like(from_base)
+    is_last_of_run[:, :-1] = sorted_values[:, 1:] != sorted_values[:, :-1]
+
+    statistics = np.where(is_last_of_run, np.abs(cdf_base - cdf_current), 0.0).max(axis=1)
+    return statistics, _ks_p_values(statistics, n1, n2)
+
+
+def _category_counts(values: np.ndarray, minimums: np.ndarray, n_bins: int) -> np.ndarray:
+    # one bincount for all columns: every column gets its own range of n_bins bins
+    offsets = np.arange(values.shape[0], dtype=np.intp)[:, None] * n_bins
+    if np.issubdtype(values.dtype, np.integer):
+        # compact (e.g. int8) columns are widened straight into the index array, without a float64 temporary
+        indices = np.subtract(values, minimums.astype(np.intp)[:, None], dtype=np.intp)
+    else:
+        indices = (values - minimums[:, None]).astype(np.intp)
+    indices += offsets
+    return np.bincount(indices.ravel(), minlength=values.shape[0] * n_bins).reshape(values.shape[0], n_bins)
+
+
+def discrete_drift_batched(base: np.ndarray, current: np.ndarray, minimums: np.ndarray, n_bins: int):
+    """KS statistic, PSI and chi-square test for low-cardinality integer columns, all from one set of category counts."""
+    n1, n2 = base.shape[1], current.shape[1]
+    base_counts = _category_counts(base, minimums, n_bins)
+    current_counts = _category_counts(current, minimums, n_bins)
+
+    ks_statistics = np.abs(np.cumsum(base_counts, axis=1) / n1 - np.cumsum(current_counts, axis=1) / n2).max(axis=1)
+
+    present = (base_counts + current_counts) > 0
+    base_ratio = np.maximum(base_counts / n1, PSI_EPSILON)
+    current_ratio = np.maximum(current_counts / n2, PSI_EPSILON)
+    psi = np.where(present, (current_ratio - base_ratio) * np.log(current_ratio / base_ratio), 0.0).sum(axis=1)
+
+    totals = base_counts + current_counts
+    expected_base = totals * (n1 / (n1 + n2))
+    expected_current = totals * (n2 / (n1 + n2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi2_terms = (base_counts - expected_base) ** 2 / expected_base + (current_counts - expected_current) ** 2 / expected_current
+    chi2_statistics = np.where(present, chi2_terms, 0.0).sum(axis=1)
+    degrees_of_freedom = present.sum(axis=1) - 1
+    chi2_p_values = np.where(degrees_of_freedom > 0, chi2.sf(chi2_statistics, np.maximum(degrees_of_freedom, 1)), 1.0)
+
+    return ks_statistics, _ks_p_values(ks_statistics, n1, n2), psi, chi2_statistics, chi2_p_values
+
+
+def _detect_drift_block(columns, base: np.ndarray, current: np.ndarray, threshold: float, methods, discrete_max_cardinality: int) -> dict:
+    start_time = time.perf_counter()
+    minimums = np.minimum(base.min(axis=1), current.min(axis=1)).astype(np.float64)
+    maximums = np.maximum(base.max(axis=1), current.max(axis=1)).astype(np.float64)
+    is_discrete = (maximums - minimums) < discrete_max_cardinality
+    if not np.issubdtype(base.dtype, np.integer):
+        is_discrete &= np.all(base == np.floor(base), axis=1) & np.all(current == np.floor(current), axis=1)
+
+    column_reports = [None] * len(columns)
+    discrete_index = np.flatnonzero(is_discrete)
+    if len(discrete_index):
+        n_bins = int((maximums[discrete_index] - minimums[discrete_index]).max()) + 1
+        ks_statistics, p_values, psi, chi2_statistics, chi2_p_values = discrete_drift_batched(
+            base[discrete_index], current[discrete_index], minimums[discrete_index], n_bins
+        )
+        for position, index in enumerate(discrete_index):
+            column_report = {"p_value": float(p_values[position]), "ks_statistic": float(ks_statistics[position])}
+            if "psi" in methods:
+                column_report["psi"] = float(psi[position])
+            if "chi2" in methods:
+                column_report["chi2_statistic"] = float(chi2_statistics[position])
+                column_report["chi2_p_value"] = float(chi2_p_values[position])
+            column_reports[index] = column_report
+
+    continuous_index = np.flatnonzero(~is_discrete)
+    if len(continuous_index):
+        ks_statistics, p_values = ks_2samp_batched(base[continuous_index], current[continuous_index])
+        for position, index in enumerate(continuous_index):
+            column_reports[index] = {"p_value": float(p_values[position]), "ks_statistic": float(ks_statistics[position])}
+
+    # the kernels run over the whole block, so each column is charged an equal share of the block time
+    elapsed_seconds = (time.perf_counter() - start_time) / max(len(columns), 1)
+    report = {}
+    for column, column_report in zip(columns, column_reports):
+        column_report["drift_status"] = bool(column_report["p_value"] <= threshold)
+        column_report["elapsed_seconds"] = elapsed_seconds
+        report[column] = column_report
+    return report
+
+
+def detect_drift(base_df, current_df, threshold: float = 0.05, methods=("ks", "psi", "chi2"),
+                 n_jobs: int = 1, parallel_min_cells: int = 0, discrete_max_cardinality: int = 10) -> dict:
+    """
+    Compares every column of base_df against current_df and returns a report keyed by column.
+
+    Low-cardinality integer columns are compared through category counts, other columns through a
+    batched sort. Columns are split into blocks that run in a process pool when n_jobs > 1 and the
+    data has at least parallel_min_cells values; smaller inputs run in-process.
+    """
+    try:
+        columns = list(base_df.columns)
+        # (columns, samples) layout keeps every per-column kernel on contiguous memory
+        base = np.ascontiguousarray(base_df[columns].to_numpy().T)
+        current = np.ascontiguousarray(current_df[columns].to_numpy().T)
+        if base.dtype != current.dtype or not np.issubdtype(base.dtype, np.number):
+            base, current = base.astype(np.float64), current.astype(np.float64)
+
+        n_jobs = min(n_jobs if n_jobs and n_jobs > 0 else (os.cpu_count() or 1), len(columns))
+        total_cells = (base.shape[1] + current.shape[1]) * len(columns)
+        if n_jobs <= 1 or total_cells < parallel_min_cells:
+            return _detect_drift_block(columns, base, current, threshold, methods, discrete_max_cardinality)
+
+        logging.info(f"Detecting drift over {len(columns)} columns with {n_jobs} worker processes")
+        column_blocks = [block for block in np.array_split(np.arange(len(columns)), n_jobs) if len(block)]
+        report = {}
+        with ProcessPoolExecutor(max_workers=len(column_blocks)) as executor:
+            futures = [
+                executor.submit(
+                    _detect_drift_block, [columns[i] for i in block], base[block], current[block],
+                    threshold, methods, discrete_max_cardinality
+                )
+                for block in column_blocks
+            ]
+            for future in futures:
+                report.update(future.result())
+        return {column: report[column] for column in columns}
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -1,22 +1,70 @@
 import os
 import sys
+import time
 
-from networksecurity.constants.training_pipeline import SAVED_MODEL_DIR, MODEL_FILE_NAME
+from networksecurity.constants.training_pipeline import SAVED_MODEL_DIR, MODEL_FILE_NAME, COMPILED_BACKEND_MAX_ROWS
 from networksecurity.logging.logger import logging
 from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.utils.ml_utils.model.tree_ensemble import CompiledTreeEnsemble
 
 class NetworkModel:
-    def __init__(self, preprocessor, model):
+    def __init__(self, preprocessor, model, backend: str = "sklearn"):
         try:
             self.preprocessor = preprocessor
             self.model = model
+            self.backend = "sklearn"
+            self.compiled_model = None
+            self.compiled_max_rows = COMPILED_BACKEND_MAX_ROWS
+            if backend != "sklearn":
+                self.set_backend(backend)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def set_backend(self, backend: str, validation_x=None):
+        """
+        Selects "sklearn" or "compiled" inference. The compiled backend flattens a tree ensemble into
+        node arrays (see CompiledTreeEnsemble); batches larger than compiled_max_rows still go through
+        sklearn, whose per-tree Cython loop wins on large inputs. When validation_x (already
+        preprocessed) is given, the compiled model must reproduce sklearn's predictions on it exactly,
+        and compiled_max_rows is set to the batch size up to which it was timed faster than sklearn;
+        otherwise it is COMPILED_BACKEND_MAX_ROWS. Returns the parity report, if any.
+        """
+        try:
+            if backend == "sklearn":
+                self.backend, self.compiled_model = "sklearn", None
+                return None
+            if backend != "compiled":
+                raise Exception(f"Unknown inference backend: {backend}. Expected 'sklearn' or 'compiled'.")
+
+            compiled_model = CompiledTreeEnsemble(self.model)
+            report = None
+            if validation_x is not None:
+                report = compiled_model.check_parity(self.model, validation_x)
+                if report["mismatches"]:
+                    raise Exception(f"Compiled backend disagrees with sklearn on {report['mismatches']} of {report['rows']} rows.")
+                if not report["compiled_max_rows"]:
+                    raise Exception("Compiled backend is not faster than sklearn even on single rows.")
+            self.backend, self.compiled_model = "compiled", compiled_model
+            self.compiled_max_rows = report["compiled_max_rows"] if report is not None else COMPILED_BACKEND_MAX_ROWS
+            return report
         except Exception as e:
             raise NetworkSecurityException(e, sys)
         
-    def predict(self, x):
+    def predict(self, x, timings: dict = None):
+        """When a timings dict is given, the seconds spent in preprocessing and in the model are added to its "preprocess" and "predict" entries."""
         try:
+            started = time.perf_counter()
             x_transform = self.preprocessor.transform(x)
-            y_pred = self.model.predict(x_transform)
+            transformed = time.perf_counter()
+            # getattr: models pickled before the compiled backend existed have neither attribute
+            compiled_model = getattr(self, "compiled_model", None)
+            if compiled_model is not None and len(x_transform) <= getattr(self, "compiled_max_rows", COMPILED_BACKEND_MAX_ROWS):
+                y_pred = compiled_model.predict(x_transform)
+            else:
+                y_pred = self.model.predict(x_transform)
+            if timings is not None:
+                timings["preprocess"] = timings.get("preprocess", 0.0) + transformed - started
+                timings["predict"] = timings.get("predict", 0.0) + time.perf_counter() - transformed
             return y_pred
         except Exception as e:
             raise NetworkSecurityException(e, sys)
\ No newline at end of file
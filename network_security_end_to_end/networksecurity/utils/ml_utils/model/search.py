@@ -0,0 +1,185 @@
+import sys
+import math
+import time
+import numpy as np
+from dataclasses import dataclass, field
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, ParameterSampler, StratifiedKFold
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+
+SEARCH_STRATEGIES = ("grid", "random", "halving_grid", "halving_random")
+
+
+@dataclass
+class CandidateResult:
+    params: dict
+    mean_score: float
+    fit_seconds: float
+    n_samples: int
+
+
+@dataclass
+class ModelSearchResult:
+    best_params: dict
+    best_score: float
+    candidates: list = field(default_factory=list)
+
+
+def _fit_and_score(estimator, params: dict, x, y, train_index, test_index):
+    start_time = time.perf_counter()
+    try:
+        model = clone(estimator).set_params(**params)
+        model.fit(x[train_index], y[train_index])
+        score = model.score(x[test_index], y[test_index])
+    except Exception as e:
+        # same as GridSearchCV's error_score=np.nan: a failing candidate must not abort the search
+        logging.warning(f"Fit failed for {type(estimator).__name__} with params {params}: {e}")
+        score = float("nan")
+    return score, time.perf_counter() - start_time
+
+
+class ModelSearch:
+    """
+    Hyperparameter search over several model families at once.
+
+    Every (model, params, fold) fit of a round is dispatched to one shared joblib pool, fold splits
+    are computed once per sample size and reused by every family, and the halving strategies drop
+    the weaker candidates of each family after every round while growing the training sample.
+    """
+
+    def __init__(self, models: dict, params: dict, cv: int = 3, strategy: str = "grid", n_iter: int = 10,
+                 halving_factor: int = 3, n_jobs: int = -1, random_state: int = 42):
+        try:
+            if strategy not in SEARCH_STRATEGIES:
+                raise Exception(f"Unsupported search strategy: {strategy}. Supported strategies: {SEARCH_STRATEGIES}")
+            self.models = models
+            self.params = params
+            self.cv = cv
+            self.strategy = strategy
+            self.n_iter = n_iter
+            self.halving_factor = halving_factor
+            self.n_jobs = n_jobs
+            self.random_state = random_state
+            self._fold_cache = {}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _get_candidates(self, model_name: str) -> list:
+        param_grid = self.params.get(model_name, {})
+        candidates = list(ParameterGrid(param_grid))
+        if self.strategy.endswith("random") and len(candidates) > self.n_iter:
+            candidates = list(ParameterSampler(param_grid, n_iter=self.n_iter, random_state=self.random_state))
+        return candidates
+
+    def _get_folds(self, y, n_samples: int) -> list:
+        if n_samples not in self._fold_cache:
+            sample_index = self._sample_order[:n_samples]
+            splitter = StratifiedKFold(n_splits=self.cv, shuffle=True, random_state=self.random_state)
+            self._fold_cache[n_samples] = [
+                (sample_index[train_index], sample_index[test_index])
+                for train_index, test_index in splitter.split(sample_index, y[sample_index])
+            ]
+        return self._fold_cache[n_samples]
+
+    def _run_round(self, parallel: Parallel, x, y, candidates: dict, n_samples: int) -> dict:
+        folds = self._get_folds(y, n_samples)
+        tasks = [
+            (model_name, candidate_index)
+            for model_name, candidate_list in candidates.items()
+            for candidate_index, _ in candidate_list
+        ]
+        outputs = parallel(
+            delayed(_fit_and_score)(self.models[model_name], params, x, y, train_index, test_index)
+            for model_name, candidate_list in candidates.items()
+            for _, params in candidate_list
+            for train_index, test_index in folds
+        )
+
+        round_results = {model_name: [] for model_name in candidates}
+        for task_number, (model_name, candidate_index) in enumerate(tasks):
+            fold_outputs = outputs[task_number * len(folds):(task_number + 1) * len(folds)]
+            params = dict(candidates[model_name])[candidate_index]
+            scores = [score for score, _ in fold_outputs]
+            round_results[model_name].append((candidate_index, CandidateResult(
+                params=params,
+                mean_score=float(np.nanmean(scores)) if not np.all(np.isnan(scores)) else float("nan"),
+                fit_seconds=float(sum(fit_seconds for _, fit_seconds in fold_outputs)),
+                n_samples=n_samples,
+            )))
+        return round_results
+
+    def search(self, x, y) -> dict:
+        try:
+            # asanyarray keeps np.memmap inputs, which joblib hands to workers by file reference
+            x, y = np.asanyarray(x), np.asanyarray(y)
+            self._sample_order = np.random.RandomState(self.random_state).permutation(len(y))
+            self._fold_cache = {}
+
+            candidates = {model_name: list(enumerate(self._get_candidates(model_name))) for model_name in self.models}
+            history = {model_name: [] for model_name in self.models}
+            last_round = {}
+
+            if self.strategy.startswith("halving"):
+                max_candidates = max(len(candidate_list) for candidate_list in candidates.values())
+                # one round per halving until a single candidate is left, plus the final full-data round;
+                # counted with integers since math.log(125, 5) is 3.0000000000000004 and would add a round
+                n_rounds, remaining = 1, max_candidates
+                while remaining > 1:
+                    remaining = -(-remaining // self.halving_factor)
+                    n_rounds += 1
+                min_samples = max(len(y) // (self.halving_factor ** (n_rounds - 1)), self.cv * 20)
+            else:
+                n_rounds, min_samples = 1, len(y)
+
+            with Parallel(n_jobs=self.n_jobs) as parallel:
+                for round_number in range(n_rounds):
+                    is_final_round = round_number == n_rounds - 1
+                    n_samples = len(y) if is_final_round else min(len(y), min_samples * self.halving_factor ** round_number)
+                    # families already down to one candidate only need the final full-data round
+                    active = {
+                        model_name: candidate_list for model_name, candidate_list in candidates.items()
+                        if candidate_list and (is_final_round or len(candidate_list) > 1)
+                    }
+                    if not active:
+                        continue
+                    logging.info(f"Model search round {round_number + 1}/{n_rounds}: {sum(len(c) for c in active.values())} candidates on {n_samples} samples")
+                    round_results = self._run_round(parallel, x, y, active, n_samples)
+
+                    for model_name, results in round_results.items():
+                        history[model_name].extend(result for _, result in results)
+                        last_round[model_name] = results
+                        if not is_final_round and len(results) > 1:
+                            keep = max(1, math.ceil(len(results) / self.halving_factor))
+                            ranked = sorted(results, key=lambda item: -np.nan_to_num(item[1].mean_score, nan=-np.inf))
+                            kept_indices = {candidate_index for candidate_index, _ in ranked[:keep]}
+                            candidates[model_name] = [(i, p) for i, p in candidates[model_name] if i in kept_indices]
+
+            report = {}
+            for model_name, results in last_round.items():
+                _, best_result = max(results, key=lambda item: np.nan_to_num(item[1].mean_score, nan=-np.inf))
+                report[model_name] = ModelSearchResult(
+                    best_params=best_result.params,
+                    best_score=best_result.mean_score,
+                    candidates=history[model_name],
+                )
+            return report
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+def log_search_result_to_mlflow(model_name: str, search_result: ModelSearchResult):
+    import mlflow
+
+    if mlflow.active_run() is None:
+        return
+    metric_prefix = "search_" + model_name.lower().replace(" ", "_")
+    for step, candidate in enumerate(search_result.candidates):
+        mlflow.log_metric(f"{metric_prefix}_candidate_fit_seconds", candidate.fit_seconds, step=step)
+        if not np.isnan(candidate.mean_score):
+            mlflow.log_metric(f"{metric_prefix}_candidate_cv_score", candidate.mean_score, step=step)
+    if not np.isnan(search_result.best_score):
+        mlflow.log_metric(f"{metric_prefix}_best_cv_score", search_result.best_score)
+    mlflow.log_metric(f"{metric_prefix}_total_fit_seconds", sum(candidate.fit_seconds for candidate in search_result.candidates))
@@ -0,0 +1,198 @@
+import sys
+import time
+import numpy as np
+from scipy.special import expit, softmax
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+from networksecurity.constants.training_pipeline import COMPILED_BACKEND_CALIBRATION_MAX_ROWS, COMPILED_BACKEND_MIN_SPEEDUP
+
+from sklearn.dummy import DummyClassifier
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier, GradientBoostingClassifier
+
+# caps the (rows x trees) node index matrix evaluated at once
+MAX_CHUNK_CELLS: int = 1 << 20
+
+
+def supports_compiled_backend(model) -> bool:
+    if isinstance(model, (DecisionTreeClassifier, RandomForestClassifier, ExtraTreesClassifier)):
+        return model.n_outputs_ == 1
+    if isinstance(model, GradientBoostingClassifier):
+        return model.init_ == "zero" or isinstance(model.init_, DummyClassifier)
+    return False
+
+
+class CompiledTreeEnsemble:
+    """
+    A fitted tree classifier flattened into contiguous node arrays and evaluated for all trees at once.
+
+    Every tree's nodes are concatenated into flat arrays with global child indices. All (row, tree)
+    cells descend together, one level per round of gathers and compares, and cells drop out of the
+    active set as they reach a leaf. Leaf values are then accumulated tree by tree in the
+    same order and precision as sklearn, so predictions match it exactly:
+    averaged class probabilities for forests and single trees, and init + learning_rate * leaf value
+    raw scores for gradient boosting.
+    """
+
+    def __init__(self, model):
+        try:
+            if not supports_compiled_backend(model):
+                raise Exception(f"{type(model).__name__} is not supported by the compiled tree backend.")
+            self.classes_ = model.classes_
+            self.n_features_in_ = model.n_features_in_
+
+            if isinstance(model, GradientBoostingClassifier):
+                self.kind = "boosting"
+                trees = [(estimator.tree_, class_index) for stage in model.estimators_ for class_index, estimator in enumerate(stage)]
+                n_scores = model.estimators_.shape[1]
+                # the prior (or zero) init is the same for every row; computed the way sklearn does
+                self.init_scores = model._raw_predict_init(np.zeros((1, self.n_features_in_), dtype=np.float32))[0].astype(np.float64)
+                scale = model.learning_rate
+            else:
+                self.kind = "forest"
+                estimators = [model] if isinstance(model, DecisionTreeClassifier) else model.estimators_
+                trees = [(estimator.tree_, None) for estimator in estimators]
+                n_scores = len(self.classes_)
+                self.init_scores = np.zeros(n_scores)
+                scale = None
+            self.n_trees = len(trees)
+
+            n_nodes = sum(tree.node_count for tree, _ in trees)
+            self.feature = np.zeros(n_nodes, dtype=np.intp)
+            self.threshold = np.full(n_nodes, np.inf)
+            # left and right child of node i at 2i and 2i + 1
+            self.children = np.empty(2 * n_nodes, dtype=np.intp)
+            self.is_leaf = np.empty(n_nodes, dtype=bool)
+            self.values = np.zeros((n_nodes, n_scores))
+            self.roots = np.empty(self.n_trees, dtype=np.intp)
+
+            offset = 0
+            for tree_index, (tree, class_index) in enumerate(trees):
+                nodes = slice(offset, offset + tree.node_count)
+                node_ids = np.arange(offset, offset + tree.node_count)
+                is_leaf = tree.children_left == -1
+                self.roots[tree_index] = offset
+                self.feature[nodes] = np.where(is_leaf, 0, tree.feature)
+                self.threshold[nodes] = np.where(is_leaf, np.inf, tree.threshold)
+                self.children[2 * offset:2 * (offset + tree.node_count):2] = np.where(is_leaf, node_ids, tree.children_left + offset)
+                self.children[2 * offset + 1:2 * (offset + tree.node_count):2] = np.where(is_leaf, node_ids, tree.children_right + offset)
+                self.is_leaf[nodes] = is_leaf
+                if scale is None:
+                    # same normalization as DecisionTreeClassifier.predict_proba
+                    proba = tree.value[:, 0, :]
+                    normalizer = proba.sum(axis=1)[:, None]
+                    normalizer[normalizer == 0.0] = 1.0
+                    self.values[nodes] = proba / normalizer
+                else:
+                    self.values[nodes, class_index] = scale * tree.value[:, 0, 0]
+                offset += tree.node_count
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _leaves(self, x: np.ndarray) -> np.ndarray:
+        n_rows, n_features = x.shape
+        nodes = np.tile(self.roots, n_rows)
+        row_offsets = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, self.n_trees)
+        x_flat = x.ravel()
+        # only (row, tree) cells that have not reached a leaf are advanced each round
+        active = np.flatnonzero(~self.is_leaf[nodes])
+        while active.size:
+            active_nodes = nodes[active]
+            go_right = ~(x_flat[row_offsets[active] + self.feature[active_nodes]] <= self.threshold[active_nodes])
+            children = self.children[2 * active_nodes + go_right]
+            nodes[active] = children
+            active = active[~self.is_leaf[children]]
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def decision_scores(self, x) -> np.ndarray:
+        """Averaged class probabilities (forests) or raw boosting scores, one row per sample."""
+        try:
+            # sklearn trees compare float32 features against float64 thresholds
+            x = np.asarray(x, dtype=np.float32)
+            scores = np.empty((len(x), self.values.shape[1]))
+            chunk_rows = max(1, MAX_CHUNK_CELLS // max(self.n_trees, 1))
+            for start in range(0, len(x), chunk_rows):
+                leaves = self._leaves(x[start:start + chunk_rows])
+                chunk_scores = np.repeat(self.init_scores[None, :], len(leaves), axis=0)
+                for tree_index in range(self.n_trees):
+                    chunk_scores += self.values[leaves[:, tree_index]]
+                scores[start:start + chunk_rows] = chunk_scores
+            if self.kind == "forest":
+                scores /= self.n_trees
+            return scores
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def predict(self, x) -> np.ndarray:
+        scores = self.decision_scores(x)
+        if self.kind == "boosting" and scores.shape[1] == 1:
+            return self.classes_[(scores[:, 0] > 0).astype(np.intp)]
+        return self.classes_[np.argmax(scores, axis=1)]
+
+    def predict_proba(self, x) -> np.ndarray:
+        scores = self.decision_scores(x)
+        if self.kind == "forest":
+            return scores
+        # the same links as sklearn's binomial and multinomial losses
+        if scores.shape[1] == 1:
+            positive = expit(scores[:, 0])
+            return np.column_stack([1 - positive, positive])
+        return softmax(scores, axis=1)
+
+    def check_parity(self, model, x, max_batch_rows: int = COMPILED_BACKEND_CALIBRATION_MAX_ROWS, repeats: int = 20,
+                     min_seconds: float = 0.1, min_speedup: float = COMPILED_BACKEND_MIN_SPEEDUP) -> dict:
+        """
+        Compares predictions with the sklearn model on x, and times both on all of x and on batches of
+        1, 2, 4, ... up to max_batch_rows rows, taking the best of at least repeats runs and min_seconds
+        per size. compiled_max_rows is the largest of those batch sizes up to which the compiled backend
+        is at least min_speedup times faster at every size, 0 if none.
+        """
+        try:
+            started = time.perf_counter()
+            expected = model.predict(x)
+            sklearn_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            actual = self.predict(x)
+            compiled_seconds = time.perf_counter() - started
+
+            def best_seconds(batch):
+                # the two backends alternate so machine noise hits both alike; small batches run until
+                # min_seconds have passed, so their best times are not one lucky or unlucky run
+                sklearn_best = compiled_best = np.inf
+                deadline, runs = time.perf_counter() + min_seconds, 0
+                while runs < repeats or time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    model.predict(batch)
+                    sklearn_best = min(sklearn_best, time.perf_counter() - started)
+                    started = time.perf_counter()
+                    self.predict(batch)
+                    compiled_best = min(compiled_best, time.perf_counter() - started)
+                    runs += 1
+                return sklearn_best, compiled_best
+
+            batch_timings, compiled_max_rows, batch_rows = [], 0, 1
+            while batch_rows <= min(max_batch_rows, len(x)):
+                batch = x[:batch_rows]
+                sklearn_batch_seconds, compiled_batch_seconds = best_seconds(batch)
+                batch_timings.append({"rows": batch_rows, "sklearn_seconds": sklearn_batch_seconds, "compiled_seconds": compiled_batch_seconds})
+                if compiled_batch_seconds * min_speedup > sklearn_batch_seconds:
+                    break
+                compiled_max_rows = batch_rows
+                batch_rows *= 2
+
+            # speedup at the largest batch the compiled backend will serve
+            served = next((timing for timing in batch_timings if timing["rows"] == compiled_max_rows), None)
+            report = {
+                "rows": len(x),
+                "mismatches": int(np.count_nonzero(expected != actual)),
+                "sklearn_seconds": sklearn_seconds,
+                "compiled_seconds": compiled_seconds,
+                "batch_timings": batch_timings,
+                "compiled_max_rows": compiled_max_rows,
+                "batch_speedup": served["sklearn_seconds"] / served["compiled_seconds"] if served and served["compiled_seconds"] else None,
+            }
+            logging.info(f"Compiled tree backend parity check: {report}")
+            return report
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
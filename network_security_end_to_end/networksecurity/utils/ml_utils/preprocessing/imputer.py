@@ -0,0 +1,239 @@
+import sys
+import threading
+import numpy as np
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.metrics.pairwise import euclidean_distances
+from sklearn.neighbors import BallTree, KDTree
+from sklearn.utils.validation import check_is_fitted
+
+from networksecurity.exception.exception import NetworkSecurityException
+from networksecurity.logging.logger import logging
+
+NEIGHBOR_INDEXES = {"ball_tree": BallTree, "kd_tree": KDTree}
+# integers, and so float32 dot products and norms of integer rows, are exact up to 2**24
+EXACT_FLOAT32_MAX_SQUARED_DISTANCE: int = 1 << 24
+
+
+def smallest_integer_dtype(X: np.ndarray):
+    """int8/int16 if every value of X is an integer in that range, else None."""
+    if not len(X) or not np.all(np.isfinite(X)) or not np.all(X == np.round(X)):
+        return None
+    low, high = X.min(), X.max()
+    for dtype in (np.int8, np.int16):
+        if np.iinfo(dtype).min <= low and high <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return None
+
+
+class NeighborIndexImputer(TransformerMixin, BaseEstimator):
+    """
+    KNN imputation backed by prebuilt BallTree/KDTree indexes instead of brute-force distances.
+
+    Neighbors are searched among the complete training rows, using only the features observed in
+    the row being imputed, so one index exists per missing-value pattern. Up to max_indexes are
+    built at fit time for frequent patterns seen during fit and pickled with the imputer. Any other
+    pattern gets an index, kept in this process only, once it shows up in at least index_min_rows
+    rows of a batch and is brute-forced otherwise. Rows without missing values skip the neighbor
+    search entirely.
+
+    prebuilt_patterns (off by default) also builds and pickles indexes for given patterns whatever
+    the training rows look like, since training data is usually complete and its own patterns say
+    little about serving traffic: "single_missing" is every pattern with one feature missing, or
+    pass a list of missing-column lists (names or positions). Each index holds its own float64
+    copy of the training columns it searches, so "single_missing" multiplies the pickled size by
+    about the number of features.
+
+    DataFrames are matched to the training columns by name: reordered columns are put back in
+    training order, and missing or unexpected columns raise.
+
+    Imputed values are those of KNNImputer except when several training rows tie at the k-th
+    neighbor distance: the tie is then broken by the index or argpartition, not by row order.
+
+    With compact=True, integer-valued training rows are kept as int8/int16, and brute-force
+    distances between them and integer queries are computed exactly in float32 instead of float64.
+    Integer input has no NaN to impute and is returned in its own dtype.
+    """
+
+    def __init__(self, missing_values=np.nan, n_neighbors: int = 3, weights: str = "uniform",
+                 algorithm: str = "ball_tree", leaf_size: int = 40, max_indexes: int = 32, index_min_rows: int = 32,
+                 prebuilt_patterns=None, compact: bool = False):
+        self.missing_values = missing_values
+        self.n_neighbors = n_neighbors
+        self.weights = weights
+        self.algorithm = algorithm
+        self.leaf_size = leaf_size
+        self.max_indexes = max_indexes
+        self.index_min_rows = index_min_rows
+        self.prebuilt_patterns = prebuilt_patterns
+        self.compact = compact
+
+    def _is_nan_free_integer(self, X) -> bool:
+        dtypes = X.dtypes if hasattr(X, "dtypes") else [np.asarray(X).dtype]
+        nan_missing = isinstance(self.missing_values, float) and np.isnan(self.missing_values)
+        return nan_missing and all(np.issubdtype(dtype, np.integer) for dtype in dtypes)
+
+    def _check_feature_names(self, X):
+        """X with its columns in training order; raises if they are not the training columns."""
+        feature_names = getattr(self, "feature_names_in_", None)
+        if feature_names is None or not hasattr(X, "columns"):
+            return X
+        columns = np.asarray(X.columns, dtype=object)
+        if len(columns) == len(feature_names) and np.all(columns == feature_names):
+            return X
+        missing, unexpected = set(feature_names) - set(columns), set(columns) - set(feature_names)
+        if missing or unexpected or len(columns) != len(feature_names):
+            raise Exception(
+                f"Columns do not match the columns seen during fit. Missing: {sorted(missing)}, unexpected: {sorted(unexpected)}"
+            )
+        return X[list(feature_names)]
+
+    def _to_array(self, X) -> np.ndarray:
+        X = np.array(X, dtype=np.float64, copy=True)
+        if not (isinstance(self.missing_values, float) and np.isnan(self.missing_values)):
+            X[X == self.missing_values] = np.nan
+        return X
+
+    def _build_index(self, observed: tuple):
+        return NEIGHBOR_INDEXES[self.algorithm](self.fit_X_[:, list(observed)], leaf_size=self.leaf_size)
+
+    def _get_index(self, observed: tuple, n_rows: int):
+        index = self.indexes_.get(observed)
+        if index is None and n_rows >= self.index_min_rows:
+            index = self._build_index(observed)
+            with self._get_lock():
+                if len(self.indexes_) < getattr(self, "n_prebuilt_indexes_", 0) + self.max_indexes:
+                    self.indexes_[observed] = index
+        return index
+
+    def _get_prebuilt_observed(self) -> list:
+        """Observed-column tuples of the configured prebuilt_patterns."""
+        if self.prebuilt_patterns is None:
+            return []
+        if self.prebuilt_patterns == "single_missing":
+            missing_patterns = [[column] for column in range(self.n_features_in_)]
+        else:
+            column_positions = {name: position for position, name in enumerate(getattr(self, "feature_names_in_", []))}
+            missing_patterns = [[column_positions.get(column, column) for column in pattern] for pattern in self.prebuilt_patterns]
+        observed = []
+        for pattern in missing_patterns:
+            unknown = [column for column in pattern if not isinstance(column, (int, np.integer)) or not 0 <= column < self.n_features_in_]
+            if unknown:
+                raise Exception(f"prebuilt_patterns refers to unknown columns: {unknown}")
+            observed.append(tuple(sorted(set(range(self.n_features_in_)) - set(pattern))))
+        return [columns for columns in observed if columns]
+
+    def _query_neighbors(self, queries: np.ndarray, observed: tuple, n_neighbors: int):
+        index = self._get_index(observed, len(queries))
+        if index is not None:
+            return index.query(queries, k=n_neighbors)
+
+        # too few rows to pay for building an index, compare against the training rows directly
+        candidates = self.fit_X_[:, list(observed)]
+        if self._exact_in_float32(queries, candidates):
+            squared_distances = self._integer_squared_distances(queries.astype(np.float32), candidates.astype(np.float32))
+        else:
+            squared_distances = euclidean_distances(queries, candidates, squared=True)
+        neighbors = np.argpartition(squared_distances, n_neighbors - 1, axis=1)[:, :n_neighbors]
+        distances = np.sqrt(np.take_along_axis(squared_distances, neighbors, axis=1))
+        return distances, neighbors
+
+    @staticmethod
+    def _exact_in_float32(queries: np.ndarray, candidates: np.ndarray) -> bool:
+        if not np.issubdtype(candidates.dtype, np.integer) or not np.all(queries == np.round(queries)):
+            return False
+        # every term of the expansion below is bounded by n_features * largest_value^2
+        largest_value = max(float(np.abs(queries).max(initial=0)), float(np.iinfo(candidates.dtype).max + 1))
+        return 4 * candidates.shape[1] * largest_value ** 2 < EXACT_FLOAT32_MAX_SQUARED_DISTANCE
+
+    @staticmethod
+    def _integer_squared_distances(queries: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        # |q|^2 - 2 q.c + |c|^2 has no rounding error for small integers, so float32 BLAS gives exact distances
+        squared_distances = queries @ candidates.T
+        squared_distances *= -2
+        squared_distances += np.einsum("ij,ij->i", queries, queries)[:, None]
+        squared_distances += np.einsum("ij,ij->i", candidates, candidates)[None, :]
+        return squared_distances
+
+    def _get_lock(self):
+        if getattr(self, "_lock", None) is None:
+            self._lock = threading.Lock()
+        return self._lock
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_lock", None)
+        return state
+
+    def fit(self, X, y=None):
+        try:
+            if self.algorithm not in NEIGHBOR_INDEXES:
+                raise Exception(f"Unsupported neighbor index: {self.algorithm}. Supported indexes: {list(NEIGHBOR_INDEXES)}")
+            if hasattr(X, "columns"):
+                self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+            X = self._to_array(X)
+            self.n_features_in_ = X.shape[1]
+
+            missing_mask = np.isnan(X)
+            self.fit_X_ = X[~missing_mask.any(axis=1)]
+            compact_dtype = smallest_integer_dtype(self.fit_X_) if self.compact else None
+            if compact_dtype is not None:
+                self.fit_X_ = self.fit_X_.astype(compact_dtype)
+            with np.errstate(invalid="ignore"):
+                self.statistics_ = np.nan_to_num(np.nanmean(X, axis=0), nan=0.0)
+
+            self.indexes_ = {}
+            if len(self.fit_X_):
+                for observed in self._get_prebuilt_observed():
+                    self.indexes_[observed] = self._build_index(observed)
+                n_configured = len(self.indexes_)
+                patterns, counts = np.unique(missing_mask[missing_mask.any(axis=1)], axis=0, return_counts=True)
+                for pattern_id in np.argsort(-counts):
+                    observed = tuple(int(column) for column in np.flatnonzero(~patterns[pattern_id]))
+                    if len(self.indexes_) - n_configured >= self.max_indexes or counts[pattern_id] < self.index_min_rows:
+                        break
+                    if observed and observed not in self.indexes_:
+                        self.indexes_[observed] = self._build_index(observed)
+            self.n_prebuilt_indexes_ = len(self.indexes_)
+            logging.info(f"NeighborIndexImputer fitted on {len(self.fit_X_)} complete rows with {len(self.indexes_)} prebuilt indexes")
+            return self
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def transform(self, X):
+        try:
+            check_is_fitted(self, "fit_X_")
+            X = self._check_feature_names(X)
+            if getattr(self, "compact", False) and self._is_nan_free_integer(X):
+                return np.asarray(X)
+            X = self._to_array(X)
+            missing_mask = np.isnan(X)
+            rows_with_missing = np.flatnonzero(missing_mask.any(axis=1))
+            if not len(rows_with_missing):
+                return X
+
+            patterns, pattern_ids = np.unique(missing_mask[rows_with_missing], axis=0, return_inverse=True)
+            for pattern_id, pattern in enumerate(patterns):
+                rows = rows_with_missing[pattern_ids.ravel() == pattern_id]
+                missing_columns = np.flatnonzero(pattern)
+                observed = tuple(np.flatnonzero(~pattern))
+
+                if not observed or not len(self.fit_X_):
+                    X[np.ix_(rows, missing_columns)] = self.statistics_[missing_columns]
+                    continue
+
+                n_neighbors = min(self.n_neighbors, len(self.fit_X_))
+                distances, neighbors = self._query_neighbors(X[np.ix_(rows, list(observed))], observed, n_neighbors)
+                neighbor_values = self.fit_X_[:, missing_columns][neighbors]
+
+                if self.weights == "distance":
+                    with np.errstate(divide="ignore"):
+                        neighbor_weights = 1.0 / distances
+                    # exact matches take all the weight, as in KNNImputer
+                    exact_match = np.isinf(neighbor_weights)
+                    neighbor_weights = np.where(exact_match.any(axis=1, keepdims=True), exact_match.astype(np.float64), neighbor_weights)
+                    X[np.ix_(rows, missing_columns)] = np.einsum("rk,rkc->rc", neighbor_weights, neighbor_values) / neighbor_weights.sum(axis=1, keepdims=True)
+                else:
+                    X[np.ix_(rows, missing_columns)] = neighbor_values.mean(axis=1)
+            return X
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
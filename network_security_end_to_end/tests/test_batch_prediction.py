@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+from sklearn.tree import DecisionTreeClassifier
+
+from networksecurity.constants.training_pipeline import TARGET_COLUMN
+from networksecurity.pipeline import batch_prediction
+from networksecurity.utils.main_utils.utils import read_yaml_file
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+from networksecurity.utils.ml_utils.preprocessing.imputer import NeighborIndexImputer
+
+SCHEMA_FILE_PATH = os.path.join(os.path.dirname(__file__), "..", "data-schema", "schema.yaml")
+
+
+@pytest.fixture
+def features():
+    columns = [column for column in read_yaml_file(SCHEMA_FILE_PATH)["COLUMNS"] if column != TARGET_COLUMN]
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.choice([-1, 0, 1], size=(200, len(columns))), columns=columns)
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet", "feather"])
+def test_scores_shard_with_missing_and_out_of_range_values(features, tmp_path, monkeypatch, output_format):
+    preprocessor = Pipeline(steps=[("imputer", NeighborIndexImputer())]).fit(features)
+    model = DecisionTreeClassifier(random_state=0).fit(features.to_numpy(), features.iloc[:, 0] > 0)
+    monkeypatch.setattr(batch_prediction, "_worker_model", NetworkModel(preprocessor=preprocessor, model=model))
+
+    shard = features.head(20).astype(np.float64)
+    shard.iloc[0, 0] = np.nan
+    shard.iloc[1, 1] = 300
+    input_file_path = str(tmp_path / "input.csv")
+    shard.to_csv(input_file_path, index=False)
+
+    result = batch_prediction._score_shard(0, {"source": "file", "file_path": input_file_path}, str(tmp_path / "out"), output_format, chunk_size=8)
+
+    assert result["rows"] == len(shard)
+    output = pd.concat([pd.read_csv(path) if output_format == "csv" else getattr(pd, f"read_{output_format}")(path)
+                        for path in result["output_file_paths"]], ignore_index=True)
+    assert np.isnan(output.iloc[0, 0]) and output.iloc[1, 1] == 300
+    assert output["predicted_column"].notna().all()
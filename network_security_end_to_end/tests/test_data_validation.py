@@ -0,0 +1,36 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from networksecurity.components.data_validation import DataValidation
+from networksecurity.utils.main_utils.schema_validator import SchemaValidator
+
+PROJECT_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+
+@pytest.fixture
+def schema_validator(monkeypatch):
+    # the schema is read from data-schema/ relative to the project directory
+    monkeypatch.chdir(PROJECT_DIR)
+    return SchemaValidator.from_schema_file()
+
+
+def test_csv_with_bad_values_is_reported_not_raised(schema_validator, tmp_path):
+    rng = np.random.default_rng(0)
+    dataframe = pd.DataFrame(rng.choice([-1, 1], size=(10, len(schema_validator.columns))), columns=schema_validator.columns).astype(object)
+    column = schema_validator.columns[0]
+    dataframe.loc[0, column] = "abc"
+    dataframe.loc[1, column] = 1.5
+    file_path = str(tmp_path / "train.csv")
+    dataframe.to_csv(file_path, index=False)
+
+    with pytest.raises(Exception):
+        DataValidation.read_data(file_path)
+
+    report = schema_validator.validate_dataframe(DataValidation.read_data(file_path, apply_dtypes=False))
+    assert report["columns"][column]["non_numeric_count"] == 1
+    assert report["columns"][column]["non_integer_count"] == 1
+    assert report["columns"][column]["null_count"] == 0
+    assert not report["status"]
@@ -0,0 +1,94 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.impute import KNNImputer
+
+from networksecurity.utils.ml_utils.preprocessing.imputer import NeighborIndexImputer
+
+N_NEIGHBORS = 3
+
+
+@pytest.fixture(scope="module")
+def train():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(rng.choice([-1, 0, 1], size=(2000, 8)), columns=[f"f{i}" for i in range(8)])
+
+
+@pytest.fixture(scope="module")
+def queries(train):
+    rng = np.random.default_rng(1)
+    values = rng.choice([-1, 0, 1], size=(300, train.shape[1])).astype(np.float64)
+    # mostly one missing feature, as in serving traffic, plus a few rows missing two or none
+    values[np.arange(250), rng.integers(0, train.shape[1], size=250)] = np.nan
+    values[np.arange(250, 280), 0] = np.nan
+    values[np.arange(250, 280), 1] = np.nan
+    return pd.DataFrame(values, columns=train.columns)
+
+
+def assert_matches_knn_imputer(imputed: np.ndarray, train: pd.DataFrame, queries: pd.DataFrame):
+    """
+    Every imputed value must be the neighbor mean KNNImputer computes, except that training rows
+    tied at the k-th distance may be picked in a different order: then the value only has to lie
+    between the means of the smallest and the largest tied values that could have been picked.
+    """
+    fit_X, expected = train.to_numpy(np.float64), KNNImputer(n_neighbors=N_NEIGHBORS).fit(train).transform(queries)
+    for row, imputed_row, expected_row in zip(queries.to_numpy(), imputed, expected):
+        missing = np.isnan(row)
+        if not missing.any():
+            np.testing.assert_array_equal(imputed_row, row)
+            continue
+        distances = ((fit_X[:, ~missing] - row[~missing]) ** 2).sum(axis=1)
+        kth_distance = np.sort(distances)[N_NEIGHBORS - 1]
+        closer = fit_X[distances < kth_distance][:, missing]
+        tied = np.sort(fit_X[distances == kth_distance][:, missing], axis=0)
+        n_tied = N_NEIGHBORS - len(closer)
+        if n_tied == len(tied):
+            np.testing.assert_allclose(imputed_row, expected_row)
+            continue
+        low = (closer.sum(axis=0) + tied[:n_tied].sum(axis=0)) / N_NEIGHBORS
+        high = (closer.sum(axis=0) + tied[-n_tied:].sum(axis=0)) / N_NEIGHBORS
+        assert np.all((imputed_row[missing] >= low - 1e-9) & (imputed_row[missing] <= high + 1e-9))
+
+
+@pytest.mark.parametrize("algorithm", ["ball_tree", "kd_tree"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_matches_knn_imputer_row_by_row(train, queries, algorithm, compact):
+    # one row at a time, as /predict sends them: single-feature patterns use the prebuilt indexes
+    imputer = NeighborIndexImputer(n_neighbors=N_NEIGHBORS, algorithm=algorithm, prebuilt_patterns="single_missing",
+                                   compact=compact).fit(train)
+    imputed = np.vstack([imputer.transform(queries.iloc[[i]]) for i in range(len(queries))])
+    assert_matches_knn_imputer(imputed, train, queries)
+
+
+def test_matches_knn_imputer_in_batch(train, queries):
+    # index_min_rows=1 builds an index for the two-feature pattern too; prebuilt_patterns=None brute-forces the rest
+    for imputer in (NeighborIndexImputer(n_neighbors=N_NEIGHBORS, index_min_rows=1),
+                    NeighborIndexImputer(n_neighbors=N_NEIGHBORS, prebuilt_patterns=None, index_min_rows=10_000)):
+        assert_matches_knn_imputer(imputer.fit(train).transform(queries), train, queries)
+
+
+def test_prebuilds_single_missing_indexes_from_complete_training_data(train):
+    assert NeighborIndexImputer().fit(train).indexes_ == {}
+    imputer = NeighborIndexImputer(prebuilt_patterns="single_missing").fit(train)
+    assert len(imputer.indexes_) == train.shape[1]
+    restored = pickle.loads(pickle.dumps(imputer))
+    assert set(restored.indexes_) == {tuple(c for c in range(train.shape[1]) if c != missing) for missing in range(train.shape[1])}
+
+
+def test_prebuilt_patterns_by_column_name(train):
+    imputer = NeighborIndexImputer(prebuilt_patterns=[["f0"], ["f1", "f2"]]).fit(train)
+    assert set(imputer.indexes_) == {tuple(range(1, 8)), (0,) + tuple(range(3, 8))}
+    with pytest.raises(Exception):
+        NeighborIndexImputer(prebuilt_patterns=[["unknown"]]).fit(train)
+
+
+def test_reordered_columns_are_matched_by_name(train, queries):
+    imputer = NeighborIndexImputer(n_neighbors=N_NEIGHBORS).fit(train)
+    reordered = queries[list(reversed(queries.columns))]
+    np.testing.assert_array_equal(imputer.transform(reordered), imputer.transform(queries))
+    with pytest.raises(Exception):
+        imputer.transform(queries.rename(columns={"f0": "unknown"}))
+    with pytest.raises(Exception):
+        imputer.transform(queries.drop(columns=["f0"]))
@@ -0,0 +1,32 @@
+import pandas as pd
+import pytest
+
+import push_data
+from push_data import NetworkDataExtract
+
+mongomock = pytest.importorskip("mongomock")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(push_data, "get_mongo_client", lambda: client)
+    return client
+
+
+def test_consecutive_loads_get_increasing_ids(client, tmp_path):
+    file_path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": range(25), "b": range(25)}).to_csv(file_path, index=False)
+
+    collection = client["db"]["collection"]
+    loads = []
+    for _ in range(2):
+        loaded_before = {document["_id"] for document in collection.find({}, {"_id": 1})}
+        NetworkDataExtract().load_csv_to_mongodb(file_path, "db", "collection", batch_size=10, max_workers=2)
+        loads.append([document["_id"] for document in collection.find().sort("a", 1) if document["_id"] not in loaded_before])
+
+    first_load, second_load = loads
+    assert len(first_load) == len(second_load) == 25
+    # ids follow row order within a load, and a later load sorts after everything already in the collection
+    assert first_load == sorted(first_load) and second_load == sorted(second_load)
+    assert max(first_load) < min(second_load)
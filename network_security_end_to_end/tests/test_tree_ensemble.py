@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import ExtraTreesClassifier, GradientBoostingClassifier, RandomForestClassifier
+from sklearn.preprocessing import FunctionTransformer
+from sklearn.tree import DecisionTreeClassifier
+
+from networksecurity.constants.training_pipeline import COMPILED_BACKEND_MIN_SPEEDUP
+from networksecurity.utils.ml_utils.model.estimator import NetworkModel
+from networksecurity.utils.ml_utils.model.tree_ensemble import CompiledTreeEnsemble
+
+
+def make_data(n_classes: int):
+    x, y = make_classification(n_samples=1500, n_features=12, n_informative=6, n_classes=n_classes, random_state=0)
+    # a mix of the {-1, 0, 1} features the pipeline serves and continuous ones, with labels like the target column
+    x[:, :6] = np.round(np.clip(x[:, :6], -1, 1))
+    y = np.array([-1, 1, 2])[y]
+    return x[:1000], y[:1000], x[1000:]
+
+
+MODELS = {
+    "decision_tree": lambda: DecisionTreeClassifier(max_depth=8, random_state=0),
+    "random_forest": lambda: RandomForestClassifier(n_estimators=30, random_state=0),
+    "extra_trees": lambda: ExtraTreesClassifier(n_estimators=30, random_state=0),
+    "gradient_boosting": lambda: GradientBoostingClassifier(n_estimators=30, random_state=0),
+    "gradient_boosting_zero_init": lambda: GradientBoostingClassifier(n_estimators=30, init="zero", random_state=0),
+}
+
+
+@pytest.mark.parametrize("n_classes", [2, 3])
+@pytest.mark.parametrize("name", list(MODELS))
+def test_matches_sklearn(name, n_classes):
+    x_train, y_train, x_test = make_data(n_classes)
+    model = MODELS[name]().fit(x_train, y_train)
+    compiled = CompiledTreeEnsemble(model)
+
+    for x in (x_test, x_test[:1], x_train[:64]):
+        np.testing.assert_array_equal(compiled.predict(x), model.predict(x))
+        np.testing.assert_allclose(compiled.predict_proba(x), model.predict_proba(x), rtol=1e-12, atol=1e-15)
+    assert compiled.check_parity(model, x_test, repeats=1, min_seconds=0)["mismatches"] == 0
+
+
+def test_compiled_max_rows_is_calibrated_from_batch_timings():
+    x_train, y_train, x_test = make_data(2)
+    model = RandomForestClassifier(n_estimators=30, random_state=0).fit(x_train, y_train)
+    network_model = NetworkModel(preprocessor=FunctionTransformer(), model=model)
+    report = network_model.set_backend("compiled", validation_x=x_test)
+
+    # the cap is the largest timed batch size up to which every size was faster compiled
+    assert network_model.compiled_max_rows == report["compiled_max_rows"] > 0
+    for timing in report["batch_timings"]:
+        faster = timing["compiled_seconds"] * COMPILED_BACKEND_MIN_SPEEDUP <= timing["sklearn_seconds"]
+        assert faster == (timing["rows"] <= report["compiled_max_rows"])
+
+    never_faster = CompiledTreeEnsemble(model).check_parity(model, x_test, repeats=1, min_seconds=0, min_speedup=np.inf)
+    assert never_faster["compiled_max_rows"] == 0 and never_faster["batch_speedup"] is None